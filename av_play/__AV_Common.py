@@ -1,9 +1,8 @@
 from enum import Enum, auto
-from typing import Union, Any
-from dataclasses import dataclass
-from pathlib import Path
-from urllib.parse import urlparse
-from validators import url, ValidationError
+from typing import Union, Any, Mapping
+from dataclasses import dataclass, field
+
+from .__validators import is_url, is_path
 
 
 ParameterValue = Union[int, float, bool, str]
@@ -11,6 +10,9 @@ formats:dict[str, list[str]] = {
        "audio": ["mp1", "mp2", "mp3", "ogg", "wav", "m4a", "aac", "flac", "wma", "aif", "wv"],
        "video": ["flv", "rm", "3gp", "mp4", "mkv", "mov", "wmv", "mpeg", "avi", "webm"]
 }
+_AUDIO_EXTS: frozenset[str] = frozenset(formats["audio"])
+_VIDEO_EXTS: frozenset[str] = frozenset(formats["video"])
+_ALL_EXTS: frozenset[str] = _AUDIO_EXTS | _VIDEO_EXTS
 
 format_descriptions: dict[str, dict[str, str]] = {
     "audio": {
@@ -39,6 +41,7 @@ format_descriptions: dict[str, dict[str, str]] = {
         "webm": "WebM Video Format (VP8/VP9/AV1 Video, Vorbis/Opus Audio)"
     }
 }
+_DESC: dict[str, str] = {ext: desc for sub in format_descriptions.values() for ext, desc in sub.items()}
 
 class AVErrorInfo(Enum):
       UNKNOWN_ERROR = -1
@@ -98,6 +101,16 @@ class AVDevice:
         media_backend:AVMediaBackend
         name: str
 
+@dataclass(slots=True)
+class AVConfig:
+        max_channels: int | None = None
+        window: Any = None
+        ytdl_path: str | None = None
+        vlc_args: list[str] | None = None
+        extras: dict[str, Any] = field(default_factory=dict)
+
+_AV_CONFIG_FIELDS: frozenset[str] = frozenset(("max_channels", "window", "ytdl_path", "vlc_args"))
+
 
 class AVError(Exception):
       
@@ -110,85 +123,60 @@ class AVError(Exception):
 AVFilterType = AVMediaType
 
 class AVFilter:
+    __slots__ = ("_type", "_backend", "_handle", "_parameters", "_info")
     
     def __init__(self, filter_type: AVFilterType, media_backend: AVMediaBackend,
-                 filter_handle: str, parameters: dict[str, ParameterValue], backend_additional_info: dict[Any, Any]):
-        self.__type = filter_type
-        self.__backend:AVMediaBackend = media_backend
-        self.__handle:str = filter_handle
-        self.__parameters:dict[str, ParameterValue] = parameters
-        self.__info:dict[Any, Any] = backend_additional_info
+                 filter_handle: str, parameters: Mapping[str, ParameterValue], backend_additional_info: dict[Any, Any]):
+        self._type = filter_type
+        self._backend:AVMediaBackend = media_backend
+        self._handle:str = filter_handle
+        # May be a shared read-only defaults mapping, copied on the first write.
+        self._parameters:Mapping[str, ParameterValue] = parameters
+        self._info:dict[Any, Any] = backend_additional_info
 
 
     @property
     def type(self):
-           return self.__type
+           return self._type
 
     @property
     def backend(self):
-           return self.__backend
+           return self._backend
 
     @property
     def handle(self):
-           return self.__handle
+           return self._handle
 
     @property
     def info(self):
-           return self.__info
+           return self._info
 
 
 
     def get_parameters(self):
-            return self.__parameters
+            return self._parameters
 
     def set_parameters(self, parameters: dict[str, ParameterValue] = {}):
-            self.__parameters.update(parameters)
+            if parameters:
+                    self._writable_parameters().update(parameters)
 
     def get_parameter(self, name: str) -> ParameterValue | None:
-        if self.__parameters.__contains__(name):
-           return self.__parameters[name]
-        return None
+        return self._parameters.get(name)
 
     def set_parameter(self, name: str, value: ParameterValue):
-            if name in self.__parameters:
-                    self.__parameters[name] = value
-
-
-def is_url(url_string: str, default_scheme: str = "https") -> bool:
-    if not isinstance(url_string, str):
-        return False
-    original_trimmed = url_string.strip()
-    if not original_trimmed:
-        return False
-
-    if default_scheme not in ("http", "https"):
-        default_scheme = "https"
-    url_to_validate = original_trimmed
-    parsed = urlparse(original_trimmed)
-    if not parsed.scheme:
-        if original_trimmed.startswith('//'):
-            url_to_validate = f"{default_scheme}:{original_trimmed}"
-        else:
-            potential_host = parsed.path.split('/')[0]
-            if '.' in original_trimmed or 'localhost' in potential_host.lower():
-                 url_to_validate = f"{default_scheme}://{original_trimmed}"
-            else:
-                 return False
-
-    try:
-        result = url(url_to_validate)
-        return bool(result)
-    except ValidationError:
-        return False
-    except Exception:
-        return False
-       
-
-def is_path(path_str:str) -> bool:
-    if not isinstance(path_str, str) or path_str == "":
-        return False
-    try:
-        path = Path(path_str)
-        return True
-    except:
-          return False
+            if name in self._parameters:
+                    self._writable_parameters()[name] = value
+
+    def _writable_parameters(self) -> dict[str, ParameterValue]:
+        parameters = self._parameters
+        if type(parameters) is not dict:
+            parameters = self._parameters = dict(parameters)
+        return parameters
+
+
+def is_supported_ext(ext: str) -> bool:
+    return ext.lower().lstrip('.') in _ALL_EXTS
+
+
+def format_description(ext: str) -> str | None:
+    return _DESC.get(ext.lower().lstrip('.'))
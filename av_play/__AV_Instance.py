@@ -1,10 +1,11 @@
-import random
+import itertools
 import os
 
 from .media_info import MediaInfo
 from .__AV_Interface import AVMediaInterface
 from .__AV_Common import *
 
+_ID_COUNTER = itertools.count(1_000_000)
 
 class AVMediaInstance:
 
@@ -15,8 +16,14 @@ class AVMediaInstance:
         self.__media_backend = self.__controler.backend
         self.__media_source:AVMediaSource = AVMediaSource.AV_SRC_NOT_SET
         self.__file_path = file_path
-        self.__id:int = random.randint(1000000, 9999999)
-        self.__filters:dict[int, AVFilter] = {}
+        self.__id:int = next(_ID_COUNTER)
+        self.__filter_ids:list[int] = []
+        self.__filter_objs:list[AVFilter] = []
+        self.__filter_id_pos:dict[int, int] = {}
+        self.__cached_length:int|None = None
+        self.__file_stat:os.stat_result|None = None
+        self.__last_state:AVPlaybackState = AVPlaybackState.AV_STATE_NOTHING
+        self.__released = False
 
 
     @property
@@ -39,30 +46,53 @@ class AVMediaInstance:
     def file_path(self):
         return self.__file_path
 
+    @property
+    def file_stat(self):
+        return self.__file_stat
+
 
     # Media control methods
     def load_file(self, file_path:str):
         #if self.get_playback_state() == AVPlaybackState.AV_STATE_PLAYING:
             #self.stop()
-        if file_path != "" and is_path(file_path) and os.path.exists(file_path):
-            self.__file_path = file_path
-            self.__controler.load_file(self.__id, file_path)
+        if file_path.startswith(("http://", "https://")):
+            self.load_url(file_path)
+            return
+        if file_path == "" or not is_path(file_path):
+            return
+        try:
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
+            return
+        self.__file_stat = file_stat
+        self.__file_path = file_path
+        self.__cached_length = None
+        self.__controler.load_file(self.__id, file_path)
+        self.__last_state = AVPlaybackState.AV_STATE_STOPPED
+        self.__released = False
 
     def load_url(self, url:str):
-        if self.get_playback_state() == AVPlaybackState.AV_STATE_PLAYING:
+        if self.__last_state is AVPlaybackState.AV_STATE_PLAYING:
             self.stop()
         if url != "" and is_url(url):
             self.__file_path = url
+            self.__file_stat = None
+            self.__cached_length = None
             self.__controler.load_url(self.__id, url)
+            self.__last_state = AVPlaybackState.AV_STATE_STOPPED
+            self.__released = False
 
     def play(self):
         self.__controler.play(self.__id)
+        self.__last_state = AVPlaybackState.AV_STATE_PLAYING
 
     def pause(self):
         self.__controler.pause(self.__id)
+        self.__last_state = AVPlaybackState.AV_STATE_PAUSED
 
     def stop(self):
         self.__controler.stop(self.__id)
+        self.__last_state = AVPlaybackState.AV_STATE_STOPPED
 
     def mute(self):
         self.__controler.mute(self.__id)
@@ -80,7 +110,13 @@ class AVMediaInstance:
         self.__controler.set_loop(self.__id, loop)
 
     def get_length(self) -> int:
-        return self.__controler.get_length(self.__id, )
+        # The length of a loaded track never changes, so keep the first valid answer.
+        if self.__cached_length is not None:
+            return self.__cached_length
+        length = self.__controler.get_length(self.__id, )
+        if length > 0:
+            self.__cached_length = length
+        return length
 
     def get_position(self) -> int:
         return self.__controler.get_position(self.__id, )
@@ -89,62 +125,76 @@ class AVMediaInstance:
         return self.__controler.get_volume(self.__id, )
 
     def get_playback_state(self) -> AVPlaybackState:
-        return self.__controler.get_play_state(self.__id, )
+        self.__last_state = self.__controler.get_play_state(self.__id, )
+        return self.__last_state
 
     def get_mute_state(self) -> AVMuteState:
         return self.__controler.get_mute_state(self.__id, )
 
     # Effects/filters
     def apply_filter(self, filter:AVFilter) -> int:
-        if filter.type != self.media_type and filter.backend != self.media_backend:
+        if filter.type is not self.media_type and filter.backend is not self.media_backend:
             return -1
-        filter_id = random.randint(1000000, 9999999)
-        self.__filters[filter_id] = filter
+        filter_id = next(_ID_COUNTER)
+        self.__filter_id_pos[filter_id] = len(self.__filter_ids)
+        self.__filter_ids.append(filter_id)
+        self.__filter_objs.append(filter)
         self.__controler.apply_filter(self.__id, filter_id, filter)
         return filter_id
 
     def remove_filter(self, filter_id:int):
-        if filter_id in self.__filters:
-            self.__filters.pop(filter_id)
+        pos = self.__filter_id_pos.pop(filter_id, None)
+        if pos is not None:
+            last_id = self.__filter_ids.pop()
+            last_filter = self.__filter_objs.pop()
+            if pos < len(self.__filter_ids):
+                self.__filter_ids[pos] = last_id
+                self.__filter_objs[pos] = last_filter
+                self.__filter_id_pos[last_id] = pos
             self.__controler.remove_filter(self.__id, filter_id )
 
     def remove_filters(self):
 
-        for filter_id in list(self.__filters.keys()):
+        for filter_id in self.__filter_ids:
             try:
-                self.remove_filter(filter_id)
-            except:
-                if filter_id in self.__filters:
-                    self.__filters.pop(filter_id)
+                self.__controler.remove_filter(self.__id, filter_id)
+            except Exception:
+                pass
+        self.__filter_ids.clear()
+        self.__filter_objs.clear()
+        self.__filter_id_pos.clear()
 
     def set_parameter(self, filter_id:int, parameter_name:str, parameter_value:ParameterValue):
-        if filter_id in self.__filters and parameter_name in self.__filters[filter_id].get_parameters():
+        pos = self.__filter_id_pos.get(filter_id)
+        if pos is not None and parameter_name in self.__filter_objs[pos].get_parameters():
             self.__controler.set_parameter(self.__id, filter_id, parameter_name, parameter_value)
 
     def get_parameter(self, filter_id:int, parameter_name:str) -> ParameterValue | None:
-        if filter_id in self.__filters and parameter_name in self.__filters[filter_id].get_parameters():
+        pos = self.__filter_id_pos.get(filter_id)
+        if pos is not None and parameter_name in self.__filter_objs[pos].get_parameters():
             return self.__controler.get_parameter(self.__id, filter_id, parameter_name)
         return None
 
     def release(self):
+        if self.__released:
+            return
+        self.__released = True
 
+        # Use the last known state instead of querying a backend that may already be tearing down.
         try:
-            if self.get_playback_state() == AVPlaybackState.AV_STATE_PLAYING:
+            if self.__last_state not in (AVPlaybackState.AV_STATE_STOPPED, AVPlaybackState.AV_STATE_NOTHING):
                 self.stop()
-        except:
+        except Exception:
             pass
-        
 
-        try:
+        if self.__filter_ids:
             self.remove_filters()
-        except:
-            pass
-        
 
         try:
             self.__controler.release(self.__id)
-        except:
+        except Exception:
             pass
+        self.__last_state = AVPlaybackState.AV_STATE_NOTHING
 
     def media_info(self) -> Any:
         return MediaInfo(self.__file_path)
@@ -4,7 +4,7 @@ from .__AV_Common import *
 
 
 class AVMediaInterface(ABC):
-
+    __slots__ = ("__backend", "__type", "__devices", "__instances", "__effects")
 
     def __init__(self, media_type: AVMediaType, media_backend: AVMediaBackend) -> None:
         super().__init__()
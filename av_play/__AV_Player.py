@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
 from .__AV_Common import *
+from .__AV_Common import _AV_CONFIG_FIELDS
 from .__AV_Instance import AVMediaInstance
 from .__AV_Interface import AVMediaInterface
 from .playlist import Playlist
 import threading
-import time
 import random
-from typing import List, Optional, Callable
+import os
+from typing import Optional, Callable
+
+
+MONITOR_POLL_INTERVAL = 0.1
+MONITOR_MAX_WAIT = 2.0
 
 
 class AVPlayer(ABC):
@@ -17,7 +22,7 @@ class AVPlayer(ABC):
         self._media_type = media_type
         self._media_backend = media_backend
         self._controler = interface
-        self._config:dict[str, Any] = {}
+        self._config:AVConfig = AVConfig()
         self._primary_instance:AVMediaInstance|None = None
         self._current_playlist:Playlist|None = None
         self._current_playlist_index = -1
@@ -28,8 +33,12 @@ class AVPlayer(ABC):
         self._playlist_state = AVPlaylistState.STOPPED
         self._monitor_thread:threading.Thread|None = None
         self._monitor_running = False
-        self._shuffle_order:List[int] = []
+        self._monitor_wake = threading.Event()
+        self._shuffle_state:dict[int, int] = {}
+        self._shuffle_drawn = 0
+        self._shuffle_cursor = -1
         self._track_end_callback:Optional[Callable[[int], None]] = None
+        self._source_kinds:dict[str, AVMediaSource] = {}
 
 
     @property
@@ -64,25 +73,25 @@ class AVPlayer(ABC):
         return instance
 
     def set_config_value(self, name:str, value:Any):
-        self._config[name] = value
+        if name in _AV_CONFIG_FIELDS:
+            setattr(self._config, name, value)
+        else:
+            self._config.extras[name] = value
 
     def get_config(self, name) -> Any:
-        if name in self._config:
-            return self._config[name]
-        return None
+        if name in _AV_CONFIG_FIELDS:
+            return getattr(self._config, name)
+        return self._config.extras.get(name)
 
     def load_playlist(self, playlist:Playlist, auto_play:bool = False, mode:AVPlaylistMode = AVPlaylistMode.SEQUENTIAL):
         """Load playlist with optional auto-play functionality"""
         if playlist is not None:
             self._current_playlist = playlist
+            self._source_kinds.clear()
             self._auto_play_enabled = auto_play
             self._playlist_mode = mode
             self._playlist_state = AVPlaylistState.STOPPED
 
-
-            if mode == AVPlaylistMode.SHUFFLE:
-                self._generate_shuffle_order()
-
             if self._primary_instance is not None:
                 self._primary_instance.stop()
             else:
@@ -90,6 +99,8 @@ class AVPlayer(ABC):
                 
             if len(playlist) > 0:
                 self._current_playlist_index = 0
+                if mode is AVPlaylistMode.SHUFFLE:
+                    self._generate_shuffle_order()
                 self._play_playlist_track()
                 
 
@@ -99,7 +110,7 @@ class AVPlayer(ABC):
     def set_playlist_mode(self, mode:AVPlaylistMode):
         """Change playlist playback mode"""
         self._playlist_mode = mode
-        if mode == AVPlaylistMode.SHUFFLE:
+        if mode is AVPlaylistMode.SHUFFLE:
             self._generate_shuffle_order()
 
     def set_auto_play(self, enabled:bool):
@@ -131,15 +142,16 @@ class AVPlayer(ABC):
         return self._current_playlist_index
 
     def previous(self):
-        if self._current_playlist is not None and len(self._current_playlist) > 0:
-            if self._playlist_mode == AVPlaylistMode.SHUFFLE:
+        playlist = self._current_playlist
+        if playlist is not None and len(playlist) > 0:
+            if self._playlist_mode is AVPlaylistMode.SHUFFLE:
 
-                current_shuffle_pos = self._shuffle_order.index(self._current_playlist_index)
-                current_shuffle_pos = max(0, current_shuffle_pos - 1)
-                self._current_playlist_index = self._shuffle_order[current_shuffle_pos]
+                self._shuffle_cursor = max(0, self._shuffle_cursor - 1)
+                self._current_playlist_index = self._shuffle_index_at(self._shuffle_cursor, len(playlist))
             else:
                 self._current_playlist_index = max(0, self._current_playlist_index - 1)
             self._play_playlist_track()
+            self._monitor_wake.set()
 
     def next(self):
         if self._current_playlist is not None and len(self._current_playlist) > 0:
@@ -157,6 +169,7 @@ class AVPlayer(ABC):
         if self._primary_instance:
             self._primary_instance.pause()
         self._playlist_state = AVPlaylistState.PAUSED
+        self._monitor_wake.set()
 
     def resume_playlist(self):
         """Resume playlist playback"""
@@ -167,71 +180,96 @@ class AVPlayer(ABC):
             self._start_monitor()
 
     def _generate_shuffle_order(self):
-        """Generate random order for shuffle mode"""
-        if self._current_playlist:
-            self._shuffle_order = list(range(len(self._current_playlist)))
-            random.shuffle(self._shuffle_order)
+        """Reset the lazily drawn shuffle order, keeping the current track first"""
+        self._shuffle_state = {}
+        self._shuffle_drawn = 0
+        self._shuffle_cursor = -1
+        if self._current_playlist and 0 <= self._current_playlist_index < len(self._current_playlist):
+            self._shuffle_swap(0, self._current_playlist_index)
+            self._shuffle_drawn = 1
+            self._shuffle_cursor = 0
+
+    def _shuffle_swap(self, a:int, b:int):
+        state = self._shuffle_state
+        value_a = state.get(a, a)
+        state[a] = state.get(b, b)
+        state[b] = value_a
+
+    def _shuffle_index_at(self, position:int, playlist_len:int) -> int:
+        """Get the track index at a shuffle position, drawing the next tracks if needed"""
+        # Fisher-Yates on demand: only swapped slots are stored, untouched positions map to themselves.
+        while self._shuffle_drawn <= position:
+            self._shuffle_swap(self._shuffle_drawn, random.randrange(self._shuffle_drawn, playlist_len))
+            self._shuffle_drawn += 1
+        return self._shuffle_state.get(position, position)
 
     def _advance_track(self):
         """Advance to next track based on current mode"""
-        if not self._current_playlist or len(self._current_playlist) == 0:
+        playlist = self._current_playlist
+        if not playlist:
+            return
+        playlist_len = len(playlist)
+        if playlist_len == 0:
             return
+        mode = self._playlist_mode
 
-        if self._playlist_mode == AVPlaylistMode.REPEAT_ONE:
+        if mode is AVPlaylistMode.REPEAT_ONE:
 
             pass
-        elif self._playlist_mode == AVPlaylistMode.SHUFFLE:
-
-            try:
-                current_shuffle_pos = self._shuffle_order.index(self._current_playlist_index)
-                current_shuffle_pos += 1
-                if current_shuffle_pos >= len(self._shuffle_order):
-                    if self._playlist_mode == AVPlaylistMode.REPEAT_ALL:
-                        current_shuffle_pos = 0
-                    else:
-                        self._playlist_state = AVPlaylistState.FINISHED
-                        return
-                self._current_playlist_index = self._shuffle_order[current_shuffle_pos]
-            except ValueError:
-                self._current_playlist_index = self._shuffle_order[0] if self._shuffle_order else 0
+        elif mode is AVPlaylistMode.SHUFFLE:
+
+            next_shuffle_pos = self._shuffle_cursor + 1
+            if next_shuffle_pos >= playlist_len:
+                self._playlist_state = AVPlaylistState.FINISHED
+                return
+            self._current_playlist_index = self._shuffle_index_at(next_shuffle_pos, playlist_len)
+            self._shuffle_cursor = next_shuffle_pos
         else:
 
-            self._current_playlist_index += 1
-            if self._current_playlist_index >= len(self._current_playlist):
-                if self._playlist_mode == AVPlaylistMode.REPEAT_ALL:
-                    self._current_playlist_index = 0
+            index = self._current_playlist_index + 1
+            if index >= playlist_len:
+                if mode is AVPlaylistMode.REPEAT_ALL:
+                    index = 0
                 else:
+                    self._current_playlist_index = index
                     self._playlist_state = AVPlaylistState.FINISHED
                     return
+            self._current_playlist_index = index
 
         self._play_playlist_track()
+        self._monitor_wake.set()
 
     def _start_monitor(self):
         """Start background thread to monitor track completion"""
         if not self._monitor_running:
             self._monitor_running = True
+            self._monitor_wake.clear()
             self._monitor_thread = threading.Thread(target=self._monitor_playback, daemon=True)
             self._monitor_thread.start()
 
     def _stop_monitor(self):
         """Stop background monitoring thread"""
         self._monitor_running = False
-        if self._monitor_thread and self._monitor_thread.is_alive():
+        self._monitor_wake.set()
+        if self._monitor_thread and self._monitor_thread.is_alive() and self._monitor_thread is not threading.current_thread():
             self._monitor_thread.join(timeout=1.0)
 
     def _monitor_playback(self):
         """Background thread that monitors track completion"""
         while self._monitor_running and self._auto_play_enabled:
+            timeout = MONITOR_POLL_INTERVAL
             try:
-                if self._primary_instance:
-                    state = self._primary_instance.get_playback_state()
+                instance = self._primary_instance
+                if instance:
+                    state = instance.get_playback_state()
                     
-                    if state == AVPlaybackState.AV_STATE_PLAYING:
+                    if state is AVPlaybackState.AV_STATE_PLAYING:
                         self._playlist_state = AVPlaylistState.PLAYING
                         
 
-                        position = self._primary_instance.get_position()
-                        length = self._primary_instance.get_length()
+                        # Length is memoized per track by the instance; only the position needs a backend call.
+                        length = instance.get_length()
+                        position = instance.get_position() if length > 0 else 0
                         
                         if length > 0 and position >= length - 1:
 
@@ -239,33 +277,46 @@ class AVPlayer(ABC):
                             if self._track_end_callback:
                                 self._track_end_callback(current_track)
                             
-                            time.sleep(0.5)
+                            self._monitor_wake.wait(0.5)
                             self._advance_track()
+                        elif length > 0:
+                            # Sleep until just before the predicted end of the track, the wake event cuts it short on user actions.
+                            timeout = min(max(length - 1 - position, MONITOR_POLL_INTERVAL), MONITOR_MAX_WAIT)
                             
-                    elif state in [AVPlaybackState.AV_STATE_STOPPED, AVPlaybackState.AV_STATE_NOTHING]:
-                        if self._playlist_state == AVPlaylistState.PLAYING:
+                    elif state in (AVPlaybackState.AV_STATE_STOPPED, AVPlaybackState.AV_STATE_NOTHING):
+                        if self._playlist_state is AVPlaylistState.PLAYING:
 
                             self._advance_track()
                 
-                time.sleep(0.1)
-                
             except Exception:
 
-                time.sleep(0.5)
+                timeout = 0.5
+
+            self._monitor_wake.wait(timeout)
+            self._monitor_wake.clear()
 
     def _play_playlist_track(self):
-        if self._primary_instance is None:
-            self._primary_instance = AVMediaInstance(self._controler)
+        instance = self._primary_instance
+        if instance is None:
+            instance = self._primary_instance = AVMediaInstance(self._controler)
         
-        if self._current_playlist and 0 <= self._current_playlist_index < len(self._current_playlist):
-            instance_path = self._current_playlist.entries[self._current_playlist_index].location
-            if is_path(instance_path):
-                self._primary_instance.load_file(instance_path)
-            else:
-                self._primary_instance.load_url(instance_path)
-            self._primary_instance.play()
+        playlist = self._current_playlist
+        index = self._current_playlist_index
+        if playlist and 0 <= index < len(playlist):
+            instance_path = playlist.entries[index].location
+            load = instance.load_url if self._get_source_kind(instance_path) is AVMediaSource.AV_SRC_URL else instance.load_file
+            load(instance_path)
+            instance.play()
             self._playlist_state = AVPlaylistState.PLAYING
 
+    def _get_source_kind(self, location:str) -> AVMediaSource:
+        """Classify a playlist location as a file or URL, once per location"""
+        kind = self._source_kinds.get(location)
+        if kind is None:
+            kind = AVMediaSource.AV_SRC_URL if is_url(location) and not os.path.exists(location) else AVMediaSource.AV_SRC_FILE
+            self._source_kinds[location] = kind
+        return kind
+
 
     @abstractmethod
     def init(self, *args, **kw):
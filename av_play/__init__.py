@@ -1,4 +1,5 @@
 import os
+import importlib
 
 from .media_info import MediaInfo
 from .playlist import *
@@ -16,42 +17,85 @@ fmod_lib_path = os.environ.get("FMOD_LIB_PATH", None)
 mpv_lib_path = os.environ.get("MPV_LIB_PATH", None)
 vlc_lib_path = os.environ.get("VLC_LIB_PATH", None)
 
-if use_fmod:
-    if os.path.exists(fmod_lib_path): # type: ignore
-        os.environ["PYFMODEX_DLL_PATH"] = os.path.abspath(find_lib_path(fmod_lib_path, "fmod")) # type: ignore
+# Backend name: (enabled, library path, player alias, {module: exported names}).
+# Backend modules are only imported (and their native library loaded) on first access of one of their names.
+_BACKENDS: dict[str, tuple[str | None, str | None, str, dict[str, tuple[str, ...]]]] = {
+    "FMOD": (use_fmod, fmod_lib_path, "AudioPlayer", {
+        "fmod_audio_player": ("FMODAudioPlayer",),
+        "fmod_audio_filter": ("FMODAudioFilter", "FMODBandpassFilter", "FMODChorusFilter", "FMODCompressorFilter",
+                              "FMODDistortionFilter", "FMODEchoFilter", "FMODFlangerFilter",
+                              "FMODLowpassFilter", "FMODHighpassFilter", "FMODPitchShiftFilter", "FMODReverbFilter",
+                              "FMODFilterSpec", "get_fmod_filter_spec"),
+    }),
+    "MPV": (use_mpv, mpv_lib_path, "VideoPlayer", {
+        "mpv_video_player": ("MPVVideoPlayer",),
+        "mpv_audio_filter": ("MPVAudioFilter", "MPVBandPassFilter", "MPVChorusFilter", "MPVCompressorFilter",
+                             "MPVEchoFilter", "MPVFlangerFilter", "MPVGateFilter", "MPVHighPassFilter",
+                             "MPVLimiterFilter", "MPVLowPassFilter", "MPVPitchShiftFilter"),
+    }),
+    "VLC": (use_vlc, vlc_lib_path, "VideoPlayer", {
+        "vlc_video_player": ("VLCVideoPlayer",),
+        "vlc_audio_filter": ("VLCAudioFilter", "VLCEqualizerFilter"),
+    }),
+}
 
-    try:
-        from .fmod_audio_player import FMODAudioPlayer
-        from .fmod_audio_filter import (FMODAudioFilter, FMODBandpassFilter, FMODChorusFilter, FMODCompressorFilter,
-                                        FMODDistortionFilter, FMODEchoFilter, FMODFlangerFilter,
-                                        FMODLowpassFilter, FMODHighpassFilter, FMODPitchShiftFilter, FMODReverbFilter
-                                        )
-        AudioPlayer = FMODAudioPlayer
-    except Exception as e:
-        raise RuntimeError(f"Error initializing FMOD.\nDetails: {str(e)}")
+_lazy_names: dict[str, tuple[str, str, str]] = {}
+for _backend, (_enabled, _lib_path, _alias, _modules) in _BACKENDS.items():
+    if not _enabled:
+        continue
+    for _module, _names in _modules.items():
+        for _name in _names:
+            _lazy_names[_name] = (_backend, _module, _name)
+    _player_module = next(iter(_modules))
+    # Later backends take precedence for the shared alias, VLC over MPV for VideoPlayer.
+    _lazy_names[_alias] = (_backend, _player_module, _modules[_player_module][0])
+del _backend, _enabled, _lib_path, _alias, _modules
+
+# A star import does not go through __getattr__, so the enabled backends' lazy names are listed next to the eager ones.
+__all__ = [
+    "MediaInfo",
+    "PlaylistFormat", "PlaylistEntry", "PlaylistParser", "M3UParser", "M3U8Parser", "PLSParser", "XSPFParser",
+    "JSONParser", "Playlist", "PlaylistManager",
+    "ParameterValue", "formats", "format_descriptions", "AVErrorInfo", "AVPlaybackState", "AVPlaylistMode",
+    "AVPlaylistState", "AVMuteState", "AVMediaType", "AVMediaBackend", "AVMediaSource", "AVDevice", "AVConfig",
+    "AVError", "AVFilterType", "AVFilter", "is_supported_ext", "format_description", "is_url", "is_path",
+    "AVMediaInstance", "AudioFilter", "VideoFilter",
+    *_lazy_names,
+]
+
+_lib_paths_set: set[str] = set()
 
-if use_mpv:
-    if os.path.exists(mpv_lib_path): # type: ignore
-        os.environ["PATH"] += os.path.abspath(mpv_lib_path)+os.pathsep # type: ignore
-    try:
-        from .mpv_video_player import MPVVideoPlayer
-        from .mpv_audio_filter import (MPVAudioFilter, MPVBandPassFilter, MPVChorusFilter, MPVCompressorFilter,
-                                       MPVEchoFilter, MPVFlangerFilter, MPVGateFilter, MPVHighPassFilter,
-                                       MPVLimiterFilter, MPVLowPassFilter, MPVPitchShiftFilter
-                                       )
-        VideoPlayer = MPVVideoPlayer
-    except Exception as e:
-        raise RuntimeError(f"Error initializing MPV.\nDetails: {str(e)}")
 
-if use_vlc:
-    if os.path.exists(vlc_lib_path): # type: ignore
-        os.environ["PATH"] += os.path.abspath(vlc_lib_path)+os.pathsep # type: ignore
+def _set_lib_path(backend: str, lib_path: str | None):
+    if backend in _lib_paths_set:
+        return
+    _lib_paths_set.add(backend)
+    if not lib_path or not os.path.exists(lib_path):
+        return
+    if backend == "FMOD":
+        fmod_dll = find_lib_path(lib_path, "fmod")
+        if fmod_dll:
+            os.environ["PYFMODEX_DLL_PATH"] = os.path.abspath(fmod_dll)
+    else:
+        os.environ["PATH"] += os.pathsep + os.path.abspath(lib_path)
+
+
+def __getattr__(name: str):
+    if name not in _lazy_names:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    backend, module_name, attr = _lazy_names[name]
     try:
-        from .vlc_video_player import VLCVideoPlayer
-        from .vlc_audio_filter import (VLCAudioFilter, VLCEqualizerFilter)
-        VideoPlayer = VLCVideoPlayer
+        _set_lib_path(backend, _BACKENDS[backend][1])
+        module = importlib.import_module(f".{module_name}", __name__)
     except Exception as e:
-        raise RuntimeError(f"Error initializing VLC.\nDetails: {str(e)}")
+        raise RuntimeError(f"Error initializing {backend}.\nDetails: {str(e)}")
+    value = getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
 
 
 if not use_fmod and not use_mpv and not use_vlc:
@@ -64,4 +108,3 @@ if not use_fmod and not use_mpv and not use_vlc:
         "os.environ[\"USE_FMOD\"] = \"1\"\n"
         "os.environ[\"PATH\"] = \"./lib/\""
     )
-
@@ -0,0 +1,80 @@
+# Kept free of package imports and fully annotated so it can be compiled with mypyc
+# (see setup.py); the compiled extension shadows this file when present.
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def scan_m3u(lines: Iterable[str]) -> Iterator[Tuple[str, Optional[str], Optional[int]]]:
+    """Yield (location, title, duration) for every media line of an M3U playlist."""
+    pending = False
+    title: Optional[str] = None
+    duration: Optional[int] = None
+
+    for raw in lines:
+        line = raw.strip()
+
+        # An #EXTINF line always claims the line that follows it, whatever that line holds
+        if pending:
+            pending = False
+            if line and line[0] != '#':
+                yield line, title, duration
+            continue
+
+        if not line:
+            continue
+
+        if line[0] == '#':
+            if line.startswith('#EXTINF:'):
+                head, sep, text = line[8:].partition(',')
+                try:
+                    duration = int(float(head))
+                except ValueError:
+                    duration = None
+                title = text.strip() if sep else None
+                pending = True
+            continue
+
+        yield line, None, None
+
+
+def scan_pls(content: str) -> List[Tuple[str, Optional[str], Optional[int]]]:
+    """Return (location, title, duration) for every FileN key of a PLS playlist, in index order."""
+    file_map: Dict[int, str] = {}
+    title_map: Dict[int, str] = {}
+    length_map: Dict[int, Optional[int]] = {}
+
+    num_entries = 0
+
+    for line in content.splitlines():
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+
+        key = key.strip().lower()
+        if key.startswith('file'):
+            kind = 'file'
+        elif key.startswith('title'):
+            kind = 'title'
+        elif key.startswith('length'):
+            kind = 'length'
+        else:
+            continue
+
+        digits = key[len(kind):].lstrip()
+        if not digits.isdecimal():
+            continue
+
+        index = int(digits)
+        value = value.strip()
+
+        if kind == 'file':
+            file_map[index] = value
+            num_entries = max(num_entries, index)
+        elif kind == 'title':
+            title_map[index] = value
+        else:
+            try:
+                length_map[index] = int(float(value)) if value != '-1' else None
+            except ValueError:
+                length_map[index] = None
+
+    return [(file_map[i], title_map.get(i), length_map.get(i)) for i in range(1, num_entries + 1) if i in file_map]
@@ -1,6 +1,5 @@
 import os
 import platform
-from pathlib import Path
 from typing import Union, List, Optional
 from ctypes.util import find_library
 
@@ -11,30 +10,36 @@ def find_lib_path(paths: Union[List[str], str], libname: str) -> Optional[str]:
         'darwin': ['.dylib', '.so'],
         'linux': ['.so']
     }.get(system, ['.so'])
-    
+
     if isinstance(paths, str):
         paths = [paths]
-    
+
+    candidates = [
+        name
+        for ext in extensions
+        for name in (f"{libname}{ext}", f"lib{libname}{ext}", f"{libname}.0{ext}", f"lib{libname}.0{ext}")
+    ]
+
+    for base_path in paths:
+        if os.path.isfile(base_path):
+            if os.path.basename(base_path).startswith(libname):
+                return str(base_path)
+            continue
+
+        try:
+            with os.scandir(base_path) as it:
+                dir_entries = {entry.name: entry.path for entry in it}
+        except OSError:
+            continue
+
+        for candidate in candidates:
+            lib_path = dir_entries.get(candidate)
+            if lib_path is not None:
+                return lib_path
+
+    # find_library may spawn a compiler/ldconfig subprocess, only fall back to it when the given paths miss.
     system_path = find_library(libname)
     if system_path and os.path.exists(system_path):
         return system_path
-    
-    for base_path in paths:
-        path_obj = Path(base_path)
-        if path_obj.is_file() and path_obj.name.startswith(libname):
-            return str(path_obj)
-        
-        if path_obj.is_dir():
-            for ext in extensions:
-                candidates = [
-                    f"{libname}{ext}",
-                    f"lib{libname}{ext}",
-                    f"{libname}.0{ext}",
-                    f"lib{libname}.0{ext}"
-                ]
-                for candidate in candidates:
-                    lib_path = path_obj / candidate
-                    if lib_path.exists():
-                        return str(lib_path)
-    
-    return None
\ No newline at end of file
+
+    return None
@@ -0,0 +1,69 @@
+# Kept free of package imports and fully annotated so it can be compiled with mypyc
+# (see setup.py); the compiled extension shadows this file when present.
+from functools import lru_cache
+import os
+import re
+
+
+_URL_RE = re.compile(
+    r"^(?:https?|ftps?|rtmps?|rtsp|mms)://"
+    r"(?:[^\s:@/]+(?::[^\s@/]*)?@)?"
+    r"(?:localhost"
+    r"|(?:\d{1,3}\.){3}\d{1,3}"
+    r"|\[[0-9a-f:.]+\]"
+    r"|(?:[a-z0-9\u00a1-\uffff](?:[a-z0-9\u00a1-\uffff-]{0,61}[a-z0-9\u00a1-\uffff])?\.)+"
+    r"(?:[a-z\u00a1-\uffff]{2,63}|xn--[a-z0-9-]{2,59})\.?)"
+    r"(?::\d{1,5})?"
+    r"(?:[/?#]\S*)?$",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def _is_url_cached(url_string: str, default_scheme: str) -> bool:
+    original_trimmed = url_string.strip()
+    if not original_trimmed:
+        return False
+
+    url_to_validate = original_trimmed
+    # Every scheme _URL_RE accepts is alphabetic and followed by "://", anything else is treated as scheme-less.
+    colon = original_trimmed.find(':')
+    has_scheme = 0 < colon < 10 and original_trimmed.startswith('//', colon + 1) and original_trimmed[:colon].isalpha()
+    if not has_scheme:
+        if original_trimmed.startswith('//'):
+            url_to_validate = f"{default_scheme}:{original_trimmed}"
+        else:
+            end = original_trimmed.find('/')
+            potential_host = original_trimmed if end == -1 else original_trimmed[:end]
+            has_dot = '.' in potential_host
+            is_local = potential_host[:9].lower() == 'localhost' and potential_host[9:10] in ('', ':')
+            if has_dot or is_local:
+                 url_to_validate = f"{default_scheme}://{original_trimmed}"
+            else:
+                 return False
+
+    return _URL_RE.match(url_to_validate) is not None
+
+
+def is_url(url_string: object, default_scheme: str = "https") -> bool:
+    if not isinstance(url_string, str):
+        return False
+    if default_scheme not in ("http", "https"):
+        default_scheme = "https"
+    return _is_url_cached(url_string, default_scheme)
+
+
+_BAD_PATH_CHARS = frozenset('\x00<>:"|?*' if os.name == "nt" else '\x00')
+
+
+@lru_cache(maxsize=2048)
+def _is_path_cached(path_str: str) -> bool:
+    if os.name == "nt" and path_str[1:3] in (":\\", ":/"):
+        return _BAD_PATH_CHARS.isdisjoint(path_str[2:])
+    return _BAD_PATH_CHARS.isdisjoint(path_str)
+
+
+def is_path(path_str: object) -> bool:
+    if not isinstance(path_str, str) or path_str == "":
+        return False
+    return _is_path_cached(path_str)
@@ -3,7 +3,7 @@ from typing import Any, Dict
 from .__AV_Common import *
 
 class AudioFilter(AVFilter):
-
+    __slots__ = ()
 
     def __init__(self, media_backend: AVMediaBackend, filter_handle: str, parameters: dict[str, int | float | str], backend_additional_info: dict[Any, Any]):
         filter_type = AVFilterType.AV_TYPE_AUDIO
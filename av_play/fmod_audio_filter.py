@@ -1,162 +1,221 @@
-import pyfmodex as fmod
+import sys
 
-from typing import Any, Dict
-from pyfmodex import enums as fmod_enums
+from array import array
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+from enum import Enum
 
 from .__AV_Common import *
 from .audio_filter import AudioFilter
 
-class FMODAudioFilter(AudioFilter):
+# Parameter type codes, FMODParamTable.type_codes[i] selects the DSP setter for parameter i.
+PARAM_TYPE_FLOAT, PARAM_TYPE_INT, PARAM_TYPE_BOOL, PARAM_TYPE_UNSUPPORTED = 0, 1, 2, 255
+_PARAM_TYPE_CODES: dict[type, int] = {float: PARAM_TYPE_FLOAT, int: PARAM_TYPE_INT, bool: PARAM_TYPE_BOOL}
+
+
+@dataclass(frozen=True, slots=True)
+class FMODParamTable:
+    """Columnar view of an fmod_param_map, parameter i is described by the i-th entry of every column."""
+    names: tuple[str, ...]
+    enums: tuple[Enum, ...]
+    types: tuple[type, ...]
+    type_codes: bytes
+    ranges: array  # 4 doubles per parameter: min, max, step, default
+    by_type: tuple[tuple[int, ...], ...]  # parameter indices grouped per supported type code: float, int, bool
+
+    @classmethod
+    def from_param_map(cls, param_map: Mapping[str, tuple[Enum, type, tuple[Any, Any, Any, Any]]]) -> "FMODParamTable":
+        names = tuple(sys.intern(name) for name in param_map)
+        entries = tuple(param_map.values())
+        types = tuple(entry[1] for entry in entries)
+        type_codes = bytes(_PARAM_TYPE_CODES.get(param_type, PARAM_TYPE_UNSUPPORTED) for param_type in types)
+        return cls(
+            names,
+            tuple(entry[0] for entry in entries),
+            types,
+            type_codes,
+            array('d', [float(bound) for entry in entries for bound in entry[2]]),
+            tuple(tuple(i for i, type_code in enumerate(type_codes) if type_code == code)
+                  for code in (PARAM_TYPE_FLOAT, PARAM_TYPE_INT, PARAM_TYPE_BOOL)),
+        )
+
+    def range_of(self, i: int) -> tuple[float, float, float, float]:
+        """Return the (min, max, step, default) of parameter i, built from the packed ranges on demand."""
+        ranges = self.ranges
+        pos = 4 * i
+        return ranges[pos], ranges[pos + 1], ranges[pos + 2], ranges[pos + 3]
+
+
+def _with_param_table(backend_additional_info: dict[str, Any]) -> Mapping[str, Any]:
+    backend_additional_info["fmod_param_table"] = FMODParamTable.from_param_map(backend_additional_info.get("fmod_param_map", {}))
+    return MappingProxyType(backend_additional_info)
+
 
+class FMODAudioFilter(AudioFilter):
+    __slots__ = ()
 
-    def __init__(self, filter_handle: str, parameters: dict[str, int | float | str], backend_additional_info: dict[Any, Any]):
+    def __init__(self, filter_handle: str, parameters: Mapping[str, ParameterValue], backend_additional_info: Mapping[Any, Any]):
         media_backend: AVMediaBackend = AVMediaBackend.AV_BACKEND_FMOD
+        if "fmod_param_table" not in backend_additional_info:
+            backend_additional_info = _with_param_table(dict(backend_additional_info))
         super().__init__(media_backend, filter_handle, parameters, backend_additional_info)
 
 
-class FMODEchoFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"delay_ms": 500.0, "feedback_percent": 50.0, "dry_level_db": 0.0, "wet_level_db": 0.0}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.ECHO,
-            "fmod_param_map": {
-                "delay_ms": (fmod_enums.DSP_ECHO.DELAY, float, (1.0, 5000.0, 1.0, 500.0)),
-                "feedback_percent": (fmod_enums.DSP_ECHO.FEEDBACK, float, (0.0, 100.0, 0.0, 50.0)),
-                "dry_level_db": (fmod_enums.DSP_ECHO.DRYLEVEL, float, (-80.0, 10.0, -80.0, 0.0)),
-                "wet_level_db": (fmod_enums.DSP_ECHO.WETLEVEL, float, (-80.0, 10.0, -80.0, 0.0)),
-            }}
-        super().__init__("ECHO", parameters, backend_additional_info)
-
-class FMODReverbFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {
+@dataclass(frozen=True, slots=True)
+class FMODFilterSpec:
+    """Immutable description of an FMOD DSP filter, shared by every filter instance of that kind."""
+    handle: str
+    parameters: Mapping[str, ParameterValue]  # passed to instances as-is, AVFilter copies it on first write
+    backend_additional_info: Mapping[str, Any]
+
+
+_FILTER_SPECS: Mapping[str, FMODFilterSpec] | None = None
+
+
+def _load_filter_specs() -> Mapping[str, FMODFilterSpec]:
+    # pyfmodex loads the FMOD library on import, so the tables are only built once a filter is first needed.
+    global _FILTER_SPECS
+    from pyfmodex import enums as fmod_enums
+
+    dsp_type = fmod_enums.DSP_TYPE
+    echo = fmod_enums.DSP_ECHO
+    sfx_reverb = fmod_enums.DSP_SFXREVERB
+    multiband_eq = fmod_enums.DSP_MULTIBAND_EQ
+    eq_filter_type = fmod_enums.DSP_MULTIBAND_EQ_FILTER_TYPE
+    chorus = fmod_enums.DSP_CHORUS
+    compressor = fmod_enums.DSP_COMPRESSOR
+    flange = fmod_enums.DSP_FLANGE
+    distortion = fmod_enums.DSP_DISTORTION
+    pitch_shift = fmod_enums.DSP_PITCHSHIFT
+
+    specs = (
+        FMODFilterSpec("ECHO", MappingProxyType({"delay_ms": 500.0, "feedback_percent": 50.0, "dry_level_db": 0.0, "wet_level_db": 0.0}), _with_param_table({
+            "fmod_dsp_type": dsp_type.ECHO,
+            "fmod_param_map": MappingProxyType({
+                "delay_ms": (echo.DELAY, float, (1.0, 5000.0, 1.0, 500.0)),
+                "feedback_percent": (echo.FEEDBACK, float, (0.0, 100.0, 0.0, 50.0)),
+                "dry_level_db": (echo.DRYLEVEL, float, (-80.0, 10.0, -80.0, 0.0)),
+                "wet_level_db": (echo.WETLEVEL, float, (-80.0, 10.0, -80.0, 0.0)),
+            })})),
+        FMODFilterSpec("REVERB", MappingProxyType({
             "decay_time_ms": 1500.0, "early_delay_ms": 7.0, "late_delay_ms": 11.0,
             "hf_reference_hz": 5000.0, "hf_decay_ratio_percent": 83.0, "diffusion_percent": 100.0,
             "density_percent": 100.0, "low_shelf_frequency_hz": 250.0, "low_shelf_gain_db": 0.0,
             "high_cut_hz": 14500.0, "early_late_mix_percent": 96.0, "wet_level_db": -8.0, "dry_level_db": 0.0,
-        }
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.SFXREVERB,
-            "fmod_param_map": {
-                "decay_time_ms": (fmod_enums.DSP_SFXREVERB.DECAYTIME, float, (100.0, 20000.0, 100.0, 1500.0)),
-                "early_delay_ms": (fmod_enums.DSP_SFXREVERB.EARLYDELAY, float, (0.0, 300.0, 0.0, 7.0)),
-                "late_delay_ms": (fmod_enums.DSP_SFXREVERB.LATEDELAY, float, (0.0, 100.0, 0.0, 11.0)),
-                "hf_reference_hz": (fmod_enums.DSP_SFXREVERB.HFREFERENCE, float, (20.0, 20000.0, 20.0, 5000.0)),
-                "hf_decay_ratio_percent": (fmod_enums.DSP_SFXREVERB.HFDECAYRATIO, float, (10.0, 100.0, 10.0, 83.0)),
-                "diffusion_percent": (fmod_enums.DSP_SFXREVERB.DIFFUSION, float, (0.0, 100.0, 0.0, 100.0)),
-                "density_percent": (fmod_enums.DSP_SFXREVERB.DENSITY, float, (0.0, 100.0, 0.0, 100.0)),
-                "low_shelf_frequency_hz": (fmod_enums.DSP_SFXREVERB.LOWSHELFFREQUENCY, float, (20.0, 1000.0, 20.0, 250.0)),
-                "low_shelf_gain_db": (fmod_enums.DSP_SFXREVERB.LOWSHELFGAIN, float, (-36.0, 12.0, -36.0, 0.0)),
-                "high_cut_hz": (fmod_enums.DSP_SFXREVERB.HIGHCUT, float, (20.0, 20000.0, 20.0, 14500.0)),
-                "early_late_mix_percent": (fmod_enums.DSP_SFXREVERB.EARLYLATEMIX, float, (0.0, 100.0, 0.0, 96.0)),
-                "wet_level_db": (fmod_enums.DSP_SFXREVERB.WETLEVEL, float, (-80.0, 20.0, -80.0, -8.0)),
-                "dry_level_db": (fmod_enums.DSP_SFXREVERB.DRYLEVEL, float, (-80.0, 20.0, -80.0, 0.0)),
-            }}
-        super().__init__("REVERB", parameters, backend_additional_info)
-
-class FMODLowpassFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"cutoff_frequency_hz": 5000.0, "q_factor": 1.0}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.MULTIBAND_EQ,
-            "fixed_param_vals": {
-                "filter_type": (fmod_enums.DSP_MULTIBAND_EQ.A_FILTER, fmod_enums.DSP_MULTIBAND_EQ_FILTER_TYPE.LOWPASS_24DB, int),
-            },
-            "fmod_param_map": {
-                "cutoff_frequency_hz": (fmod_enums.DSP_MULTIBAND_EQ.A_FREQUENCY, float, (20.0, 22000.0, 1.0, 5000.0)),
-                "q_factor": (fmod_enums.DSP_MULTIBAND_EQ.A_Q, float, (0.1, 10.0, 0.1, 1.0)),
-            }}
-        super().__init__("LOWPASS", parameters, backend_additional_info)
-
-class FMODHighpassFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"cutoff_frequency_hz": 250.0, "q_factor": 1.0}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.MULTIBAND_EQ,
-            "fixed_param_vals": {
-                "filter_type": (fmod_enums.DSP_MULTIBAND_EQ.A_FILTER, fmod_enums.DSP_MULTIBAND_EQ_FILTER_TYPE.HIGHPASS_24DB, int),
-            },
-            "fmod_param_map": {
-                "cutoff_frequency_hz": (fmod_enums.DSP_MULTIBAND_EQ.A_FREQUENCY, float, (20.0, 22000.0, 1.0, 250.0)),
-                "q_factor": (fmod_enums.DSP_MULTIBAND_EQ.A_Q, float, (0.1, 10.0, 0.1, 1.0)),
-            }}
-        super().__init__("HIGHPASS", parameters, backend_additional_info)
-
-class FMODBandpassFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"center_frequency_hz": 1000.0, "bandwidth_q": 1.0}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.MULTIBAND_EQ,
-            "fixed_param_vals": {
-                "filter_type": (fmod_enums.DSP_MULTIBAND_EQ.A_FILTER, fmod_enums.DSP_MULTIBAND_EQ_FILTER_TYPE.BANDPASS, int),
-            },
-            "fmod_param_map": {
-                "center_frequency_hz": (fmod_enums.DSP_MULTIBAND_EQ.A_FREQUENCY, float, (20.0, 22000.0, 1.0, 1000.0)),
-                "bandwidth_q": (fmod_enums.DSP_MULTIBAND_EQ.A_Q, float, (0.1, 10.0, 0.1, 1.0)),
-            }}
-        super().__init__("BANDPASS", parameters, backend_additional_info)
-
-class FMODChorusFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"mix_percent": 50.0, "rate_hz": 0.8, "depth_percent": 3.0}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.CHORUS,
-            "fmod_param_map": {
-                "mix_percent": (fmod_enums.DSP_CHORUS.MIX, float, (0.0, 100.0, 0.0, 50.0)),
-                "rate_hz": (fmod_enums.DSP_CHORUS.RATE, float, (0.0, 20.0, 0.0, 0.8)),
-                "depth_percent": (fmod_enums.DSP_CHORUS.DEPTH, float, (0.0, 100.0, 0.0, 3.0)),
-            }}
-        super().__init__("CHORUS", parameters, backend_additional_info)
-
-class FMODCompressorFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters = {
+        }), _with_param_table({
+            "fmod_dsp_type": dsp_type.SFXREVERB,
+            "fmod_param_map": MappingProxyType({
+                "decay_time_ms": (sfx_reverb.DECAYTIME, float, (100.0, 20000.0, 100.0, 1500.0)),
+                "early_delay_ms": (sfx_reverb.EARLYDELAY, float, (0.0, 300.0, 0.0, 7.0)),
+                "late_delay_ms": (sfx_reverb.LATEDELAY, float, (0.0, 100.0, 0.0, 11.0)),
+                "hf_reference_hz": (sfx_reverb.HFREFERENCE, float, (20.0, 20000.0, 20.0, 5000.0)),
+                "hf_decay_ratio_percent": (sfx_reverb.HFDECAYRATIO, float, (10.0, 100.0, 10.0, 83.0)),
+                "diffusion_percent": (sfx_reverb.DIFFUSION, float, (0.0, 100.0, 0.0, 100.0)),
+                "density_percent": (sfx_reverb.DENSITY, float, (0.0, 100.0, 0.0, 100.0)),
+                "low_shelf_frequency_hz": (sfx_reverb.LOWSHELFFREQUENCY, float, (20.0, 1000.0, 20.0, 250.0)),
+                "low_shelf_gain_db": (sfx_reverb.LOWSHELFGAIN, float, (-36.0, 12.0, -36.0, 0.0)),
+                "high_cut_hz": (sfx_reverb.HIGHCUT, float, (20.0, 20000.0, 20.0, 14500.0)),
+                "early_late_mix_percent": (sfx_reverb.EARLYLATEMIX, float, (0.0, 100.0, 0.0, 96.0)),
+                "wet_level_db": (sfx_reverb.WETLEVEL, float, (-80.0, 20.0, -80.0, -8.0)),
+                "dry_level_db": (sfx_reverb.DRYLEVEL, float, (-80.0, 20.0, -80.0, 0.0)),
+            })})),
+        FMODFilterSpec("LOWPASS", MappingProxyType({"cutoff_frequency_hz": 5000.0, "q_factor": 1.0}), _with_param_table({
+            "fmod_dsp_type": dsp_type.MULTIBAND_EQ,
+            "fixed_param_vals": MappingProxyType({
+                "filter_type": (multiband_eq.A_FILTER, eq_filter_type.LOWPASS_24DB, int),
+            }),
+            "fmod_param_map": MappingProxyType({
+                "cutoff_frequency_hz": (multiband_eq.A_FREQUENCY, float, (20.0, 22000.0, 1.0, 5000.0)),
+                "q_factor": (multiband_eq.A_Q, float, (0.1, 10.0, 0.1, 1.0)),
+            })})),
+        FMODFilterSpec("HIGHPASS", MappingProxyType({"cutoff_frequency_hz": 250.0, "q_factor": 1.0}), _with_param_table({
+            "fmod_dsp_type": dsp_type.MULTIBAND_EQ,
+            "fixed_param_vals": MappingProxyType({
+                "filter_type": (multiband_eq.A_FILTER, eq_filter_type.HIGHPASS_24DB, int),
+            }),
+            "fmod_param_map": MappingProxyType({
+                "cutoff_frequency_hz": (multiband_eq.A_FREQUENCY, float, (20.0, 22000.0, 1.0, 250.0)),
+                "q_factor": (multiband_eq.A_Q, float, (0.1, 10.0, 0.1, 1.0)),
+            })})),
+        FMODFilterSpec("BANDPASS", MappingProxyType({"center_frequency_hz": 1000.0, "bandwidth_q": 1.0}), _with_param_table({
+            "fmod_dsp_type": dsp_type.MULTIBAND_EQ,
+            "fixed_param_vals": MappingProxyType({
+                "filter_type": (multiband_eq.A_FILTER, eq_filter_type.BANDPASS, int),
+            }),
+            "fmod_param_map": MappingProxyType({
+                "center_frequency_hz": (multiband_eq.A_FREQUENCY, float, (20.0, 22000.0, 1.0, 1000.0)),
+                "bandwidth_q": (multiband_eq.A_Q, float, (0.1, 10.0, 0.1, 1.0)),
+            })})),
+        FMODFilterSpec("CHORUS", MappingProxyType({"mix_percent": 50.0, "rate_hz": 0.8, "depth_percent": 3.0}), _with_param_table({
+            "fmod_dsp_type": dsp_type.CHORUS,
+            "fmod_param_map": MappingProxyType({
+                "mix_percent": (chorus.MIX, float, (0.0, 100.0, 0.0, 50.0)),
+                "rate_hz": (chorus.RATE, float, (0.0, 20.0, 0.0, 0.8)),
+                "depth_percent": (chorus.DEPTH, float, (0.0, 100.0, 0.0, 3.0)),
+            })})),
+        FMODFilterSpec("COMPRESSOR", MappingProxyType({
             "threshold_db": 0.0, "ratio": 2.5, "attack_ms": 20.0,
             "release_ms": 100.0, "makeup_gain_db": 0.0,
             "use_sidechain": False, "linked_channels": True,
-        }
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.COMPRESSOR,
-            "fmod_param_map": {
-                "threshold_db": (fmod_enums.DSP_COMPRESSOR.THRESHOLD, float, (-80.0, 0.0, 1.0, 0.0)),
-                "ratio": (fmod_enums.DSP_COMPRESSOR.RATIO, float, (1.0, 50.0, 0.1, 2.5)),
-                "attack_ms": (fmod_enums.DSP_COMPRESSOR.ATTACK, float, (0.1, 1000.0, 0.1, 20.0)),
-                "release_ms": (fmod_enums.DSP_COMPRESSOR.RELEASE, float, (10.0, 5000.0, 1.0, 100.0)),
-                "makeup_gain_db": (fmod_enums.DSP_COMPRESSOR.GAINMAKEUP, float, (-30.0, 30.0, 0.1, 0.0)),
-                "use_sidechain": (fmod_enums.DSP_COMPRESSOR.USESIDECHAIN, bool, (False, True, 1, False)),
-                "linked_channels": (fmod_enums.DSP_COMPRESSOR.LINKED, bool, (False, True, 1, True)),
-            }}
-        super().__init__("COMPRESSOR", parameters, backend_additional_info)
-
-class FMODFlangerFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"mix_percent": 50.0, "depth_factor": 1.0, "rate_hz": 0.1}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.FLANGE,
-            "fmod_param_map": {
-                "mix_percent": (fmod_enums.DSP_FLANGE.MIX, float, (0.0, 100.0, 0.0, 50.0)),
-                "depth_factor": (fmod_enums.DSP_FLANGE.DEPTH, float, (0.01, 1.0, 0.01, 1.0)),
-                "rate_hz": (fmod_enums.DSP_FLANGE.RATE, float, (0.0, 20.0, 0.0, 0.1)),
-            }}
-        super().__init__("FLANGER", parameters, backend_additional_info)
-
-class FMODDistortionFilter(FMODAudioFilter):
-    def __init__(self):
-        parameters:dict[str, ParameterValue] = {"level_factor": 0.5}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.DISTORTION,
-            "fmod_param_map": {
-                "level_factor": (fmod_enums.DSP_DISTORTION.LEVEL, float, (0.0, 1.0, 0.0, 0.5)),
-            }}
-        super().__init__("DISTORTION", parameters, backend_additional_info)
-
-class FMODPitchShiftFilter(FMODAudioFilter):
+        }), _with_param_table({
+            "fmod_dsp_type": dsp_type.COMPRESSOR,
+            "fmod_param_map": MappingProxyType({
+                "threshold_db": (compressor.THRESHOLD, float, (-80.0, 0.0, 1.0, 0.0)),
+                "ratio": (compressor.RATIO, float, (1.0, 50.0, 0.1, 2.5)),
+                "attack_ms": (compressor.ATTACK, float, (0.1, 1000.0, 0.1, 20.0)),
+                "release_ms": (compressor.RELEASE, float, (10.0, 5000.0, 1.0, 100.0)),
+                "makeup_gain_db": (compressor.GAINMAKEUP, float, (-30.0, 30.0, 0.1, 0.0)),
+                "use_sidechain": (compressor.USESIDECHAIN, bool, (False, True, 1, False)),
+                "linked_channels": (compressor.LINKED, bool, (False, True, 1, True)),
+            })})),
+        FMODFilterSpec("FLANGER", MappingProxyType({"mix_percent": 50.0, "depth_factor": 1.0, "rate_hz": 0.1}), _with_param_table({
+            "fmod_dsp_type": dsp_type.FLANGE,
+            "fmod_param_map": MappingProxyType({
+                "mix_percent": (flange.MIX, float, (0.0, 100.0, 0.0, 50.0)),
+                "depth_factor": (flange.DEPTH, float, (0.01, 1.0, 0.01, 1.0)),
+                "rate_hz": (flange.RATE, float, (0.0, 20.0, 0.0, 0.1)),
+            })})),
+        FMODFilterSpec("DISTORTION", MappingProxyType({"level_factor": 0.5}), _with_param_table({
+            "fmod_dsp_type": dsp_type.DISTORTION,
+            "fmod_param_map": MappingProxyType({
+                "level_factor": (distortion.LEVEL, float, (0.0, 1.0, 0.0, 0.5)),
+            })})),
+        FMODFilterSpec("PITCH_SHIFT", MappingProxyType({"pitch_scale": 1.0, "fft_size_samples": 1024.0}), _with_param_table({
+            "fmod_dsp_type": dsp_type.PITCHSHIFT,
+            "fmod_param_map": MappingProxyType({
+                "pitch_scale": (pitch_shift.PITCH, float, (0.5, 2.0, 0.01, 1.0)),
+                "fft_size_samples": (pitch_shift.FFTSIZE, float, (256, 4096, 64, 1024)),
+            })})),
+    )
+    _FILTER_SPECS = MappingProxyType({spec.handle: spec for spec in specs})
+    return _FILTER_SPECS
+
+
+def get_fmod_filter_spec(handle: str) -> FMODFilterSpec | None:
+    return (_FILTER_SPECS or _load_filter_specs()).get(handle)
+
+
+def _filter_spec(handle: str) -> FMODFilterSpec:
+    return (_FILTER_SPECS or _load_filter_specs())[handle]
+
+
+def _make_filter_class(class_name: str, handle: str) -> type[FMODAudioFilter]:
     def __init__(self):
-        parameters = {"pitch_scale": 1.0, "fft_size_samples": 1024}
-        backend_additional_info = {
-            "fmod_dsp_type": fmod_enums.DSP_TYPE.PITCHSHIFT,
-            "fmod_param_map": {
-                "pitch_scale": (fmod_enums.DSP_PITCHSHIFT.PITCH, float, (0.5, 2.0, 0.01, 1.0)),
-                "fft_size_samples": (fmod_enums.DSP_PITCHSHIFT.FFTSIZE, float, (256, 4096, 64, 1024)),
-            }}
-        super().__init__("PITCH_SHIFT", parameters, backend_additional_info)
\ No newline at end of file
+        spec = _filter_spec(handle)
+        FMODAudioFilter.__init__(self, spec.handle, spec.parameters, spec.backend_additional_info)
+
+    return type(class_name, (FMODAudioFilter,), {"__slots__": (), "__init__": __init__, "__module__": __name__})
+
+
+# Every concrete filter is fully described by its spec, so the classes are generated rather than written out.
+FMODEchoFilter = _make_filter_class("FMODEchoFilter", "ECHO")
+FMODReverbFilter = _make_filter_class("FMODReverbFilter", "REVERB")
+FMODLowpassFilter = _make_filter_class("FMODLowpassFilter", "LOWPASS")
+FMODHighpassFilter = _make_filter_class("FMODHighpassFilter", "HIGHPASS")
+FMODBandpassFilter = _make_filter_class("FMODBandpassFilter", "BANDPASS")
+FMODChorusFilter = _make_filter_class("FMODChorusFilter", "CHORUS")
+FMODCompressorFilter = _make_filter_class("FMODCompressorFilter", "COMPRESSOR")
+FMODFlangerFilter = _make_filter_class("FMODFlangerFilter", "FLANGER")
+FMODDistortionFilter = _make_filter_class("FMODDistortionFilter", "DISTORTION")
+FMODPitchShiftFilter = _make_filter_class("FMODPitchShiftFilter", "PITCH_SHIFT")
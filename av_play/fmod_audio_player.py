@@ -1,4 +1,5 @@
 import os
+import threading
 import pyfmodex as fmod
 
 from pyfmodex import flags as fmod_flags
@@ -7,60 +8,110 @@ from pyfmodex.exceptions import FmodError
 from pyfmodex.structobject import Structobject
 from pyfmodex.structures import CREATESOUNDEXINFO
 
-from typing import Dict, List, Callable, Any, Tuple, Union
+from typing import Dict, List, Mapping, Set, Callable, Any, Tuple, Union
 from enum import Enum
 
-from .fmod_audio_filter import FMODAudioFilter
+from .fmod_audio_filter import FMODAudioFilter, FMODParamTable
 from .__AV_Common import *
 from .__AV_Instance import AVMediaInstance
 from .__AV_Interface import AVMediaInterface
 from .__AV_Player import AVPlayer
 
 MIN_FMOD_VERSION = 0x00020108
+# Seconds between background FMOD updates and playback status snapshots.
+STATUS_POLL_INTERVAL = 0.033
 RangeType = Union[int,float]
 fmod_res = fmod_enums.RESULT
 TIMEUNIT = fmod_enums.TIMEUNIT
+MODE = fmod_flags.MODE
+OPENSTATE = fmod_enums.OPENSTATE
+# Flags and enum members used on the hot paths, bound once instead of resolved through the pyfmodex modules per call.
+_INIT_FLAGS = fmod_flags.INIT_FLAGS.NORMAL | fmod_flags.INIT_FLAGS.PROFILE_ENABLE
+_TIMEUNIT_MS = TIMEUNIT.MS
+_STREAM_BUFFER_SIZE = Structobject(size=64 * 1024, unit=TIMEUNIT.RAWBYTES)
+_FILE_MODE = MODE.NONBLOCKING
+_URL_MODE = MODE.CREATESTREAM | MODE.NONBLOCKING
+_PLAYABLE_STATES = frozenset((OPENSTATE.READY, OPENSTATE.PLAYING))
+_OPENSTATE_BUFFERING = OPENSTATE.BUFFERING
+_OPENSTATE_READY = OPENSTATE.READY
+_LOADING_STATES = frozenset((OPENSTATE.LOADING, OPENSTATE.CONNECTING))
+_PENDING_STATES = _LOADING_STATES | {OPENSTATE.BUFFERING}
+# Results meaning the channel is gone (stopped or stolen) rather than a real failure.
+_CHANNEL_GONE = frozenset((fmod_res.INVALID_HANDLE, fmod_res.CHANNEL_STOLEN))
+# Precomputed sound/channel mode masks for set_loop.
+_LOOP_CLEAR_MASK = ~MODE.LOOP_NORMAL
+_LOOP_OFF = MODE.LOOP_OFF
+_LOOP_NORMAL = MODE.LOOP_NORMAL
+# Indexed by the FMODParamTable type codes: float, int, bool.
+_DSP_SETTER_NAMES = ("set_parameter_float", "set_parameter_int", "set_parameter_bool")
+# Per parameter: DSP parameter enum, expected value type, bound DSP setter (None if unsupported), min, max.
+ParamDispatch = Dict[str, Tuple[Enum, type, Callable[[Enum, Any], None] | None, float, float]]
+
+_ERR_MAP:Dict[Any, AVErrorInfo] = {
+    fmod_res.FILE_NOTFOUND: AVErrorInfo.FILE_NOTFOUND,
+    fmod_res.FORMAT: AVErrorInfo.UNSUPPORTED_FORMAT,
+    fmod_res.INVALID_HANDLE: AVErrorInfo.INVALID_HANDLE,
+    fmod_res.CHANNEL_STOLEN: AVErrorInfo.INVALID_HANDLE,
+    fmod_res.HTTP: AVErrorInfo.HTTP_ERROR,
+    fmod_res.HTTP_ACCESS: AVErrorInfo.HTTP_ERROR,
+    fmod_res.HTTP_PROXY_AUTH: AVErrorInfo.HTTP_ERROR,
+    fmod_res.HTTP_SERVER_ERROR: AVErrorInfo.HTTP_ERROR,
+    fmod_res.HTTP_TIMEOUT: AVErrorInfo.HTTP_ERROR,
+    fmod_res.NET_CONNECT: AVErrorInfo.NET_ERROR,
+    fmod_res.NET_SOCKET_ERROR: AVErrorInfo.NET_ERROR,
+    fmod_res.NET_URL: AVErrorInfo.NET_ERROR,
+    fmod_res.UNINITIALIZED: AVErrorInfo.UNINITIALIZED,
+}
+
+class _FmodErrors:
+    """Context manager translating errors raised by FMOD calls into AVError, AVErrors pass through unchanged."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None or issubclass(exc_type, AVError):
+            return False
+        if issubclass(exc_type, FmodError):
+            raise AVError(_ERR_MAP.get(exc.result, AVErrorInfo.UNKNOWN_ERROR), f"Details: {exc.result}") from exc
+        if issubclass(exc_type, Exception):
+            raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"unknown error: {str(exc)}") from exc
+        return False
 
-def handle_call_err(call_func:Callable) -> Any:
-    try:
-        return call_func()
-    except FmodError as fmod_err:
-        result = fmod_err.result
-        info = AVErrorInfo.UNKNOWN_ERROR
-        if result == fmod_res.FILE_NOTFOUND:
-            info = AVErrorInfo.FILE_NOTFOUND
-        elif result == fmod_res.FORMAT:
-            info = AVErrorInfo.UNSUPPORTED_FORMAT
-        elif result == fmod_res.INVALID_HANDLE or result == fmod_res.CHANNEL_STOLEN:
-            info = AVErrorInfo.INVALID_HANDLE
-        elif result in [fmod_res.HTTP, fmod_res.HTTP_ACCESS, fmod_res.HTTP_PROXY_AUTH, fmod_res.HTTP_SERVER_ERROR, fmod_res.HTTP_TIMEOUT]:
-            info = AVErrorInfo.HTTP_ERROR
-        elif result in [fmod_res.NET_CONNECT, fmod_res.NET_SOCKET_ERROR, fmod_res.NET_URL]:
-            info = AVErrorInfo.NET_ERROR
-        elif result == fmod_res.UNINITIALIZED:
-            info = AVErrorInfo.UNINITIALIZED
-        else:
-            info = AVErrorInfo.UNKNOWN_ERROR
-        raise AVError(info, f"Details: {fmod_err.result}")
-    except Exception as e:
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"unknown error: {str(e)}")
-
-
-def safe_assert(condition) -> bool:
-    """Custom assert that returns True/False instead of raising AssertionError"""
-    return bool(condition)
+# Stateless, so a single shared instance is reused by every `with` block.
+_fmod_errors = _FmodErrors()
 
-class AudioMediaInterface(AVMediaInterface):
 
+class AudioMediaInterface(AVMediaInterface):
+    __slots__ = ("__instances", "__effects", "__effect_structs", "__param_dispatch", "__instance_effects", "__applied_effects",
+                 "__channels", "__loop_state", "__snapshots", "__generations", "__poll_stop", "__poll_thread", "__system",
+                 "__url_exinfo", "__pending_play", "__lengths")
 
     def __init__(self) -> None:
         super().__init__(AVMediaType.AV_TYPE_AUDIO, AVMediaBackend.AV_BACKEND_FMOD)
         self.__instances:Dict[int, fmod.sound.Sound] = {}
         self.__effects:Dict[int, fmod.dsp.DSP] = {}
         self.__effect_structs:Dict[int, AVFilter] = {}
-        self.__instance_effects:Dict[int, List[int]] = {}
+        self.__param_dispatch:Dict[int, ParamDispatch] = {}
+        # Filter ids per instance, kept as dict keys for O(1) membership while preserving the order they were applied in.
+        self.__instance_effects:Dict[int, Dict[int, None]] = {}
+        # Filter ids whose DSP is attached to the instance's current channel.
+        self.__applied_effects:Dict[int, Set[int]] = {}
         self.__channels:Dict[int, fmod.channel.Channel] = {}
+        self.__loop_state:Dict[int, bool] = {}
+        # Length in seconds per instance, fixed once the sound reports one.
+        self.__lengths:Dict[int, int] = {}
+        # Polled status per instance: (generation, play state, position, volume, mute state).
+        self.__snapshots:Dict[int, Tuple[int, AVPlaybackState, int, float, AVMuteState]] = {}
+        self.__generations:Dict[int, int] = {}
+        self.__poll_stop = threading.Event()
+        self.__poll_thread:threading.Thread|None = None
+        # Instances play() was called on before they finished opening, started by the poll thread once ready.
+        self.__pending_play:Set[int] = set()
         self.__system = fmod.System()
+        # FMOD only reads the struct during create_sound, so one instance serves every URL open.
+        self.__url_exinfo = CREATESOUNDEXINFO(filebuffersize=1024 * 16)
 
         if self.__system.version < MIN_FMOD_VERSION:
             raise Exception(f"Error: Detected FMOD version is lower then the mimum supported version.\nMinimum version is {MIN_FMOD_VERSION}")
@@ -68,487 +119,539 @@ class AudioMediaInterface(AVMediaInterface):
 
     def init(self, *args, **kw):
         max_channels = kw["max_channels"] if "max_channels" in kw else 64
-        flags = fmod_flags.INIT_FLAGS.NORMAL | fmod_flags.INIT_FLAGS.PROFILE_ENABLE
         try:
-            self.__system.init(maxchannels=max_channels, flags=flags)
-            self.__system.stream_buffer_size = Structobject(size=64 * 1024, unit=fmod_enums.TIMEUNIT.RAWBYTES)
+            self.__system.init(maxchannels=max_channels, flags=_INIT_FLAGS)
+            self.__system.stream_buffer_size = _STREAM_BUFFER_SIZE
         except Exception as e:
             raise AVError(AVErrorInfo.INITIALIZATION_ERROR, f"Error initializing FMOD. {str(e)}")
 
+        if self.__poll_thread is None or not self.__poll_thread.is_alive():
+            self.__poll_stop.clear()
+            self.__poll_thread = threading.Thread(target=self.__poll_status, daemon=True)
+            self.__poll_thread.start()
+
+    def __poll_status(self):
+        """Pumps FMOD and publishes a status snapshot per instance so the getters can skip the FMOD calls."""
+        while not self.__poll_stop.wait(STATUS_POLL_INTERVAL):
+            try:
+                self.__system.update()
+            except FmodError:
+                pass
+            channels = self.__channels
+            generations = self.__generations
+            for id, sound in list(self.__instances.items()):
+                generation:int = generations.get(id, 0)
+                # One channel lookup per instance, shared by all four reads.
+                channel:fmod.channel.Channel|None = channels.get(id)
+                try:
+                    play_state:AVPlaybackState = self.__read_play_state(sound, channel)
+                    self.__snapshots[id] = (generation, play_state, self.__read_position(channel),
+                                            self.__read_volume(channel), self.__read_mute_state(channel))
+                except Exception:
+                    # The instance may be released mid-poll, the getters fall back to a live read.
+                    self.__snapshots.pop(id, None)
+                    continue
+
+                if id in self.__pending_play and play_state is not AVPlaybackState.AV_STATE_LOADING:
+                    self.__pending_play.discard(id)
+                    try:
+                        self.play(id)
+                    except AVError:
+                        pass
+
+    def __invalidate(self, id:int):
+        # Snapshots taken before a state change carry an older generation and are ignored by the getters.
+        self.__generations[id] = self.__generations.get(id, 0) + 1
+
+    def __snapshot(self, id:int) -> Tuple[int, AVPlaybackState, int, float, AVMuteState] | None:
+        snapshot = self.__snapshots.get(id)
+        if snapshot is not None and snapshot[0] == self.__generations.get(id, 0):
+            return snapshot
+        return None
+
     def free(self):
+        self.__poll_stop.set()
+        if self.__poll_thread is not None and self.__poll_thread is not threading.current_thread():
+            self.__poll_thread.join()
+        self.__poll_thread = None
+
         for instance in list(self.__instances.keys()):
             try:
                 self.release(instance)
-            except Exception:
-               pass
-
-        for instance in list(self.__instance_effects.keys()):
-            for effect in self.__instance_effects[instance].copy():
-                try:
-                    self.remove_filter(instance, effect)
-                except:
-                    pass
+            except (FmodError, AVError):
+                pass
 
+        # The channels are stopped by now, so release the DSPs directly rather than detaching each through remove_filter.
+        for dsp_obj in self.__effects.values():
+            try:
+                dsp_obj.release()
+            except FmodError:
+                pass
         self.__effects.clear()
+        self.__param_dispatch.clear()
         self.__instance_effects.clear()
+        self.__applied_effects.clear()
         self.__effect_structs.clear()
+        self.__snapshots.clear()
+        self.__pending_play.clear()
+        self.__lengths.clear()
         try:
             self.__system.release()
         except Exception as e:
             raise AVError(AVErrorInfo.INVALID_HANDLE)
 
     def load_file(self, id:int, path:str):
-        try:
+        if self.__instances.get(id) is not None:
             self.release(id)
-        except: 
-            pass
-        def create_instance():
-            if (path is not None and path != "") and (id not in self.__instances or self.__instances[id] is None):
-                self.__instances[id] = self.__system.create_stream(path, mode=fmod_flags.MODE.NONBLOCKING)
-
-        handle_call_err(create_instance)
+        self.__invalidate(id)
+        if path is not None and path != "":
+            with _fmod_errors:
+                self.__instances[id] = self.__system.create_stream(path, mode=_FILE_MODE)
 
     def load_url(self, id:int, url:str):
-        def create_instance():
-            MODE = fmod_flags.MODE
-            exinfo = CREATESOUNDEXINFO(filebuffersize=1024 * 16)
-            self.__instances[id] = self.__system.create_sound(url, mode=MODE.CREATESTREAM | MODE.NONBLOCKING, exinfo=exinfo)
-
-        if (url is not None and url != "") and (id not in self.__instances or self.__instances[id] is None):
-            handle_call_err(create_instance)
+        self.__invalidate(id)
+        if (url is not None and url != "") and self.__instances.get(id) is None:
+            with _fmod_errors:
+                self.__instances[id] = self.__system.create_sound(url, mode=_URL_MODE, exinfo=self.__url_exinfo)
 
     def release(self, id:int):
-        try:
-            self.stop(id)
-        except:
-            pass
+        self.__pending_play.discard(id)
+        channel:fmod.channel.Channel|None = self.__channels.pop(id, None)
+        if channel is not None:
+            try: channel.stop()
+            except FmodError: pass
 
-        if id in self.__channels:
-            del self.__channels[id]
-            
-        if id in self.__instances and self.__instances[id] is not None:
-            try:
-                handle_call_err(lambda: self.__instances[id].release())
-            except:
-                pass
-            del self.__instances[id]
+        self.__applied_effects.pop(id, None)
+        self.__loop_state.pop(id, None)
+        self.__lengths.pop(id, None)
 
+        sound:fmod.sound.Sound|None = self.__instances.pop(id, None)
+        if sound is not None:
+            try: sound.release()
+            except FmodError: pass
+        self.__snapshots.pop(id, None)
 
-    def play(self, id:int):
-        self.__check_handle(id)
-
-        fmod_state = fmod_enums.OPENSTATE
-        sound:fmod.sound.Sound = self.__instances[id]
-        state:fmod_enums.OPENSTATE|None = None
 
-        def create_channel(): self.__channels[id] = sound.play(paused=True)
-        
-        def play_channel():
-            starving:bool|None = getattr(sound.open_state, "starving", None)
-            if self.__channels[id] and starving is not None:
-                self.__channels[id].mute = starving
+    def play(self, id:int):
+        sound:fmod.sound.Sound = self.__check_handle(id)
+        self.__invalidate(id)
 
-                self.__channels[id].paused = False
-                if id in self.__instance_effects and self.__instance_effects[id] is not None:
-                    for effect in self.__instance_effects[id]:
-                        self.apply_filter(id, effect, self.__effect_structs[effect])
+        open_state:Structobject|None = None
 
+        # Every open_state read is a separate FMOD call, so it is read once and both fields taken from it.
         try:
-            state = getattr(sound.open_state, "state")
-            if state == fmod_state.BUFFERING or state == fmod_state.LOADING or state == fmod_state.CONNECTING:
-                pass
-        except Exception:
+            open_state = sound.open_state
+        except FmodError:
             pass
+        state:OPENSTATE|None = getattr(open_state, "state", None)
+        starving:bool|None = getattr(open_state, "starving", None)
+
+        if state in _PENDING_STATES:
+            # Not open yet, the poll thread retries once FMOD reports the sound ready instead of the caller polling.
+            self.__pending_play.add(id)
+            return
 
-        def play_sound():
-            if state == fmod_state.READY or state == fmod_state.PLAYING:
+        if state in _PLAYABLE_STATES:
+            with _fmod_errors:
                 try:
-                    if id not in self.__channels or self.__channels[id] is None:
-                        create_channel()
-                    play_channel()
+                    if self.__channels.get(id) is None:
+                        self.__create_channel(id, sound)
+                    self.__play_channel(id, starving)
                 except FmodError as fmod_err:
-                    if fmod_err.result == fmod_res.INVALID_HANDLE or fmod_err.result == fmod_res.CHANNEL_STOLEN:
-                        create_channel()
-                    play_channel()
-
-        handle_call_err(play_sound)
+                    if fmod_err.result in _CHANNEL_GONE:
+                        self.__create_channel(id, sound)
+                    self.__play_channel(id, starving)
+
+    def __create_channel(self, id:int, sound:fmod.sound.Sound):
+        self.__channels[id] = sound.play(paused=True)
+        self.__applied_effects[id] = set()
+
+    def __play_channel(self, id:int, starving:bool|None):
+        channel:fmod.channel.Channel|None = self.__channels[id]
+        if channel and starving is not None:
+            channel.mute = starving
+
+            channel.paused = False
+            instance_effects:Dict[int, None]|None = self.__instance_effects.get(id)
+            applied:Set[int] = self.__applied_effects.get(id, set())
+            # Only filters not yet attached to this channel need applying, usually none on a repeated play().
+            if instance_effects is not None and len(applied) < len(instance_effects):
+                effect_structs = self.__effect_structs
+                for effect in [effect for effect in instance_effects if effect not in applied]:
+                    self.apply_filter(id, effect, effect_structs[effect])
 
     def pause(self, id:int):
         self.__check_handle(id)
-
-        def pause_channel():
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return
-            channel.paused = True  # type: ignore
-
-        try: handle_call_err(pause_channel)
-        except: pass
+        self.__invalidate(id)
+        self.__pending_play.discard(id)
+        channel:fmod.channel.Channel | None = self.__channels.get(id)
+        if channel is None:
+            return
+        try: channel.paused = True
+        except FmodError: pass
 
     def mute(self, id:int):
         self.__check_handle(id)
-
-        def mute_channel():
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return
-            channel.mute = True  # type: ignore
-
-        try: handle_call_err(mute_channel)
-        except: pass
+        self.__invalidate(id)
+        channel:fmod.channel.Channel | None = self.__channels.get(id)
+        if channel is None:
+            return
+        try: channel.mute = True
+        except FmodError: pass
 
     def unmute(self, id:int):
         self.__check_handle(id)
-
-        def unmute_channel():
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return
-            channel.mute = False  # type: ignore
-
-        try: handle_call_err(unmute_channel)
-        except: pass
+        self.__invalidate(id)
+        channel:fmod.channel.Channel | None = self.__channels.get(id)
+        if channel is None:
+            return
+        try: channel.mute = False
+        except FmodError: pass
 
     def stop(self, id:int):
         self.__check_handle(id)
-
-        def stop_channel():
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return
-            channel.stop()  # type: ignore
-
-        try: handle_call_err(stop_channel)
-        except: pass
+        self.__invalidate(id)
+        self.__pending_play.discard(id)
+        channel:fmod.channel.Channel | None = self.__channels.get(id)
+        if channel is None:
+            return
+        try: channel.stop()
+        except FmodError: pass
 
     def set_volume(self, id:int, offset:float):
         self.__check_handle(id)
-
-        def set_channel_volume():
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return
-            channel.volume = offset  # type: ignore
-
-        try: handle_call_err(set_channel_volume)
-        except: pass
+        self.__invalidate(id)
+        channel:fmod.channel.Channel | None = self.__channels.get(id)
+        if channel is None:
+            return
+        try: channel.volume = offset
+        except FmodError: pass
 
     def set_position(self, id:int, offset:int):
         self.__check_handle(id)
-
-        def set_channel_pos():
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return
-            channel.set_position(pos=offset*1000, unit=TIMEUNIT.MS)  # type: ignore
-
-        try: handle_call_err(set_channel_pos)
-        except: pass
+        self.__invalidate(id)
+        channel:fmod.channel.Channel | None = self.__channels.get(id)
+        if channel is None:
+            return
+        try: channel.set_position(pos=offset*1000, unit=_TIMEUNIT_MS)
+        except FmodError: pass
 
     def set_loop(self, id:int, loop:bool):
         sound:fmod.sound.Sound|None  = self.__check_handle(id)
+        channel:fmod.channel.Channel | None = self.__check_channel(id)
+        if sound is None or channel is None:
+            return
 
-        def set_loop_mode():
-            MODE = fmod_flags.MODE
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(sound is not None) or not safe_assert(channel is not None):
-                return
-            current_pos:int = channel.get_position(unit=TIMEUNIT.MS)  # type: ignore
-            sound.mode = sound.mode | MODE.LOOP_NORMAL if loop else sound.mode & ~MODE.LOOP_NORMAL | MODE.LOOP_OFF  # type: ignore
-            channel.mode = channel.mode | MODE.LOOP_NORMAL if loop else channel.mode & ~MODE.LOOP_NORMAL | MODE.LOOP_OFF  # type: ignore
-            sound.loop_count = -1 if loop else 0  # type: ignore
-            channel.loop_count = -1 if loop else 0  # type: ignore
-            if loop: channel.set_position(pos=current_pos, unit=TIMEUNIT.MS)  # type: ignore
-
-        try: handle_call_err(set_loop_mode)
-        except: pass
+        try:
+            current_pos:int = channel.get_position(unit=_TIMEUNIT_MS)  # type: ignore
+            sound_mode = sound.mode  # type: ignore
+            channel_mode = channel.mode  # type: ignore
+            if loop:
+                sound.mode = sound_mode | _LOOP_NORMAL  # type: ignore
+                channel.mode = channel_mode | _LOOP_NORMAL  # type: ignore
+            else:
+                sound.mode = sound_mode & _LOOP_CLEAR_MASK | _LOOP_OFF  # type: ignore
+                channel.mode = channel_mode & _LOOP_CLEAR_MASK | _LOOP_OFF  # type: ignore
+            loop_count = -1 if loop else 0
+            sound.loop_count = loop_count  # type: ignore
+            channel.loop_count = loop_count  # type: ignore
+            self.__loop_state[id] = loop
+            if loop: channel.set_position(pos=current_pos, unit=_TIMEUNIT_MS)  # type: ignore
+        except FmodError: pass
 
     def get_length(self, id:int) -> int:
         sound:fmod.sound.Sound|None = self.__check_handle(id)
-
-        def get_media_length() -> int:
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(sound is not None) or not safe_assert(channel is not None):
-                return -1
-            return int(sound.get_length(ltype=TIMEUNIT.MS) /1000)  # type: ignore
+        length:int|None = self.__lengths.get(id)
+        if length is not None:
+            return length
+        channel:fmod.channel.Channel | None = self.__check_channel(id)
+        if sound is None or channel is None:
+            return -1
 
         try:
-            return handle_call_err(get_media_length)
-        except Exception as e:
+            length = int(sound.get_length(ltype=_TIMEUNIT_MS) /1000)  # type: ignore
+        except FmodError:
             return -1
+        if length > 0:
+            self.__lengths[id] = length
+        return length
 
     def get_position(self, id:int) -> int:
         self.__check_handle(id)
+        snapshot = self.__snapshot(id)
+        return snapshot[2] if snapshot is not None else self.__read_position(self.__channels.get(id))
 
-        def get_channel_pos() -> int:
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return -1
-            return int(channel.get_position(unit=TIMEUNIT.MS) /1000)  # type: ignore
-
-        try:
-            return handle_call_err(get_channel_pos)
-        except Exception as e:
+    @staticmethod
+    def __read_position(channel:fmod.channel.Channel|None) -> int:
+        if channel is None:
             return -1
+        try: return int(channel.get_position(unit=_TIMEUNIT_MS) /1000)
+        except FmodError: return -1
 
     def get_play_state(self, id:int) -> AVPlaybackState:
-        fmod_state = fmod_enums.OPENSTATE
         sound:fmod.sound.Sound|None  = self.__check_handle(id)
+        snapshot = self.__snapshot(id)
+        return snapshot[1] if snapshot is not None else self.__read_play_state(sound, self.__channels.get(id))
 
-        def get_state() -> AVPlaybackState:
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(sound is not None):
-                return AVPlaybackState.AV_STATE_NOTHING
-            open_state: Structobject| None = None
-
-            try: open_state = sound.open_state  # type: ignore
-            except: return AVPlaybackState.AV_STATE_NOTHING
-            
-            if not safe_assert(open_state is not None):
-                return AVPlaybackState.AV_STATE_NOTHING
-            state:fmod_enums.OPENSTATE | None = getattr(open_state, "state", None)  # type: ignore
-
-            if channel is None and state == fmod_state.BUFFERING: return AVPlaybackState.AV_STATE_BUFFERING
-            elif channel is None and (state == fmod_state.LOADING or state == fmod_state.CONNECTING): return AVPlaybackState.AV_STATE_LOADING
-            elif channel is None and state == fmod_state.READY: return AVPlaybackState.AV_STATE_STOPPED
-
-            if not safe_assert(channel is not None):
-                return AVPlaybackState.AV_STATE_NOTHING
-            if channel.is_playing and channel.paused: return AVPlaybackState.AV_STATE_PAUSED  # type: ignore
-            elif channel.is_playing and not channel.paused: return AVPlaybackState.AV_STATE_PLAYING  # type: ignore
-            else: return AVPlaybackState.AV_STATE_NOTHING
+    @staticmethod
+    def __read_play_state(sound:fmod.sound.Sound|None, channel:fmod.channel.Channel|None) -> AVPlaybackState:
+        if sound is None:
+            return AVPlaybackState.AV_STATE_NOTHING
+        open_state: Structobject| None = None
+
+        try: open_state = sound.open_state  # type: ignore
+        except FmodError: return AVPlaybackState.AV_STATE_NOTHING
+
+        if open_state is None:
+            return AVPlaybackState.AV_STATE_NOTHING
+        state:OPENSTATE | None = getattr(open_state, "state", None)  # type: ignore
 
+        if channel is None:
+            if state == _OPENSTATE_BUFFERING: return AVPlaybackState.AV_STATE_BUFFERING
+            elif state in _LOADING_STATES: return AVPlaybackState.AV_STATE_LOADING
+            elif state == _OPENSTATE_READY: return AVPlaybackState.AV_STATE_STOPPED
+            return AVPlaybackState.AV_STATE_NOTHING
         try:
-            return handle_call_err(get_state)
+            # Each property read is an FMOD call, paused is only read when the channel is playing.
+            if not channel.is_playing: return AVPlaybackState.AV_STATE_NOTHING  # type: ignore
+            return AVPlaybackState.AV_STATE_PAUSED if channel.paused else AVPlaybackState.AV_STATE_PLAYING  # type: ignore
         except FmodError as fmod_err:
-            result = fmod_err.result 
-            return AVPlaybackState.AV_STATE_STOPPED if result == fmod_res.CHANNEL_STOLEN or result == fmod_res.INVALID_HANDLE else AVPlaybackState.AV_STATE_NOTHING
-        except:
-            return AVPlaybackState.AV_STATE_NOTHING
+            result = fmod_err.result
+            return AVPlaybackState.AV_STATE_STOPPED if result in _CHANNEL_GONE else AVPlaybackState.AV_STATE_NOTHING
 
     def get_mute_state(self, id:int) -> AVMuteState:
-        MODE = fmod_flags.MODE
         self.__check_handle(id)
+        snapshot = self.__snapshot(id)
+        return snapshot[4] if snapshot is not None else self.__read_mute_state(self.__channels.get(id))
 
-        def get_mute_state() -> AVMuteState:
-            channel = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return AVMuteState.AV_AUDIO_UNMUTED
-            return AVMuteState.AV_AUDIO_MUTED if channel.mute else AVMuteState.AV_AUDIO_UNMUTED  # type: ignore
-
-        try:
-            return handle_call_err(get_mute_state)
-        except Exception as e:
+    @staticmethod
+    def __read_mute_state(channel:fmod.channel.Channel|None) -> AVMuteState:
+        if channel is None:
             return AVMuteState.AV_AUDIO_UNMUTED
+        try: return AVMuteState.AV_AUDIO_MUTED if channel.mute else AVMuteState.AV_AUDIO_UNMUTED
+        except FmodError: return AVMuteState.AV_AUDIO_UNMUTED
 
     def get_volume(self, id:int) -> float:
         self.__check_handle(id)
+        snapshot = self.__snapshot(id)
+        return snapshot[3] if snapshot is not None else self.__read_volume(self.__channels.get(id))
 
-        def get_channel_volume() -> float:
-            channel:fmod.channel.Channel | None = self.__check_channel(id)
-            if not safe_assert(channel is not None):
-                return -1
-            return channel.volume  # type: ignore
-
-        try:
-            return handle_call_err(get_channel_volume)
-        except Exception as e:
+    @staticmethod
+    def __read_volume(channel:fmod.channel.Channel|None) -> float:
+        if channel is None:
             return -1
+        try: return channel.volume
+        except FmodError: return -1
 
     def get_loop(self, id:int) -> bool:
-        MODE = fmod_flags.MODE
-        sound:fmod.sound.Sound|None = self.__check_handle(id)
-
-        def get_loop_mode():
-            if not safe_assert(sound is not None):
-                return False
-            return True if bool(sound.mode & MODE.LOOP_OFF) else False  # type: ignore
-
-        try:
-            return handle_call_err(get_loop_mode)
-        except:
-            return False
+        self.__check_handle(id)
+        return self.__loop_state.get(id, False)
 
     def apply_filter(self, id:int, filter_id:int, filter_struct:AVFilter):
         self.__check_handle(id)
         if filter_struct is None or not isinstance(filter_struct, FMODAudioFilter):
             raise AVError(AVErrorInfo.INVALID_MEDIA_FILTER)
 
-        if filter_id not in self.__effect_structs or self.__effect_structs[filter_id] is None:
+        effect_struct:AVFilter|None = self.__effect_structs.get(filter_id)
+        if effect_struct is None:
             self.__effect_structs[filter_id] = filter_struct
-        else:
-            self.__effect_structs[filter_id].set_parameters(filter_struct.get_parameters())
+        elif effect_struct is not filter_struct:
+            effect_struct.set_parameters(filter_struct.get_parameters())
 
-        if id not in self.__instance_effects or self.__instance_effects[id] is None:
-            self.__instance_effects[id] = []
-        if filter_id not in self.__instance_effects[id]:
-            self.__instance_effects[id].append(filter_id)
+        instance_effects:Dict[int, None]|None = self.__instance_effects.get(id)
+        if instance_effects is None:
+            instance_effects = self.__instance_effects[id] = {}
+        newly_added:bool = filter_id not in instance_effects
+        instance_effects[filter_id] = None
 
-        def apply_effect():
-            dsp_type:fmod_enums.DSP_TYPE = filter_struct.info["fmod_dsp_type"]
-            dsp_obj:fmod.dsp.DSP = self.__system.create_dsp_by_type(dsp_type)
+        dsp_obj:fmod.dsp.DSP|None = self.__effects.get(filter_id)
+        applied:Set[int]|None = self.__applied_effects.get(id)
+        if dsp_obj is not None and applied is not None and filter_id in applied:
+            return
+
+        with _fmod_errors:
             channel:fmod.channel.Channel|None = self.__check_channel(id)
 
-            if not safe_assert(channel is not None):
+            if channel is None or applied is None:
                 return
-            
-
-            self.__effects[filter_id] = dsp_obj
-            channel.add_dsp(0, dsp_obj)  # type: ignore
-
-            if "fixed_param_vals" in filter_struct.info:
-                for param in filter_struct.info["fixed_param_vals"]:
-                    param_data:Tuple[Enum, Enum, ParameterValue] = filter_struct.info["fixed_param_vals"][param]
-                    param_type, param_val, param_val_type=param_data
-                    if isinstance(param_val_type, int):
-                        dsp_obj.set_parameter_int(param_type, param_val)
-                    elif isinstance(param_val_type, float):
-                        dsp_obj.set_parameter_float(param_type, param_val)
-            for param in filter_struct.get_parameters():
-                self.__set_parameter_value(dsp_obj, filter_struct, param, filter_struct.get_parameters()[param])
-
-
-        if filter_id not in self.__effects:
-            handle_call_err(apply_effect)
-
-    def remove_filter(self, id:int, filter_id):
-        self.__check_handle(id)
 
-        def remove_effect():
-            channel:fmod.channel.Channel|None = self.__check_channel(id)
-            if filter_id not in self.__effects:
+            if dsp_obj is not None:
+                # The DSP outlived a previous channel, attach it to the current one with its parameters intact.
+                channel.add_dsp(0, dsp_obj)  # type: ignore
+                applied.add(filter_id)
                 return
-            dsp_obj:fmod.dsp.DSP = self.__effects[filter_id]
-            
-
-            if not safe_assert(channel is not None):
 
+            dsp_type:fmod_enums.DSP_TYPE = filter_struct.info["fmod_dsp_type"]
+            new_dsp:fmod.dsp.DSP = self.__system.create_dsp_by_type(dsp_type)
+            # The DSP is only recorded and attached once its parameters are in, a rejected filter leaves nothing behind
+            # for play() to re-attach.
+            try:
+                param_dispatch:ParamDispatch = self.__compile_param_dispatch(new_dsp, filter_struct.info["fmod_param_table"])
+                fixed_param_vals:Mapping[str, Tuple[Enum, Any, type]] = filter_struct.info.get("fixed_param_vals", {})
+                for dsp_param_type, param_val, param_val_type in fixed_param_vals.values():
+                    if param_val_type is int:
+                        new_dsp.set_parameter_int(dsp_param_type, param_val)
+                    elif param_val_type is float:
+                        new_dsp.set_parameter_float(dsp_param_type, param_val)
+                self.__apply_parameters(new_dsp, param_dispatch, filter_struct.info["fmod_param_table"], filter_struct.get_parameters())
+                channel.add_dsp(0, new_dsp)  # type: ignore
+            except Exception:
                 try:
-                    dsp_obj.release()
-                except:
+                    new_dsp.release()
+                except FmodError:
                     pass
-            else:
+                if newly_added:
+                    del instance_effects[filter_id]
+                if effect_struct is None:
+                    del self.__effect_structs[filter_id]
+                raise
+            self.__effects[filter_id] = new_dsp
+            self.__param_dispatch[filter_id] = param_dispatch
+            applied.add(filter_id)
 
-                try:
-                    channel.remove_dsp(dsp_obj)  # type: ignore
-                    dsp_obj.release()
-                except FmodError as fmod_err:
+    def remove_filter(self, id:int, filter_id):
+        self.__check_handle(id)
 
-                    if fmod_err.result == fmod_res.INVALID_HANDLE or fmod_err.result == fmod_res.CHANNEL_STOLEN:
-                        try:
-                            dsp_obj.release()
-                        except:
-                            pass
-                    else:
-                        raise
-            
-
-            del self.__effects[filter_id]
-            if filter_id in self.__effect_structs: 
-                self.__effect_structs.pop(filter_id)
-            if id in self.__instance_effects and filter_id in self.__instance_effects[id]: 
-                self.__instance_effects[id].remove(filter_id)
+        channel:fmod.channel.Channel|None = self.__check_channel(id)
+        dsp_obj:fmod.dsp.DSP|None = self.__effects.get(filter_id)
+        if dsp_obj is None:
+            return
 
         try:
-            handle_call_err(remove_effect)
+            with _fmod_errors:
+                if channel is None:
+
+                    try:
+                        dsp_obj.release()
+                    except FmodError:
+                        pass
+                else:
+
+                    try:
+                        channel.remove_dsp(dsp_obj)  # type: ignore
+                        dsp_obj.release()
+                    except FmodError as fmod_err:
+
+                        if fmod_err.result in _CHANNEL_GONE:
+                            try:
+                                dsp_obj.release()
+                            except FmodError:
+                                pass
+                        else:
+                            raise
         except AVError as av_err:
 
-            if "INVALID_HANDLE" not in str(av_err):
+            if av_err.info is not AVErrorInfo.INVALID_HANDLE:
                 raise
 
+        del self.__effects[filter_id]
+        self.__param_dispatch.pop(filter_id, None)
+        self.__effect_structs.pop(filter_id, None)
+        instance_effects:Dict[int, None]|None = self.__instance_effects.get(id)
+        if instance_effects is not None:
+            instance_effects.pop(filter_id, None)
+        applied:Set[int]|None = self.__applied_effects.get(id)
+        if applied is not None:
+            applied.discard(filter_id)
+
     def set_parameter(self, id:int, filter_id:int, parameter_name:str, value:ParameterValue):
         self.__check_handle(id)
 
-        def set_param():
-            dsp_obj:fmod.dsp.DSP = self.__check_dsp(filter_id)
-            if filter_id not in self.__effect_structs or self.__effect_structs[filter_id]is None:
-                raise AVError(AVErrorInfo.INVALID_HANDLE)
-            self.__set_parameter_value(dsp_obj, self.__effect_structs[filter_id], parameter_name, value)
-
-        handle_call_err(set_param)
+        param_dispatch:ParamDispatch|None = self.__param_dispatch.get(filter_id)
+        effect_struct:AVFilter|None = self.__effect_structs.get(filter_id)
+        if param_dispatch is None or effect_struct is None:
+            raise AVError(AVErrorInfo.INVALID_HANDLE)
+        with _fmod_errors:
+            self.__set_parameter_value(param_dispatch, effect_struct, parameter_name, value)
 
     def get_parameter(self, id:int, filter_id:int, parameter_name:str) -> ParameterValue |None:
         self.__check_handle(id)
 
-        def get_param():
-            if filter_id not in self.__effect_structs or self.__effect_structs[filter_id]is None:
-                raise AVError(AVErrorInfo.INVALID_HANDLE)
-            return self.__effect_structs[filter_id].get_parameters()[parameter_name]
-
-        return handle_call_err(get_param)
+        effect_struct:AVFilter|None = self.__effect_structs.get(filter_id)
+        if effect_struct is None:
+            raise AVError(AVErrorInfo.INVALID_HANDLE)
+        with _fmod_errors:
+            return effect_struct.get_parameters()[parameter_name]
 
     def __check_handle(self, id:int) -> fmod.sound.Sound | None:
-        if id not in self.__instances or self.__instances[id] is None or not self.__instances[id]._ptr:
+        sound:fmod.sound.Sound|None = self.__instances.get(id)
+        if sound is None or not sound._ptr:
             raise AVError(AVErrorInfo.INVALID_HANDLE)
-        return self.__instances[id]
+        return sound
 
     def __check_channel(self, id:int) -> fmod.channel.Channel | None:
-        if id not in self.__channels or self.__channels[id] is None:
-            return None
-        return self.__channels[id]
-
-    def __check_dsp(self, dsp_id:int) -> fmod.dsp.DSP:
-        if dsp_id not in self.__effects or self.__effects[dsp_id] is None:
-            raise AVError(AVErrorInfo.INVALID_HANDLE)
-        return self.__effects[dsp_id]
-
-    def __set_parameter_value(self, dsp_obj:fmod.dsp.DSP, effect_struct:AVFilter, parameter_name:str, parameter_value:ParameterValue):
-        if parameter_name not in effect_struct.info["fmod_param_map"]:
+        return self.__channels.get(id)
+
+    @staticmethod
+    def __compile_param_dispatch(dsp_obj:fmod.dsp.DSP, param_table:FMODParamTable) -> ParamDispatch:
+        """Binds each filter parameter to its DSP setter and range once, when the DSP is created."""
+        range_of = param_table.range_of
+        setter_count:int = len(_DSP_SETTER_NAMES)
+        return {
+            name: (param_table.enums[i], param_table.types[i],
+                   getattr(dsp_obj, _DSP_SETTER_NAMES[type_code]) if type_code < setter_count else None,
+                   *range_of(i)[:2])
+            for i, (name, type_code) in enumerate(zip(param_table.names, param_table.type_codes))
+        }
+
+    @staticmethod
+    def __check_parameter_value(param_dispatch:ParamDispatch, parameter_name:str, param_val:ParameterValue):
+        entry = param_dispatch.get(parameter_name)
+        if entry is None:
             raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER)
 
-        param_info:Tuple[Enum, type, Tuple[RangeType, RangeType, RangeType, RangeType]] = effect_struct.info["fmod_param_map"][parameter_name]
-        dsp_param_type:Enum = param_info[0]
-        param_type:type = param_info[1]
-        param_range:Tuple[RangeType, RangeType, RangeType, RangeType] = param_info[2]
-        param_val:ParameterValue = parameter_value
-
-
+        _, param_type, setter, min_val, max_val = entry
         if not isinstance(param_val, param_type):
             raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE)
 
-
-        if isinstance(param_val, (float, int)) and not (param_val >= param_range[0] and param_val <= param_range[1]):
+        if isinstance(param_val, (float, int)) and not (min_val <= param_val <= max_val):
             raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE)
 
-        if param_type is int:
-            dsp_obj.set_parameter_int(dsp_param_type, param_val)
-            effect_struct.set_parameter(parameter_name, param_val)
-        elif param_type is float:
-            dsp_obj.set_parameter_float(dsp_param_type, param_val)
-            effect_struct.set_parameter(parameter_name, param_val)
-        elif param_type is bool:
-            dsp_obj.set_parameter_bool(dsp_param_type, param_val)
-            effect_struct.set_parameter(parameter_name, param_val)
-        else:
+        if setter is None:
             raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_VALUE)
+        return entry
+
+    def __set_parameter_value(self, param_dispatch:ParamDispatch, effect_struct:AVFilter, parameter_name:str, parameter_value:ParameterValue):
+        dsp_param_type, _, setter, _, _ = self.__check_parameter_value(param_dispatch, parameter_name, parameter_value)
+        setter(dsp_param_type, parameter_value)
+        effect_struct.set_parameter(parameter_name, parameter_value)
+
+    def __apply_parameters(self, dsp_obj:fmod.dsp.DSP, param_dispatch:ParamDispatch, param_table:FMODParamTable, parameters:Mapping[str, ParameterValue]):
+        """Pushes a filter's whole parameter set to a new DSP, validated up front and then set one type group at a time."""
+        for name, value in parameters.items():
+            self.__check_parameter_value(param_dispatch, name, value)
+
+        # The values already live in the filter struct, so unlike set_parameter nothing is written back to it.
+        names = param_table.names
+        enums = param_table.enums
+        for setter_name, indices in zip(_DSP_SETTER_NAMES, param_table.by_type):
+            if not indices:
+                continue
+            setter = getattr(dsp_obj, setter_name)
+            for i in indices:
+                value = parameters.get(names[i])
+                if value is not None:
+                    setter(enums[i], value)
 
 
     def get_devices(self) -> int:
-        def get_device_count() -> int:
+        with _fmod_errors:
             return self.__system.num_drivers
 
-        return handle_call_err(get_device_count)
-
     def get_device_info(self, index:int) -> AVDevice:
-        def device_info() -> AVDevice:
+        with _fmod_errors:
             device:Structobject = self.__system.get_driver_info(index)
-            name:str = getattr(device, "name", "none")
-            return AVDevice(AVMediaBackend.AV_BACKEND_FMOD, name)
-
-        return handle_call_err(device_info)
+        name:str = getattr(device, "name", "none")
+        return AVDevice(AVMediaBackend.AV_BACKEND_FMOD, name)
 
     def set_device(self, index:int):
-        def set_device_index():
+        with _fmod_errors:
             self.__system.driver = index
 
-        handle_call_err(set_device_index)
-
     def get_current_device(self) -> int:
-        def get_device() -> int:
+        with _fmod_errors:
             return self.__system.driver
 
-        return handle_call_err(get_device)
-
 
 class FMODAudioPlayer(AVPlayer):
 
@@ -1,406 +1,388 @@
-from typing import Any
+import sys
+
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 from .__AV_Common import *
 from .audio_filter import AudioFilter
 
+_EMPTY_PARAM_MAP: Mapping[str, tuple[str, type, tuple]] = MappingProxyType({})
+_ERR_TYPE = AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE
+_ERR_RANGE = AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE
+
+
+def _format_value(value: ParameterValue) -> str:
+    if type(value) is float:
+        text = repr(value)
+        # repr switches to exponent notation below 1e-4 and from 1e16, mpv gets those spelled out positionally instead.
+        return format(Decimal(text), "f") if "e" in text else text
+    return str(value)
+
+
+def _param_segments(param_map: Mapping[str, tuple[str, type, tuple]], parameters: Mapping[str, ParameterValue]) -> tuple[dict[str, int], list[str]]:
+    """Formats the "mpv_name=value" segment of every mapped parameter, with each parameter's position in the list."""
+    mapped = [name for name in parameters if name in param_map]
+    return {name: i for i, name in enumerate(mapped)}, [f"{param_map[name][0]}={_format_value(parameters[name])}" for name in mapped]
+
+
+def _make_validator(name: str, param_type: type, param_range: tuple) -> Callable[[ParameterValue], None]:
+    """Builds the check for one parameter with its type and range bound in, so validation runs no per-call branching on them."""
+    if param_range and (param_type is int or param_type is float):
+        min_val = param_range[0]
+        max_val = param_range[1]
+
+        def validate(value: ParameterValue):
+            if not isinstance(value, param_type):
+                raise AVError(_ERR_TYPE, f"Parameter {name} must be of type {param_type.__name__}")
+            if not (min_val <= value <= max_val):
+                raise AVError(_ERR_RANGE, f"Parameter {name} must be between {min_val} and {max_val}")
+    else:
+        def validate(value: ParameterValue):
+            if not isinstance(value, param_type):
+                raise AVError(_ERR_TYPE, f"Parameter {name} must be of type {param_type.__name__}")
+    return validate
+
+
+def _interned_backend_info(backend_info: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy of an MPV backend_info with the filter name, syntax and parameter names interned."""
+    info = dict(backend_info)
+    info["mpv_param_map"] = {sys.intern(name): (sys.intern(mpv_name), param_type, param_range)
+                             for name, (mpv_name, param_type, param_range) in backend_info.get("mpv_param_map", {}).items()}
+    for key in ("mpv_filter_name", "effect_syntax"):
+        if key in info:
+            info[key] = sys.intern(info[key])
+    return info
+
+
+def _param_validators(param_map: Mapping[str, tuple[str, type, tuple]]) -> dict[str, Callable[[ParameterValue], None]]:
+    return {name: _make_validator(name, param_type, param_range) for name, (_, param_type, param_range) in param_map.items()}
+
 class MPVAudioFilter(AVFilter):
-    def __init__(self, filter_handle: str, parameters: dict[str, ParameterValue], backend_additional_info: dict[Any, Any]):
+    __slots__ = ("_param_map", "_filter_name", "_effect_syntax", "_cached_construct", "_segment_index", "_segments", "_validators")
+
+    # Validators and preformatted segments of the stock defaults, filled in per subclass at import.
+    _VALIDATORS: dict[str, Callable[[ParameterValue], None]] = {}
+    _SEGMENT_INDEX: dict[str, int] = {}
+    _DEFAULT_SEGMENTS: tuple[str, ...] = ()
+    # effect_syntax -> (format with parameters, format without), unknown syntaxes use the plain "" entry.
+    _SYNTAX_FORMATS: dict[str, tuple[str, str]] = {
+        "lavfi": ("lavfi=[{name}={params}]", "lavfi=[{name}]"),
+        "@rb": ("@rb:{name}={params}", "@rb:{name}"),
+        "": ("{name}={params}", "{name}"),
+    }
+
+    def __init__(self, filter_handle: str, parameters: Mapping[str, ParameterValue], backend_additional_info: Mapping[Any, Any], _stock_defaults: bool = False):
         super().__init__(AVFilterType.AV_TYPE_AUDIO, AVMediaBackend.AV_BACKEND_MPV, filter_handle, parameters, backend_additional_info)
-        self._validate_parameters()
+        # Resolved once here, set_parameter and construct read them on every call.
+        self._param_map: Mapping[str, tuple[str, type, tuple]] = backend_additional_info.get("mpv_param_map") or _EMPTY_PARAM_MAP
+        self._filter_name: str = backend_additional_info.get("mpv_filter_name", "")
+        if not self._filter_name:
+            raise AVError(AVErrorInfo.INVALID_MEDIA_FILTER, "mpv_filter_name is required")
+        self._effect_syntax: str = backend_additional_info.get("effect_syntax", "lavfi")
+        # Last construct() result, cleared whenever a parameter changes.
+        self._cached_construct: str | None = None
+        if _stock_defaults:
+            self._validators: dict[str, Callable[[ParameterValue], None]] = self._VALIDATORS
+            self._segment_index: dict[str, int] = self._SEGMENT_INDEX
+            self._segments: list[str] = list(self._DEFAULT_SEGMENTS)
+        else:
+            self._validators = _param_validators(self._param_map)
+            self._validate_parameters()
+            self._segment_index, self._segments = _param_segments(self._param_map, parameters)
     
-    def _validate_parameters(self):
-        mpv_param_map = self.info.get("mpv_param_map", {})
-        current_params = self.get_parameters()
-        
-        for param_name, param_value in current_params.items():
-            if param_name in mpv_param_map:
-                _, param_type, param_range = mpv_param_map[param_name]
-                
-                if not isinstance(param_value, param_type):
-                    raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE, 
-                                f"Parameter {param_name} must be of type {param_type.__name__}")
-                
-                if param_range and param_type in [int, float]:
-                    min_val, max_val = param_range[:2]
-                    if not (min_val <= param_value <= max_val):
-                        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE,
-                                    f"Parameter {param_name} must be between {min_val} and {max_val}")
+    def _validate_parameter(self, name: str, value: ParameterValue):
+        validate = self._validators.get(name)
+        if validate is not None:
+            validate(value)
+
+    def _validate_parameters(self, parameters: Mapping[str, ParameterValue] | None = None):
+        """Validates the given parameters, or all current ones when None."""
+        for param_name, param_value in (self.get_parameters() if parameters is None else parameters).items():
+            self._validate_parameter(param_name, param_value)
     
     def set_parameter(self, name: str, value: ParameterValue):
-        mpv_param_map = self.info.get("mpv_param_map", {})
-        if name in mpv_param_map:
-            _, param_type, param_range = mpv_param_map[name]
-            
-            if not isinstance(value, param_type):
-                raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE,
-                            f"Parameter {name} must be of type {param_type.__name__}")
-            
-            if param_range and param_type in [int, float]:
-                min_val, max_val = param_range[:2]
-                if not (min_val <= value <= max_val):
-                    raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE,
-                                f"Parameter {name} must be between {min_val} and {max_val}")
-        
+        current = self._parameters.get(name)
+        # UIs re-emit unchanged slider values, type is compared too so 1 still fails validation for a float 1.0.
+        if current == value and type(current) is type(value):
+            return
+        self._validate_parameter(name, value)
+        self._cached_construct = None
         super().set_parameter(name, value)
+        segment = self._segment_index.get(name)
+        if segment is not None:
+            self._segments[segment] = f"{self._param_map[name][0]}={_format_value(value)}"
+
+    def set_parameters(self, parameters: dict[str, ParameterValue] = {}):
+        # Only the overrides need checking, the current values were validated when they were set.
+        self._validate_parameters(parameters)
+        self._cached_construct = None
+        super().set_parameters(parameters)
+        # May add parameters as well as change them, so every segment is rebuilt.
+        self._segment_index, self._segments = _param_segments(self._param_map, self.get_parameters())
     
     def construct(self) -> str:
-        mpv_filter_name = self.info.get("mpv_filter_name", "")
-        effect_syntax = self.info.get("effect_syntax", "lavfi")
-        mpv_param_map = self.info.get("mpv_param_map", {})
-        
-        if not mpv_filter_name:
-            return ""
-        
-        params = self.get_parameters()
-        param_strings = []
-        
-        for param_name, param_value in params.items():
-            if param_name in mpv_param_map:
-                mpv_param_name, _, _ = mpv_param_map[param_name]
-                param_strings.append(f"{mpv_param_name}={param_value}")
-        
-        param_string = ":".join(param_strings)
-        
-        if effect_syntax == "lavfi":
-            if param_string:
-                return f"lavfi=[{mpv_filter_name}={param_string}]"
-            else:
-                return f"lavfi=[{mpv_filter_name}]"
-        elif effect_syntax == "@rb":
-            if param_string:
-                return f"@rb:{mpv_filter_name}={param_string}"
-            else:
-                return f"@rb:{mpv_filter_name}"
-        else:
-            if param_string:
-                return f"{mpv_filter_name}={param_string}"
-            else:
-                return mpv_filter_name
+        if self._cached_construct is not None:
+            return self._cached_construct
 
+        param_string = ":".join(self._segments)
+        with_params, bare = self._SYNTAX_FORMATS.get(self._effect_syntax, self._SYNTAX_FORMATS[""])
+        filter_string = (with_params if param_string else bare).format(name=self._filter_name, params=param_string)
+
+        self._cached_construct = filter_string
+        return filter_string
+
+
+def _make_filter_class(class_name: str, filter_handle: str, backend_info: Mapping[str, Any], default_params: Mapping[str, ParameterValue]) -> type[MPVAudioFilter]:
+    """Builds a stock MPV filter class, validating, interning and formatting its defaults once here rather than per instance."""
+    info = _interned_backend_info(backend_info)
+    info["mpv_param_map"] = MappingProxyType(info["mpv_param_map"])
+    # Shared read-only by every instance, the defaults are only copied by AVFilter on the first write.
+    backend_info = MappingProxyType(info)
+    # Literal keys such as "pitch-scale" are not identifier-like and so not interned by the compiler.
+    default_params = MappingProxyType({sys.intern(name): value for name, value in default_params.items()})
+    stock = MPVAudioFilter(filter_handle, default_params, backend_info)
 
-class MPVEchoFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "in_gain": ("in_gain", float, (0.0, 1.0, 0.05, 0.6)),
-            "out_gain": ("out_gain", float, (0.0, 1.0, 0.05, 0.3)),
-            "delays": ("delays", str, ()),
-            "decays": ("decays", str, ())
-        }
-        
-        parameters = {
-            "in_gain": 0.6,
-            "out_gain": 0.3,
-            "delays": "1000",
-            "decays": "0.5"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "aecho",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Echo", parameters, backend_info)
-
-class MPVReverbFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "dry": ("dry", float, (0.0, 1.0, 0.1, 1.0)),
-            "wet": ("wet", float, (0.0, 1.0, 0.1, 0.3)),
-            "length": ("length", int, (1, 100, 1, 1)),
-            "irnorm": ("irnorm", float, (-1.0, 2.0, 0.1, 1.0)),
-            "irgain": ("irgain", float, (0.0, 1.0, 0.1, 1.0))
-        }
-        
-        parameters = {
-            "dry": 1.0,
-            "wet": 0.3,
-            "length": 1,
-            "irnorm": 1.0,
-            "irgain": 1.0
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "afir",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Reverb", parameters, backend_info)
-
-class MPVLowPassFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "frequency": ("frequency", float, (20.0, 20000.0, 10.0, 500.0)),
-            "poles": ("poles", int, (1, 2, 1, 2)),
-            "width": ("width", float, (0.1, 10.0, 0.1, 0.707)),
-            "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0))
-        }
-        
-        parameters = {
-            "frequency": 500.0,
-            "poles": 2,
-            "width": 0.707,
-            "mix": 1.0
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "lowpass",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Low Pass", parameters, backend_info)
-
-class MPVHighPassFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "frequency": ("frequency", float, (20.0, 20000.0, 10.0, 3000.0)),
-            "poles": ("poles", int, (1, 2, 1, 2)),
-            "width": ("width", float, (0.1, 10.0, 0.1, 0.707)),
-            "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0))
-        }
-        
-        parameters = {
-            "frequency": 3000.0,
-            "poles": 2,
-            "width": 0.707,
-            "mix": 1.0
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "highpass",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("High Pass", parameters, backend_info)
-
-class MPVCompressorFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "level_in": ("level_in", float, (0.015625, 64.0, 0.1, 1.0)),
-            "threshold": ("threshold", float, (0.00097563, 1.0, 0.01, 0.125)),
-            "ratio": ("ratio", float, (1.0, 20.0, 0.1, 2.0)),
-            "attack": ("attack", float, (0.01, 2000.0, 1.0, 20.0)),
-            "release": ("release", float, (0.01, 9000.0, 1.0, 250.0)),
-            "makeup": ("makeup", float, (1.0, 64.0, 0.1, 1.0)),
-            "knee": ("knee", float, (1.0, 8.0, 0.1, 2.82843)),
-            "detection": ("detection", str, ()),
-            "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0))
-        }
-        
-        parameters = {
-            "level_in": 1.0,
-            "threshold": 0.125,
-            "ratio": 2.0,
-            "attack": 20.0,
-            "release": 250.0,
-            "makeup": 1.0,
-            "knee": 2.82843,
-            "detection": "rms",
-            "mix": 1.0
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "acompressor",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Compressor", parameters, backend_info)
-
-class MPVFlangerFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "delay": ("delay", float, (0.0, 30.0, 0.1, 0.0)),
-            "depth": ("depth", float, (0.0, 10.0, 0.1, 2.0)),
-            "regen": ("regen", float, (-95.0, 95.0, 1.0, 0.0)),
-            "width": ("width", float, (0.0, 100.0, 1.0, 71.0)),
-            "speed": ("speed", float, (0.1, 10.0, 0.1, 0.5)),
-            "shape": ("shape", str, ()),
-            "phase": ("phase", float, (0.0, 100.0, 1.0, 25.0)),
-            "interp": ("interp", str, ())
-        }
-        
-        parameters = {
-            "delay": 0.0,
-            "depth": 2.0,
-            "regen": 0.0,
-            "width": 71.0,
-            "speed": 0.5,
-            "shape": "sinusoidal",
-            "phase": 25.0,
-            "interp": "linear"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "flanger",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Flanger", parameters, backend_info)
-
-class MPVChorusFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "in_gain": ("in_gain", float, (0.0, 1.0, 0.05, 0.4)),
-            "out_gain": ("out_gain", float, (0.0, 1.0, 0.05, 0.4)),
-            "delays": ("delays", str, ()),
-            "decays": ("decays", str, ()),
-            "speeds": ("speeds", str, ()),
-            "depths": ("depths", str, ())
-        }
-        
-        parameters = {
-            "in_gain": 0.4,
-            "out_gain": 0.4,
-            "delays": "55",
-            "decays": "0.4",
-            "speeds": "0.25",
-            "depths": "2"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "chorus",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Chorus", parameters, backend_info)
-
-class MPVPitchShiftFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "pitch-scale": ("pitch-scale", float, (1.0, 100.0, 1.0, 1.0)),
-            "engine": ("engine", str, ("faster", "finer"))
-        }
-        
-        parameters = {
-            "pitch-scale": 1.0,
-            "engine": "finer"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "rubberband",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "@rb:"
-        }
-        
-        super().__init__("Pitch Shift", parameters, backend_info)
-
-class MPVTempoScaleFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "scale": ("scale", int, (1, 25, 1, 1)),
-            "speed": ("speed", str, ("pitch", "none"))
-        }
-        
-        parameters = {
-            "scale": 1,
-            "speed": "none"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "scaletempo",
-            "mpv_param_map": mpv_param_map
-        }
-        
-        super().__init__("Tempo Scale", parameters, backend_info)
-
-class MPVLimiterFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "level_in": ("level_in", float, (0.0, 64.0, 0.1, 1.0)),
-            "level_out": ("level_out", float, (0.0, 64.0, 0.1, 1.0)),
-            "limit": ("limit", float, (0.0, 1.0, 0.01, 1.0)),
-            "attack": ("attack", float, (0.1, 1000.0, 0.1, 5.0)),
-            "release": ("release", float, (1.0, 9000.0, 1.0, 50.0)),
-            "asc": ("asc", str, ()),
-            "asc_level": ("asc_level", float, (0.0, 1.0, 0.1, 0.5)),
-            "level": ("level", str, ())
-        }
-        
-        parameters = {
-            "level_in": 1.0,
-            "level_out": 1.0,
-            "limit": 1.0,
-            "attack": 5.0,
-            "release": 50.0,
-            "asc": "false",
-            "asc_level": 0.5,
-            "level": "true"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "alimiter",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Limiter", parameters, backend_info)
-
-class MPVBandPassFilter(MPVAudioFilter):
-    def __init__(self):
-        mpv_param_map = {
-            "frequency": ("frequency", float, (20.0, 20000.0, 10.0, 3000.0)),
-            "width": ("width", float, (0.1, 1000.0, 0.1, 100.0)),
-            "csg": ("csg", int, (0, 1, 1, 0)),
-            "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0)),
-            "width_type": ("width_type", str, ())
-        }
-        
-        parameters = {
-            "frequency": 3000.0,
-            "width": 100.0,
-            "csg": 0,
-            "mix": 1.0,
-            "width_type": "h"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "bandpass",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Band Pass", parameters, backend_info)
-
-class MPVGateFilter(MPVAudioFilter):
     def __init__(self):
-        mpv_param_map = {
-            "level_in": ("level_in", float, (0.015625, 64.0, 0.1, 1.0)),
-            "mode": ("mode", str, ()),
-            "range": ("range", float, (0.0, 1.0, 0.01, 0.06125)),
-            "threshold": ("threshold", float, (0.0, 1.0, 0.01, 0.125)),
-            "ratio": ("ratio", float, (1.0, 9000.0, 0.1, 2.0)),
-            "attack": ("attack", float, (0.01, 9000.0, 1.0, 20.0)),
-            "release": ("release", float, (0.01, 9000.0, 1.0, 250.0)),
-            "makeup": ("makeup", float, (1.0, 64.0, 0.1, 1.0)),
-            "knee": ("knee", float, (1.0, 8.0, 0.1, 2.828427125)),
-            "detection": ("detection", str, ()),
-            "link": ("link", str, ())
-        }
-        
-        parameters = {
-            "level_in": 1.0,
-            "mode": "downward",
-            "range": 0.06125,
-            "threshold": 0.125,
-            "ratio": 2.0,
-            "attack": 20.0,
-            "release": 250.0,
-            "makeup": 1.0,
-            "knee": 2.828427125,
-            "detection": "rms",
-            "link": "average"
-        }
-        
-        backend_info = {
-            "mpv_filter_name": "agate",
-            "mpv_param_map": mpv_param_map,
-            "effect_syntax": "lavfi"
-        }
-        
-        super().__init__("Gate", parameters, backend_info)
-        
\ No newline at end of file
+        MPVAudioFilter.__init__(self, filter_handle, default_params, backend_info, _stock_defaults=True)
+
+    return type(class_name, (MPVAudioFilter,), {
+        "__slots__": (),
+        "__init__": __init__,
+        "__module__": __name__,
+        "_VALIDATORS": stock._validators,
+        "_SEGMENT_INDEX": stock._segment_index,
+        "_DEFAULT_SEGMENTS": tuple(stock._segments),
+    })
+
+
+# Every stock filter differs only in its backend info and defaults, so the classes are generated rather than written out.
+MPVEchoFilter = _make_filter_class("MPVEchoFilter", "Echo", {
+    "mpv_filter_name": "aecho",
+    "mpv_param_map": {
+        "in_gain": ("in_gain", float, (0.0, 1.0, 0.05, 0.6)),
+        "out_gain": ("out_gain", float, (0.0, 1.0, 0.05, 0.3)),
+        "delays": ("delays", str, ()),
+        "decays": ("decays", str, ())
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "in_gain": 0.6,
+    "out_gain": 0.3,
+    "delays": "1000",
+    "decays": "0.5"
+})
+
+MPVReverbFilter = _make_filter_class("MPVReverbFilter", "Reverb", {
+    "mpv_filter_name": "afir",
+    "mpv_param_map": {
+        "dry": ("dry", float, (0.0, 1.0, 0.1, 1.0)),
+        "wet": ("wet", float, (0.0, 1.0, 0.1, 0.3)),
+        "length": ("length", int, (1, 100, 1, 1)),
+        "irnorm": ("irnorm", float, (-1.0, 2.0, 0.1, 1.0)),
+        "irgain": ("irgain", float, (0.0, 1.0, 0.1, 1.0))
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "dry": 1.0,
+    "wet": 0.3,
+    "length": 1,
+    "irnorm": 1.0,
+    "irgain": 1.0
+})
+
+MPVLowPassFilter = _make_filter_class("MPVLowPassFilter", "Low Pass", {
+    "mpv_filter_name": "lowpass",
+    "mpv_param_map": {
+        "frequency": ("frequency", float, (20.0, 20000.0, 10.0, 500.0)),
+        "poles": ("poles", int, (1, 2, 1, 2)),
+        "width": ("width", float, (0.1, 10.0, 0.1, 0.707)),
+        "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0))
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "frequency": 500.0,
+    "poles": 2,
+    "width": 0.707,
+    "mix": 1.0
+})
+
+MPVHighPassFilter = _make_filter_class("MPVHighPassFilter", "High Pass", {
+    "mpv_filter_name": "highpass",
+    "mpv_param_map": {
+        "frequency": ("frequency", float, (20.0, 20000.0, 10.0, 3000.0)),
+        "poles": ("poles", int, (1, 2, 1, 2)),
+        "width": ("width", float, (0.1, 10.0, 0.1, 0.707)),
+        "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0))
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "frequency": 3000.0,
+    "poles": 2,
+    "width": 0.707,
+    "mix": 1.0
+})
+
+MPVCompressorFilter = _make_filter_class("MPVCompressorFilter", "Compressor", {
+    "mpv_filter_name": "acompressor",
+    "mpv_param_map": {
+        "level_in": ("level_in", float, (0.015625, 64.0, 0.1, 1.0)),
+        "threshold": ("threshold", float, (0.00097563, 1.0, 0.01, 0.125)),
+        "ratio": ("ratio", float, (1.0, 20.0, 0.1, 2.0)),
+        "attack": ("attack", float, (0.01, 2000.0, 1.0, 20.0)),
+        "release": ("release", float, (0.01, 9000.0, 1.0, 250.0)),
+        "makeup": ("makeup", float, (1.0, 64.0, 0.1, 1.0)),
+        "knee": ("knee", float, (1.0, 8.0, 0.1, 2.82843)),
+        "detection": ("detection", str, ()),
+        "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0))
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "level_in": 1.0,
+    "threshold": 0.125,
+    "ratio": 2.0,
+    "attack": 20.0,
+    "release": 250.0,
+    "makeup": 1.0,
+    "knee": 2.82843,
+    "detection": "rms",
+    "mix": 1.0
+})
+
+MPVFlangerFilter = _make_filter_class("MPVFlangerFilter", "Flanger", {
+    "mpv_filter_name": "flanger",
+    "mpv_param_map": {
+        "delay": ("delay", float, (0.0, 30.0, 0.1, 0.0)),
+        "depth": ("depth", float, (0.0, 10.0, 0.1, 2.0)),
+        "regen": ("regen", float, (-95.0, 95.0, 1.0, 0.0)),
+        "width": ("width", float, (0.0, 100.0, 1.0, 71.0)),
+        "speed": ("speed", float, (0.1, 10.0, 0.1, 0.5)),
+        "shape": ("shape", str, ()),
+        "phase": ("phase", float, (0.0, 100.0, 1.0, 25.0)),
+        "interp": ("interp", str, ())
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "delay": 0.0,
+    "depth": 2.0,
+    "regen": 0.0,
+    "width": 71.0,
+    "speed": 0.5,
+    "shape": "sinusoidal",
+    "phase": 25.0,
+    "interp": "linear"
+})
+
+MPVChorusFilter = _make_filter_class("MPVChorusFilter", "Chorus", {
+    "mpv_filter_name": "chorus",
+    "mpv_param_map": {
+        "in_gain": ("in_gain", float, (0.0, 1.0, 0.05, 0.4)),
+        "out_gain": ("out_gain", float, (0.0, 1.0, 0.05, 0.4)),
+        "delays": ("delays", str, ()),
+        "decays": ("decays", str, ()),
+        "speeds": ("speeds", str, ()),
+        "depths": ("depths", str, ())
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "in_gain": 0.4,
+    "out_gain": 0.4,
+    "delays": "55",
+    "decays": "0.4",
+    "speeds": "0.25",
+    "depths": "2"
+})
+
+MPVPitchShiftFilter = _make_filter_class("MPVPitchShiftFilter", "Pitch Shift", {
+    "mpv_filter_name": "rubberband",
+    "mpv_param_map": {
+        "pitch-scale": ("pitch-scale", float, (1.0, 100.0, 1.0, 1.0)),
+        "engine": ("engine", str, ("faster", "finer"))
+    },
+    "effect_syntax": "@rb:"
+}, {
+    "pitch-scale": 1.0,
+    "engine": "finer"
+})
+
+MPVTempoScaleFilter = _make_filter_class("MPVTempoScaleFilter", "Tempo Scale", {
+    "mpv_filter_name": "scaletempo",
+    "mpv_param_map": {
+        "scale": ("scale", int, (1, 25, 1, 1)),
+        "speed": ("speed", str, ("pitch", "none"))
+    }
+}, {
+    "scale": 1,
+    "speed": "none"
+})
+
+MPVLimiterFilter = _make_filter_class("MPVLimiterFilter", "Limiter", {
+    "mpv_filter_name": "alimiter",
+    "mpv_param_map": {
+        "level_in": ("level_in", float, (0.0, 64.0, 0.1, 1.0)),
+        "level_out": ("level_out", float, (0.0, 64.0, 0.1, 1.0)),
+        "limit": ("limit", float, (0.0, 1.0, 0.01, 1.0)),
+        "attack": ("attack", float, (0.1, 1000.0, 0.1, 5.0)),
+        "release": ("release", float, (1.0, 9000.0, 1.0, 50.0)),
+        "asc": ("asc", str, ()),
+        "asc_level": ("asc_level", float, (0.0, 1.0, 0.1, 0.5)),
+        "level": ("level", str, ())
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "level_in": 1.0,
+    "level_out": 1.0,
+    "limit": 1.0,
+    "attack": 5.0,
+    "release": 50.0,
+    "asc": "false",
+    "asc_level": 0.5,
+    "level": "true"
+})
+
+MPVBandPassFilter = _make_filter_class("MPVBandPassFilter", "Band Pass", {
+    "mpv_filter_name": "bandpass",
+    "mpv_param_map": {
+        "frequency": ("frequency", float, (20.0, 20000.0, 10.0, 3000.0)),
+        "width": ("width", float, (0.1, 1000.0, 0.1, 100.0)),
+        "csg": ("csg", int, (0, 1, 1, 0)),
+        "mix": ("mix", float, (0.0, 1.0, 0.1, 1.0)),
+        "width_type": ("width_type", str, ())
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "frequency": 3000.0,
+    "width": 100.0,
+    "csg": 0,
+    "mix": 1.0,
+    "width_type": "h"
+})
+
+MPVGateFilter = _make_filter_class("MPVGateFilter", "Gate", {
+    "mpv_filter_name": "agate",
+    "mpv_param_map": {
+        "level_in": ("level_in", float, (0.015625, 64.0, 0.1, 1.0)),
+        "mode": ("mode", str, ()),
+        "range": ("range", float, (0.0, 1.0, 0.01, 0.06125)),
+        "threshold": ("threshold", float, (0.0, 1.0, 0.01, 0.125)),
+        "ratio": ("ratio", float, (1.0, 9000.0, 0.1, 2.0)),
+        "attack": ("attack", float, (0.01, 9000.0, 1.0, 20.0)),
+        "release": ("release", float, (0.01, 9000.0, 1.0, 250.0)),
+        "makeup": ("makeup", float, (1.0, 64.0, 0.1, 1.0)),
+        "knee": ("knee", float, (1.0, 8.0, 0.1, 2.828427125)),
+        "detection": ("detection", str, ()),
+        "link": ("link", str, ())
+    },
+    "effect_syntax": "lavfi"
+}, {
+    "level_in": 1.0,
+    "mode": "downward",
+    "range": 0.06125,
+    "threshold": 0.125,
+    "ratio": 2.0,
+    "attack": 20.0,
+    "release": 250.0,
+    "makeup": 1.0,
+    "knee": 2.828427125,
+    "detection": "rms",
+    "link": "average"
+})
@@ -1,49 +1,126 @@
 import mpv
 import os
-from typing import Dict, Any, Union, List, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Dict, Any, Union, List, Callable, Tuple, TypeVar
 from .__AV_Common import *
 from .__AV_Instance import AVMediaInstance
 from .__AV_Interface import AVMediaInterface
 from .__AV_Player import AVPlayer
 from .mpv_audio_filter import MPVAudioFilter
 
-def handle_mpv_error(call_func: Callable) -> Any:
-    try:
-        return call_func()
-    except mpv.PropertyUnavailableError as e:
-        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER, f"Property unavailable: {str(e)}")
-    except AttributeError as e:
-        if "mpv property does not exist" in str(e) or "does not exist" in str(e):
-            raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER, f"Property not available: {str(e)}")
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"Attribute error: {str(e)}")
-    except mpv.ShutdownError:
-        raise AVError(AVErrorInfo.INVALID_HANDLE, "MPV core has been shutdown")
-    except RuntimeError as e:
-        if "loading failed" in str(e).lower():
-            raise AVError(AVErrorInfo.FILE_NOTFOUND, f"File loading failed: {str(e)}")
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"Runtime error: {str(e)}")
-    except SystemError as e:
-        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER, f"Command error: {str(e)}")
-    except TypeError as e:
-        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE, f"Type error: {str(e)}")
-    except ValueError as e:
-        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_VALUE, f"Value error: {str(e)}")
-    except Exception as e:
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"Unknown error: {str(e)}")
+# Quiet period after the last set_parameter before the filter chain is written, one mpv graph rebuild per slider burst.
+FILTER_CHAIN_DEBOUNCE = 0.03
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+# Exception type -> (error info, message template), looked up along the raised type's MRO so subclasses map like their bases.
+_ERR_MAP: Dict[type, Tuple[AVErrorInfo, str]] = {
+    mpv.PropertyUnavailableError: (AVErrorInfo.INVALID_FILTER_PARAMETER, "Property unavailable: {}"),
+    mpv.ShutdownError: (AVErrorInfo.INVALID_HANDLE, "MPV core has been shutdown"),
+    AttributeError: (AVErrorInfo.UNKNOWN_ERROR, "Attribute error: {}"),
+    RuntimeError: (AVErrorInfo.UNKNOWN_ERROR, "Runtime error: {}"),
+    SystemError: (AVErrorInfo.INVALID_FILTER_PARAMETER, "Command error: {}"),
+    TypeError: (AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE, "Type error: {}"),
+    ValueError: (AVErrorInfo.INVALID_FILTER_PARAMETER_VALUE, "Value error: {}"),
+    Exception: (AVErrorInfo.UNKNOWN_ERROR, "Unknown error: {}"),
+}
+
+def _mpv_av_error(error: Exception) -> AVError:
+    message = str(error)
+    for error_type in type(error).__mro__:
+        entry = _ERR_MAP.get(error_type)
+        if entry is not None:
+            break
+    if error_type is AttributeError and "does not exist" in message:
+        entry = (AVErrorInfo.INVALID_FILTER_PARAMETER, "Property not available: {}")
+    elif error_type is RuntimeError and "loading failed" in message.lower():
+        entry = (AVErrorInfo.FILE_NOTFOUND, "File loading failed: {}")
+    return AVError(entry[0], entry[1].format(message))
+
+def handle_mpv_errors(method: _Method) -> _Method:
+    """Decorator translating the mpv exceptions raised by a method into AVError, AVErrors raised by the method pass through as is."""
+    @wraps(method)
+    def wrapper(*args, **kw):
+        try:
+            return method(*args, **kw)
+        except AVError:
+            raise
+        except Exception as e:
+            raise _mpv_av_error(e)
+    return wrapper  # type: ignore[return-value]
+
+# Properties pushed by mpv's event thread into the interface instead of read back per call, with their values until the first change.
+_OBSERVED_PROPERTIES: Dict[str, Any] = {
+    "pause": False,
+    "time-pos": None,
+    "duration": None,
+    "volume": None,
+    "mute": False,
+    "audio-device-list": None,
+    "audio-device": None,
+    "loop-file": None,
+}
+
+def _device_indices(audio_devices: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Maps each audio device name to its first index in mpv's device list."""
+    indices: Dict[str, int] = {}
+    for i, device in enumerate(audio_devices):
+        indices.setdefault(device['name'], i)
+    return indices
+
+# Sidecar subtitle extensions in order of preference.
+_SUBTITLE_FORMATS: Tuple[str, ...] = ("idx", "sub", "srt", "rt", "ssa", "ass", "mks", "vtt", "sup", "scc", "smi", "lrc", "pgs")
+_SUBTITLE_RANKS: Dict[str, int] = {extension: rank for rank, extension in enumerate(_SUBTITLE_FORMATS)}
 
 class MPVMediaInterface(AVMediaInterface):
+    __slots__ = ("__current_path", "__mpv", "__current_id", "__applied_filters", "__filter_fragments", "__is_initialized",
+                 "__stopped", "__end_reached", "__observed", "__device_indices", "__get_property", "__set_property",
+                 "__command", "__worker", "__chain_wakeup", "__chain_thread", "__chain_generation",
+                 "__chain_pending", "__core_ready", "__init_error",
+                 "__loop_on", "__load_queued", "__command_error")
     
     def __init__(self) -> None:
         super().__init__(AVMediaType.AV_TYPE_VIDEO, AVMediaBackend.AV_BACKEND_MPV)
-        self.__instances:dict[int, str] = {}
+        # mpv plays one file at a time, so only the path or URL of __current_id is kept.
+        self.__current_path:str | None = None
         self.__mpv: mpv.MPV | None = None
         self.__current_id: int | None = None
         self.__applied_filters: Dict[int, MPVAudioFilter] = {}
+        # UTF-8 encoded construct() output of each applied filter, in application order, only refreshed for the filter that changed.
+        # python-mpv passes bytes values to libmpv as is, so the joined chain is never re-encoded.
+        self.__filter_fragments: Dict[int, bytes] = {}
         self.__is_initialized = False
         self.__stopped = False
         self.__end_reached = False
+        self.__observed:Dict[str, Any] = dict(_OBSERVED_PROPERTIES)
+        self.__device_indices:Dict[str, int] | None = None
+        # get_loop's answer, worked out when loop-file changes, None until mpv first reports it.
+        self.__loop_on:bool | None = None
+        # Set while a loadfile from load_file/load_url is queued and not yet followed by play().
+        self.__load_queued = False
+        # mpv's raw property accessors, bound once so calls skip the attribute-name translation of MPV.__getattr__/__setattr__.
+        self.__get_property:Callable[[str], Any] | None = None
+        self.__set_property:Callable[[str, Any], None] | None = None
+        self.__command:Callable[..., Any] | None = None
+        # Runs loadfile and stop, which can block on the mpv core, off the caller's thread in submission order.
+        self.__worker:ThreadPoolExecutor | None = None
+        # (instance id, error) of the last queued command that failed, raised by the next checked call for that instance.
+        self.__command_error:Tuple[int, AVError] | None = None
+        # Guards __filter_fragments and every af write, and wakes the debounce thread when set_parameter changes a fragment.
+        self.__chain_wakeup = threading.Condition()
+        self.__chain_thread:threading.Thread | None = None
+        # Bumped by each change or direct af write, a debounced commit only runs if it is unchanged after the quiet period.
+        self.__chain_generation = 0
+        self.__chain_pending = False
+        # Cleared while init() builds the mpv core on a background thread, set again once it is up or has failed.
+        self.__core_ready = threading.Event()
+        self.__core_ready.set()
+        self.__init_error:str | None = None
 
     def init(self, *args, **kw):
+        self.__core_ready.wait()
         try:
             config = kw.get("config", {})
             window = kw.get("window", None)
@@ -53,31 +130,79 @@ class MPVMediaInterface(AVMediaInterface):
             
             config.setdefault('ytdl', True)
             config.setdefault('input_default_bindings', True)
-            
+        except Exception as e:
+            raise AVError(AVErrorInfo.INITIALIZATION_ERROR, f"Failed to initialize MPV: {str(e)}")
+        
+        # Creating the core and registering its callbacks can stall for hundreds of milliseconds,
+        # init() returns right away and the first call needing mpv waits in _check_initialized.
+        self.__init_error = None
+        self.__core_ready.clear()
+        threading.Thread(target=self.__create_core, args=(config, kw.get("ytdl_path", None)), name="mpv-init", daemon=True).start()
+
+    def __create_core(self, config: Dict[str, Any], ytdl_path: str | None):
+        try:
             self.__mpv = mpv.MPV(**config)
+            self.__get_property = self.__mpv._get_property
+            self.__set_property = self.__mpv._set_property
+            self.__command = self.__mpv.command
+            self.__worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mpv-cmd")
+            self.__chain_thread = threading.Thread(target=self.__run_chain_commits, name="mpv-af", daemon=True)
+            self.__chain_thread.start()
+            self.__observed = dict(_OBSERVED_PROPERTIES)
+            self.__device_indices = None
+            self.__loop_on = None
+            handlers = {"audio-device-list": self.__on_device_list_change, "loop-file": self.__on_loop_change}
+            for property_name in _OBSERVED_PROPERTIES:
+                self.__mpv.observe_property(property_name, handlers.get(property_name, self.__on_property_change))
             
-            ytdl_path = kw.get("ytdl_path", None)
             if ytdl_path:
-                def set_ytdl_path():
-                    assert self.__mpv is not None
-                    self.__mpv.script_opts["ytdl_hook-ytdl_path"] = ytdl_path
-                handle_mpv_error(set_ytdl_path)
+                self.__mpv.script_opts["ytdl_hook-ytdl_path"] = ytdl_path
             
             self.__is_initialized = True
             self.__stopped = False
             self.__end_reached = False
             
         except Exception as e:
-            raise AVError(AVErrorInfo.INITIALIZATION_ERROR, f"Failed to initialize MPV: {str(e)}")
+            self.__init_error = f"Failed to initialize MPV: {str(e)}"
+        finally:
+            self.__core_ready.set()
+
+    def __on_property_change(self, name: str, value: Any):
+        self.__observed[name] = value
+
+    def __on_device_list_change(self, name: str, value: Any):
+        self.__device_indices = _device_indices(value or [])
+        self.__observed[name] = value
+
+    def __on_loop_change(self, name: str, value: Any):
+        self.__loop_on = value == "inf"
+        self.__observed[name] = value
 
     def free(self):
+        self.__core_ready.wait()
+        self.__init_error = None
         if self.__mpv is not None:
             try:
+                self.__stop_chain_thread()
+                if self.__worker is not None:
+                    self.__worker.shutdown(wait=True)
+                    self.__worker = None
                 if not self.__mpv.core_shutdown:
                     self.__mpv.terminate()
                 self.__mpv = None
+                self.__get_property = None
+                self.__set_property = None
+                self.__command = None
                 self.__current_id = None
+                self.__current_path = None
                 self.__applied_filters.clear()
+                with self.__chain_wakeup:
+                    self.__filter_fragments.clear()
+                self.__observed = dict(_OBSERVED_PROPERTIES)
+                self.__device_indices = None
+                self.__loop_on = None
+                self.__load_queued = False
+                self.__command_error = None
                 self.__is_initialized = False
                 self.__stopped = False
                 self.__end_reached = False
@@ -85,6 +210,10 @@ class MPVMediaInterface(AVMediaInterface):
                 pass
 
     def _check_initialized(self):
+        if not self.__core_ready.is_set():
+            self.__core_ready.wait()
+        if self.__init_error is not None:
+            raise AVError(AVErrorInfo.INITIALIZATION_ERROR, self.__init_error)
         if not self.__is_initialized or self.__mpv is None:
             raise AVError(AVErrorInfo.UNINITIALIZED, "MPV not initialized")
         if self.__mpv.core_shutdown:
@@ -94,231 +223,268 @@ class MPVMediaInterface(AVMediaInterface):
         self._check_initialized()
         if self.__current_id != id:
             raise AVError(AVErrorInfo.INVALID_HANDLE, f"Invalid instance ID: {id}")
+        command_error = self.__command_error
+        if command_error is not None:
+            self.__command_error = None
+            if command_error[0] == id:
+                raise command_error[1]
+
+    def __submit(self, id: int, command: Callable[..., Any], *args: Any):
+        """Queues command on the worker, a failure is kept and raised as AVError by the next call for instance id."""
+        assert self.__worker is not None
+        def record_failure(future):
+            error = future.exception()
+            if error is not None:
+                self.__command_error = (id, error if isinstance(error, AVError) else _mpv_av_error(error))
+        self.__worker.submit(command, *args).add_done_callback(record_failure)
 
     def get_mpv_instance(self):
         self._check_initialized()
         return self.__mpv
 
+    @handle_mpv_errors
     def load_file(self, id: int, path: str):
         self._check_initialized()
-
-        def loadfile():
-            assert self.__mpv is not None
-            self.__mpv.command("loadfile", path)
+        assert self.__command is not None and self.__worker is not None
         
         if path and is_path(path) and os.path.exists(path):
             self.__current_id = id
-            self.__instances[id] = path
+            self.__current_path = path
             self.__stopped = False
             self.__end_reached = False
+            self.__reset_track_properties()
+            self.__load_queued = True
             self._load_subtitles(path)
-            handle_mpv_error(loadfile)
+            self.__command_error = None
+            self.__submit(id, self.__command, "loadfile", path)
 
+    @handle_mpv_errors
     def load_url(self, id: int, url: str):
         self._check_initialized()
-        
-        def loadurl():
-            assert self.__mpv is not None
-            self.__mpv.command("loadfile", url)
+        assert self.__command is not None and self.__worker is not None
         
         if url and is_url(url):
             self.__current_id = id
-            self.__instances[id] = url
+            self.__current_path = url
             self.__stopped = False
             self.__end_reached = False
-            handle_mpv_error(loadurl)
-
+            self.__reset_track_properties()
+            self.__load_queued = True
+            self.__command_error = None
+            self.__submit(id, self.__command, "loadfile", url)
+
+    def __reset_track_properties(self):
+        # The previous track's values stay observed until mpv reports the new file, they must not be read as this track's.
+        observed = self.__observed
+        observed["duration"] = None
+        observed["time-pos"] = None
+
+    @handle_mpv_errors
     def _load_subtitles(self, path: str):
-        subtitle_formats = ["idx", "sub", "srt", "rt", "ssa", "ass", "mks", "vtt", "sup", "scc", "smi", "lrc", "pgs"]
+        assert self.__mpv is not None
         dir_path = os.path.dirname(path)
         filename = os.path.splitext(os.path.basename(path))[0]
         
-        for format in subtitle_formats:
-            subtitle_path = os.path.join(dir_path, f"{filename}.{format}")
-            if os.path.exists(subtitle_path):
-                def add_subtitle():
-                    assert self.__mpv is not None
-                    self.__mpv.sub_add(subtitle_path)
-                handle_mpv_error(add_subtitle)
-                break
-
+        # One directory listing instead of a stat per format, the earliest format in _SUBTITLE_FORMATS still wins.
+        subtitle_path = None
+        best_rank = len(_SUBTITLE_FORMATS)
+        try:
+            with os.scandir(dir_path or os.curdir) as entries:
+                for entry in entries:
+                    stem, _, extension = entry.name.rpartition(".")
+                    if stem != filename:
+                        continue
+                    rank = _SUBTITLE_RANKS.get(extension.lower())
+                    if rank is not None and rank < best_rank and entry.is_file():
+                        subtitle_path, best_rank = entry.path, rank
+        except OSError:
+            return
+        if subtitle_path is not None:
+            self.__mpv.sub_add(subtitle_path)
+
+    @handle_mpv_errors
     def release(self, id: int):
         if self.__current_id == id:
             self._check_initialized()
-            
-            def stop():
-                assert self.__mpv is not None
-                self.__mpv.stop()
-            handle_mpv_error(stop)
+            assert self.__mpv is not None and self.__worker is not None
+            self.__submit(id, self.__mpv.stop)
             self.__current_id = None
+            self.__current_path = None
+            self.__reset_track_properties()
+            self.__load_queued = False
             self.__applied_filters.clear()
+            with self.__chain_wakeup:
+                self.__cancel_chain_commit()
+                self.__filter_fragments.clear()
             self.__stopped = True
             self.__end_reached = False
 
+    @handle_mpv_errors
     def play(self, id: int):
         self._check_instance(id)
+        assert self.__command is not None and self.__set_property is not None and self.__worker is not None
         
-        def resume():
-            assert self.__mpv is not None
-            if self.__end_reached or self.__mpv.time_pos is None:
-                self.__mpv.command("loadfile", self.__instances[id])
-                self.__end_reached = False
-                self.__stopped = False
-            self.__mpv.pause = False
-        
+        # A stopped file is unloaded even if the queued stop has not run or been reported yet, so it is reloaded either way.
+        was_stopped = self.__stopped
         self.__stopped = False
-        handle_mpv_error(resume)
+        # A freshly queued loadfile has no time-pos yet either, it is not reloaded on top of itself.
+        load_queued = self.__load_queued
+        self.__load_queued = False
+        if was_stopped or self.__end_reached or (self.__observed["time-pos"] is None and not load_queued):
+            self.__submit(id, self.__command, "loadfile", self.__current_path)
+            self.__end_reached = False
+            self.__stopped = False
+        self.__set_property("pause", False)
+        self.__observed["pause"] = False
 
+    @handle_mpv_errors
     def pause(self, id: int):
         self._check_instance(id)
+        assert self.__set_property is not None
+        self.__set_property("pause", True)
+        self.__observed["pause"] = True
         
-        def pause_play():
-            assert self.__mpv is not None
-            self.__mpv.pause = True
-        handle_mpv_error(pause_play)
-
+    @handle_mpv_errors
     def mute(self, id: int):
         self._check_instance(id)
+        assert self.__set_property is not None
+        muted = not self.__observed["mute"]
+        self.__set_property("mute", muted)
+        self.__observed["mute"] = muted
         
-        def toggle_mute():
-            assert self.__mpv is not None
-            self.__mpv.mute = not self.__mpv.mute
-        handle_mpv_error(toggle_mute)
-
+    @handle_mpv_errors
     def unmute(self, id: int):
         self._check_instance(id)
+        assert self.__set_property is not None
+        self.__set_property("mute", False)
+        self.__observed["mute"] = False
         
-        def unmute_audio():
-            assert self.__mpv is not None
-            self.__mpv.mute = False
-        handle_mpv_error(unmute_audio)
-
+    @handle_mpv_errors
     def stop(self, id: int):
         self._check_instance(id)
-        
-        def halt():
-            assert self.__mpv is not None
-            self.__mpv.stop()
-        
-        handle_mpv_error(halt)
+        assert self.__mpv is not None and self.__worker is not None
+        self.__submit(id, self.__mpv.stop)
         self.__stopped = True
         self.__end_reached = False
 
+    @handle_mpv_errors
     def set_volume(self, id: int, offset: float):
         self._check_instance(id)
+        assert self.__set_property is not None
+        self.__set_property("volume", offset)
+        self.__observed["volume"] = offset
         
-        def set_vol():
-            assert self.__mpv is not None
-            self.__mpv.volume = offset
-        handle_mpv_error(set_vol)
-
+    @handle_mpv_errors
     def set_position(self, id: int, offset: int):
         self._check_instance(id)
+        assert self.__mpv is not None
+        self.__mpv.seek(offset, "absolute")
         
-        def seek():
-            assert self.__mpv is not None
-            self.__mpv.seek(offset, "absolute")
-        handle_mpv_error(seek)
-
+    @handle_mpv_errors
     def set_loop(self, id: int, loop: bool):
         self._check_instance(id)
-        loop_value = "inf" if loop else "no"
-        
-        def set_loop_mode():
-            assert self.__mpv is not None
-            self.__mpv.loop = loop_value
-        handle_mpv_error(set_loop_mode)
+        assert self.__set_property is not None
+        self.__set_property("loop", "inf" if loop else "no")
+        self.__loop_on = loop
 
     def get_length(self, id: int) -> int:
         self._check_instance(id)
-        
-        def get_duration():
-            assert self.__mpv is not None
-            return self.__mpv.duration
-        duration = handle_mpv_error(get_duration)
+        duration = self.__observed["duration"]
         return int(duration) if duration is not None else 0
 
     def get_position(self, id: int) -> int:
         self._check_instance(id)
-        
-        def get_time():
-            assert self.__mpv is not None
-            return self.__mpv.time_pos
-        pos = handle_mpv_error(get_time)
+        pos = self.__observed["time-pos"]
         return int(pos) if pos is not None else 0
 
     def get_play_state(self, id: int) -> AVPlaybackState:
         self._check_instance(id)
-        try:
-            def get_pause():
-                assert self.__mpv is not None
-                return self.__mpv.pause
-            def get_time_pos():
-                assert self.__mpv is not None
-                return self.__mpv.time_pos
-            def get_duration():
-                assert self.__mpv is not None
-                return self.__mpv.duration
-            
-            if self.__stopped:
-                return AVPlaybackState.AV_STATE_STOPPED
-            
-            is_paused = handle_mpv_error(get_pause)
-            time_pos = handle_mpv_error(get_time_pos)
-            duration = handle_mpv_error(get_duration)
-            
-            if duration is not None and time_pos is not None:
-                if time_pos >= duration - 0.1:
-                    self.__end_reached = True
-                    return AVPlaybackState.AV_STATE_NOTHING
-            elif time_pos is None and duration is not None:
+        if self.__stopped:
+            return AVPlaybackState.AV_STATE_STOPPED
+        
+        observed = self.__observed
+        time_pos = observed["time-pos"]
+        duration = observed["duration"]
+        
+        if duration is not None and time_pos is not None:
+            if time_pos >= duration - 0.1:
                 self.__end_reached = True
                 return AVPlaybackState.AV_STATE_NOTHING
-            
-            if is_paused:
-                return AVPlaybackState.AV_STATE_PAUSED
-            else:
-                return AVPlaybackState.AV_STATE_PLAYING
-                
-        except AVError:
+        elif time_pos is None and duration is not None:
+            self.__end_reached = True
             return AVPlaybackState.AV_STATE_NOTHING
+        
+        if observed["pause"]:
+            return AVPlaybackState.AV_STATE_PAUSED
+        else:
+            return AVPlaybackState.AV_STATE_PLAYING
 
     def get_mute_state(self, id: int) -> AVMuteState:
         self._check_instance(id)
-        
-        def get_mute():
-            assert self.__mpv is not None
-            return self.__mpv.mute
-        muted = handle_mpv_error(get_mute)
+        muted = self.__observed["mute"]
         return AVMuteState.AV_AUDIO_MUTED if muted else AVMuteState.AV_AUDIO_UNMUTED
 
     def get_volume(self, id: int) -> float:
         self._check_instance(id)
-        
-        def get_vol():
-            assert self.__mpv is not None
-            return self.__mpv.volume
-        volume = handle_mpv_error(get_vol)
+        volume = self.__observed["volume"]
         return float(volume) if volume is not None else 0.0
 
+    @handle_mpv_errors
     def get_loop(self, id: int) -> bool:
         self._check_instance(id)
-        
-        def get_loop_state():
-            assert self.__mpv is not None
-            return self.__mpv.loop
-        loop_val = handle_mpv_error(get_loop_state)
-        return loop_val == "inf" if loop_val is not None else False
-
-    def _rebuild_filter_chain(self):
-        filter_strings = []
-        
-        for filter_obj in self.__applied_filters.values():
-            filter_string = filter_obj.construct()
-            if filter_string:
-                filter_strings.append(filter_string)
-        
-        return ",".join(filter_strings) if filter_strings else ""
+        loop_on = self.__loop_on
+        if loop_on is None:
+            assert self.__get_property is not None
+            loop_on = self.__get_property("loop") == "inf"
+        return loop_on
+
+    def _rebuild_filter_chain(self) -> bytes:
+        with self.__chain_wakeup:
+            return b",".join([fragment for fragment in self.__filter_fragments.values() if fragment])
+
+    @handle_mpv_errors
+    def __set_filter_chain(self):
+        assert self.__set_property is not None
+        # Called with __chain_wakeup held, so a debounced commit cannot write a stale chain over this one.
+        self.__set_property("af", self._rebuild_filter_chain())
+
+    def __schedule_chain_commit(self):
+        # Called with __chain_wakeup held.
+        self.__chain_generation += 1
+        self.__chain_pending = True
+        self.__chain_wakeup.notify()
+
+    def __cancel_chain_commit(self):
+        # Called with __chain_wakeup held.
+        self.__chain_generation += 1
+        self.__chain_pending = False
+
+    def __run_chain_commits(self):
+        thread = threading.current_thread()
+        with self.__chain_wakeup:
+            while self.__chain_thread is thread:
+                if not self.__chain_pending:
+                    self.__chain_wakeup.wait()
+                    continue
+                generation = self.__chain_generation
+                self.__chain_wakeup.wait(FILTER_CHAIN_DEBOUNCE)
+                if generation != self.__chain_generation or not self.__chain_pending or self.__chain_thread is not thread:
+                    continue
+                self.__chain_pending = False
+                try:
+                    self.__set_filter_chain()
+                except AVError:
+                    # The file may have been released since the change was scheduled.
+                    pass
+
+    def __stop_chain_thread(self):
+        thread = self.__chain_thread
+        with self.__chain_wakeup:
+            self.__cancel_chain_commit()
+            self.__chain_thread = None
+            self.__chain_wakeup.notify()
+        if thread is not None:
+            thread.join()
 
     def apply_filter(self, id: int, filter_id: int, filter_struct: AVFilter):
         self._check_instance(id)
@@ -326,41 +492,32 @@ class MPVMediaInterface(AVMediaInterface):
             raise AVError(AVErrorInfo.INVALID_MEDIA_FILTER, "Filter must be MPVAudioFilter")
         
         self.__applied_filters[filter_id] = filter_struct
-        
-        filter_chain = self._rebuild_filter_chain()
-        
-        def set_af_chain():
-            assert self.__mpv is not None
-            self.__mpv.af = filter_chain
-        
-        handle_mpv_error(set_af_chain)
+        fragment = filter_struct.construct().encode()
+        with self.__chain_wakeup:
+            self.__filter_fragments[filter_id] = fragment
+            self.__cancel_chain_commit()
+            self.__set_filter_chain()
 
     def remove_filter(self, id: int, filter_id: int):
         self._check_instance(id)
         if filter_id in self.__applied_filters:
             del self.__applied_filters[filter_id]
-            
-            filter_chain = self._rebuild_filter_chain()
-            
-            def set_af_chain():
-                assert self.__mpv is not None
-                self.__mpv.af = filter_chain
-            
-            handle_mpv_error(set_af_chain)
+            with self.__chain_wakeup:
+                del self.__filter_fragments[filter_id]
+                self.__cancel_chain_commit()
+                self.__set_filter_chain()
 
     def set_parameter(self, id: int, filter_id: int, parameter_name: str, value: ParameterValue):
         self._check_instance(id)
         if filter_id in self.__applied_filters:
             filter_struct = self.__applied_filters[filter_id]
             filter_struct.set_parameter(parameter_name, value)
-            
-            filter_chain = self._rebuild_filter_chain()
-            
-            def set_af_chain():
-                assert self.__mpv is not None
-                self.__mpv.af = filter_chain
-            
-            handle_mpv_error(set_af_chain)
+            fragment = filter_struct.construct().encode()
+            # Re-emitted slider values leave the rendered filter as is, mpv's graph is not rebuilt for them.
+            with self.__chain_wakeup:
+                if fragment != self.__filter_fragments.get(filter_id, fragment):
+                    self.__filter_fragments[filter_id] = fragment
+                    self.__schedule_chain_commit()
 
     def get_parameter(self, id: int, filter_id: int, parameter_name: str) -> ParameterValue | None:
         self._check_instance(id)
@@ -368,59 +525,56 @@ class MPVMediaInterface(AVMediaInterface):
             return self.__applied_filters[filter_id].get_parameter(parameter_name)
         return None
 
+    @handle_mpv_errors
+    def __audio_devices(self) -> List[Dict[str, Any]]:
+        audio_devices = self.__observed["audio-device-list"]
+        # None until mpv delivers the first change event right after init.
+        if audio_devices is None:
+            assert self.__get_property is not None
+            audio_devices = self.__get_property("audio-device-list")
+        return audio_devices or []
+
     def get_devices(self) -> int:
         self._check_initialized()
-        
-        def get_device_list():
-            assert self.__mpv is not None
-            return self.__mpv.audio_device_list
-        audio_devices = handle_mpv_error(get_device_list) or []
-        return len(audio_devices)
+        return len(self.__audio_devices())
 
     def get_device_info(self, index: int) -> AVDevice:
         self._check_initialized()
-        
-        def get_device_list():
-            assert self.__mpv is not None
-            return self.__mpv.audio_device_list
-        audio_devices = handle_mpv_error(get_device_list) or []
+        audio_devices = self.__audio_devices()
         if 0 <= index < len(audio_devices):
             device = audio_devices[index]
             return AVDevice(AVMediaBackend.AV_BACKEND_MPV, device.get('description', device.get('name', 'Unknown')))
         raise IndexError("Device index out of range")
 
+    @handle_mpv_errors
+    def __select_audio_device(self, device_name: str):
+        assert self.__set_property is not None
+        self.__set_property("audio-device", device_name)
+        self.__observed["audio-device"] = device_name
+
     def set_device(self, index: int):
         self._check_initialized()
-        
-        def get_device_list():
-            assert self.__mpv is not None
-            return self.__mpv.audio_device_list
-        def set_audio_device(device_name):
-            assert self.__mpv is not None
-            self.__mpv.audio_device = device_name
-        audio_devices = handle_mpv_error(get_device_list) or []
+        audio_devices = self.__audio_devices()
         if 0 <= index < len(audio_devices):
-            device_name = audio_devices[index]['name']
-            handle_mpv_error(lambda: set_audio_device(device_name))
+            self.__select_audio_device(audio_devices[index]['name'])
         else:
             raise IndexError("Device index out of range")
 
+    @handle_mpv_errors
+    def __current_audio_device(self) -> str:
+        current_device = self.__observed["audio-device"]
+        if current_device is None:
+            assert self.__get_property is not None
+            current_device = self.__get_property("audio-device")
+        return current_device
+
     def get_current_device(self) -> int:
         self._check_initialized()
-        
-        def get_audio_device():
-            assert self.__mpv is not None
-            return self.__mpv.audio_device
-        def get_device_list():
-            assert self.__mpv is not None
-            return self.__mpv.audio_device_list
-        current_device = handle_mpv_error(get_audio_device)
-        audio_devices = handle_mpv_error(get_device_list) or []
-        
-        for i, device in enumerate(audio_devices):
-            if device['name'] == current_device:
-                return i
-        return 0
+        current_device = self.__current_audio_device()
+        device_indices = self.__device_indices
+        if device_indices is None:
+            device_indices = _device_indices(self.__audio_devices())
+        return device_indices.get(current_device, 0)
 
 
 class MPVVideoPlayer(AVPlayer):
@@ -450,64 +604,56 @@ class MPVVideoPlayer(AVPlayer):
         self._primary_instance.load_url(url)
         return self._primary_instance
 
+    @handle_mpv_errors
     def set_window(self, window):
-        def set_wid():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                mpv_instance._set_property("wid", str(int(window)))
-        handle_mpv_error(set_wid)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            mpv_instance._set_property("wid", str(int(window)))
 
+    @handle_mpv_errors
     def forward(self, offset):
-        def seek_forward():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                mpv_instance.seek(+offset, reference='relative')
-        handle_mpv_error(seek_forward)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            mpv_instance.seek(+offset, reference='relative')
 
+    @handle_mpv_errors
     def backward(self, offset):
-        def seek_backward():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                mpv_instance.seek(-offset, reference='relative')
-        handle_mpv_error(seek_backward)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            mpv_instance.seek(-offset, reference='relative')
 
+    @handle_mpv_errors
     def set_volume_relative(self, direction, offset):
-        def adjust_volume():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                current_volume = mpv_instance.volume
-                if direction == "up":
-                    mpv_instance.volume = current_volume + offset
-                elif direction == "down":
-                    mpv_instance.volume = current_volume - offset
-        handle_mpv_error(adjust_volume)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            current_volume = mpv_instance.volume
+            if direction == "up":
+                mpv_instance.volume = current_volume + offset
+            elif direction == "down":
+                mpv_instance.volume = current_volume - offset
 
 
+    @handle_mpv_errors
     def set_fullscreen(self, state):
-        def toggle_fullscreen():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                mpv_instance.fullscreen = state
-        handle_mpv_error(toggle_fullscreen)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            mpv_instance.fullscreen = state
 
+    @handle_mpv_errors
     def get_fullscreen(self):
-        def get_fs_state():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                return mpv_instance.fullscreen
-            return False
-        return handle_mpv_error(get_fs_state)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            return mpv_instance.fullscreen
+        return False
 
+    @handle_mpv_errors
     def set_playback_speed(self, speed):
-        def set_speed():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                mpv_instance.speed = speed
-        handle_mpv_error(set_speed)
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            mpv_instance.speed = speed
 
+    @handle_mpv_errors
     def set_resolution(self, width, height):
-        def set_res():
-            mpv_instance = self.__mpv_interface.get_mpv_instance()
-            if mpv_instance:
-                mpv_instance.vf = f"scale={width}:{height}"
-        handle_mpv_error(set_res)
\ No newline at end of file
+        mpv_instance = self.__mpv_interface.get_mpv_instance()
+        if mpv_instance:
+            mpv_instance.vf = f"scale={width}:{height}"
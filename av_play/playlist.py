@@ -1,14 +1,109 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import List, Dict, Optional, Union, Type, Any, Callable, Iterable
+from itertools import chain, compress
+from operator import attrgetter
+from typing import List, Dict, Optional, Union, Type, Any, Callable, Iterable, Iterator, Mapping, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
+import io
 import os
 import json
-import re
-import urllib.parse
-import urllib.request
+import threading
+import time
+
+from .__playlist_scan import scan_m3u, scan_pls
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_URL_PREFIXES = ('http://', 'https://')
+_XSPF_TRACK = '{http://xspf.org/ns/0/}track'
+_XSPF_LOCATION = '{http://xspf.org/ns/0/}location'
+_XSPF_TITLE = '{http://xspf.org/ns/0/}title'
+_XSPF_CREATOR = '{http://xspf.org/ns/0/}creator'
+_XSPF_ALBUM = '{http://xspf.org/ns/0/}album'
+_XSPF_DURATION = '{http://xspf.org/ns/0/}duration'
+_CORE_KEYS = frozenset(("location", "title", "artist", "album", "duration"))
+_PATH_SEPARATORS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+_URL_CACHE_SIZE = 32
+_etree: Any = None
+_etree_is_lxml = False
+_url_cache: 'OrderedDict[Tuple[str, str], Tuple[float, str]]' = OrderedDict()
+_url_cache_lock = threading.Lock()
+
+
+def _et() -> Any:
+    """Return lxml.etree when installed, else xml.etree.ElementTree, importing it on first use."""
+    global _etree, _etree_is_lxml
+    if _etree is None:
+        try:
+            from lxml import etree
+            _etree_is_lxml = True
+        except ImportError:
+            import xml.etree.ElementTree as etree
+            etree.register_namespace('', 'http://xspf.org/ns/0/')
+        _etree = etree
+    return _etree
+
+
+def _cached_url_content(url: str, encoding: str, max_age: float) -> Optional[str]:
+    """Return the content fetched for url within the last max_age seconds, if any."""
+    key = (url, encoding)
+    with _url_cache_lock:
+        cached = _url_cache.get(key)
+        if cached is None or time.monotonic() - cached[0] > max_age:
+            return None
+        
+        _url_cache.move_to_end(key)
+        return cached[1]
+
+
+def _cache_url_content(url: str, encoding: str, content: str) -> None:
+    key = (url, encoding)
+    with _url_cache_lock:
+        _url_cache[key] = (time.monotonic(), content)
+        _url_cache.move_to_end(key)
+        if len(_url_cache) > _URL_CACHE_SIZE:
+            _url_cache.popitem(last=False)
+
+
+def _recording(lines: Iterable[str], received: List[str]) -> Iterator[str]:
+    """Pass lines through as they arrive, keeping each one in received."""
+    for line in lines:
+        received.append(line)
+        yield line
+
+
+def _json_loads(content: str) -> Any:
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def _json_dumps(data: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    
+    return json.dumps(data, indent=2)
+
+
+def _file_extension(location: str) -> str:
+    """Return the extension os.path.splitext would report, without the dot."""
+    head, dot, ext = location.rpartition('.')
+    if not dot or any(sep in ext for sep in _PATH_SEPARATORS):
+        return ""
+    
+    for sep in _PATH_SEPARATORS:
+        head = head.rpartition(sep)[2]
+    
+    return ext if head.strip('.') else ""
 
 
 class PlaylistFormat(Enum):
@@ -20,7 +115,7 @@ class PlaylistFormat(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistEntry:
     location: str
     title: Optional[str] = None
@@ -47,56 +142,29 @@ class PlaylistParser(ABC):
     
     @staticmethod
     def normalize_path(path: str) -> str:
-        if re.match(r'^https?://', path):
+        if path.startswith(_URL_PREFIXES):
             return path
         
         return os.path.normpath(path)
     
     @staticmethod
     def is_url(path: str) -> bool:
-        return bool(re.match(r'^https?://', path))
+        return path.startswith(_URL_PREFIXES)
 
 
 class M3UParser(PlaylistParser):
     @classmethod
     def parse(cls, content: str) -> List[PlaylistEntry]:
-        entries = []
-        lines = content.splitlines()
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if not line or line.startswith('#') and not line.startswith('#EXTINF:'):
-                i += 1
-                continue
-            
-            title = None
-            duration = None
-            
-            if line.startswith('#EXTINF:'):
-                extinf_parts = line[8:].split(',', 1)
-                try:
-                    duration = int(float(extinf_parts[0]))
-                except ValueError:
-                    duration = None
-                
-                if len(extinf_parts) > 1:
-                    title = extinf_parts[1].strip()
-                
-                i += 1
-                if i >= len(lines):
-                    break
-                    
-                line = lines[i].strip()
-            
-            if line and not line.startswith('#'):
-                location = cls.normalize_path(line)
-                entries.append(PlaylistEntry(location=location, title=title, duration=duration))
-            
-            i += 1
-        
-        return entries
+        normalize_path = cls.normalize_path
+        return [PlaylistEntry(location=normalize_path(location), title=title, duration=duration)
+                for location, title, duration in scan_m3u(content.splitlines())]
+    
+    @classmethod
+    def parse_stream(cls, lines: Iterable[str]) -> Iterator[PlaylistEntry]:
+        """Yield entries as lines arrive, so a remote playlist is parsed while it downloads."""
+        normalize_path = cls.normalize_path
+        for location, title, duration in scan_m3u(lines):
+            yield PlaylistEntry(location=normalize_path(location), title=title, duration=duration)
     
     @classmethod
     def serialize(cls, entries: List[PlaylistEntry], original_content: Optional[str] = None) -> str:
@@ -124,62 +192,9 @@ class M3U8Parser(M3UParser):
 class PLSParser(PlaylistParser):
     @classmethod
     def parse(cls, content: str) -> List[PlaylistEntry]:
-        entries = []
-        lines = content.splitlines()
-        
-        file_map = {}
-        title_map = {}
-        length_map = {}
-        
-        num_entries = 0
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.lower().startswith('[playlist]'):
-                continue
-                
-            if '=' not in line:
-                continue
-                
-            key, value = line.split('=', 1)
-            key = key.strip().lower()
-            value = value.strip()
-            
-            if key.startswith('file'):
-                try:
-                    index = int(key[4:])
-                    file_map[index] = cls.normalize_path(value)
-                    num_entries = max(num_entries, index)
-                except ValueError:
-                    pass
-                    
-            elif key.startswith('title'):
-                try:
-                    index = int(key[5:])
-                    title_map[index] = value
-                except ValueError:
-                    pass
-                    
-            elif key.startswith('length'):
-                try:
-                    index = int(key[6:])
-                    try:
-                        length_map[index] = int(float(value)) if value != '-1' else None
-                    except ValueError:
-                        length_map[index] = None
-                except ValueError:
-                    pass
-        
-        for i in range(1, num_entries + 1):
-            if i in file_map:
-                title = title_map.get(i)
-                duration = length_map.get(i)
-                entries.append(PlaylistEntry(location=file_map[i], title=title, duration=duration))
-        
-        return entries
+        normalize_path = cls.normalize_path
+        return [PlaylistEntry(location=normalize_path(location), title=title, duration=duration)
+                for location, title, duration in scan_pls(content)]
     
     @classmethod
     def serialize(cls, entries: List[PlaylistEntry], original_content: Optional[str] = None) -> str:
@@ -202,31 +217,50 @@ class PLSParser(PlaylistParser):
 
 
 class XSPFParser(PlaylistParser):
+    @classmethod
+    def _iter_tracks(cls, content: str) -> Iterable[Any]:
+        """Stream completed <track> elements, discarding each one after it is consumed."""
+        ET = _et()
+
+        if _etree_is_lxml:
+            for _, track in ET.iterparse(io.BytesIO(content.encode('utf-8')), events=('end',), tag=_XSPF_TRACK, encoding='utf-8',
+                                         resolve_entities=False, no_network=True):
+                yield track
+                track.clear()
+                while track.getprevious() is not None:
+                    del track.getparent()[0]
+            return
+
+        parser = ET.XMLPullParser(events=('end',))
+        parser.feed(content)
+        parser.close()
+        for _, element in parser.read_events():
+            if element.tag == _XSPF_TRACK:
+                yield element
+                element.clear()
+
     @classmethod
     def parse(cls, content: str) -> List[PlaylistEntry]:
         try:
-            import xml.etree.ElementTree as ET
             entries = []
             
-            root = ET.fromstring(content)
-            ns = {'ns': 'http://xspf.org/ns/0/'}
-            
-            for track in root.findall('.//ns:track', ns):
-                location_elem = track.find('ns:location', ns)
-                title_elem = track.find('ns:title', ns)
-                creator_elem = track.find('ns:creator', ns)
-                album_elem = track.find('ns:album', ns)
-                duration_elem = track.find('ns:duration', ns)
+            for track in cls._iter_tracks(content):
+                # One pass over the children; the first element of each tag wins, as with find()
+                fields = {}
+                for child in track:
+                    fields.setdefault(child.tag, child.text)
                 
-                location = cls.normalize_path(location_elem.text.strip()) if location_elem is not None and location_elem.text else ""
-                title = title_elem.text if title_elem is not None and title_elem.text else None
-                artist = creator_elem.text if creator_elem is not None and creator_elem.text else None
-                album = album_elem.text if album_elem is not None and album_elem.text else None
+                location = fields.get(_XSPF_LOCATION)
+                location = cls.normalize_path(location.strip()) if location else ""
+                title = fields.get(_XSPF_TITLE) or None
+                artist = fields.get(_XSPF_CREATOR) or None
+                album = fields.get(_XSPF_ALBUM) or None
                 
                 duration = None
-                if duration_elem is not None and duration_elem.text:
+                duration_text = fields.get(_XSPF_DURATION)
+                if duration_text:
                     try:
-                        duration = int(int(duration_elem.text) / 1000)  # Convert from milliseconds to seconds
+                        duration = int(int(duration_text) / 1000)  # Convert from milliseconds to seconds
                     except ValueError:
                         duration = None
                 
@@ -246,20 +280,25 @@ class XSPFParser(PlaylistParser):
     @classmethod
     def serialize(cls, entries: List[PlaylistEntry], original_content: Optional[str] = None) -> str:
         try:
-            import xml.etree.ElementTree as ET
-            import xml.dom.minidom as minidom
-            
-            ET.register_namespace('', 'http://xspf.org/ns/0/')
+            ET = _et()
+            lxml = _etree_is_lxml
             
             root = None
             if original_content:
                 try:
-                    root = ET.fromstring(original_content)
+                    if lxml:
+                        parser = ET.XMLParser(remove_blank_text=True, encoding='utf-8', resolve_entities=False, no_network=True)
+                        root = ET.fromstring(original_content.encode('utf-8'), parser)
+                    else:
+                        root = ET.fromstring(original_content)
                 except:
                     root = None
             
             if root is None:
-                root = ET.Element('{http://xspf.org/ns/0/}playlist')
+                if lxml:
+                    root = ET.Element('{http://xspf.org/ns/0/}playlist', nsmap={None: 'http://xspf.org/ns/0/'})
+                else:
+                    root = ET.Element('{http://xspf.org/ns/0/}playlist')
                 ET.SubElement(root, '{http://xspf.org/ns/0/}title').text = "Playlist"
                 ET.SubElement(root, '{http://xspf.org/ns/0/}creator').text = "Media Library"
                 ET.SubElement(root, '{http://xspf.org/ns/0/}info')
@@ -293,48 +332,40 @@ class XSPFParser(PlaylistParser):
                     duration = ET.SubElement(track, '{http://xspf.org/ns/0/}duration')
                     duration.text = str(entry.duration * 1000)  # Convert to milliseconds
             
-            xml_str = ET.tostring(root, encoding='unicode')
-            dom = minidom.parseString(xml_str)
-            formatted_xml = dom.toprettyxml(indent='  ')
+            if lxml:
+                return ET.tostring(root, pretty_print=True, xml_declaration=True, encoding='UTF-8').decode('utf-8')
             
-            return formatted_xml
+            ET.indent(root, space='  ')
+            return "<?xml version='1.0' encoding='UTF-8'?>\n" + ET.tostring(root, encoding='unicode') + '\n'
         except Exception as e:
             return f"<?xml version='1.0' encoding='UTF-8'?>\n<playlist xmlns='http://xspf.org/ns/0/'>\n  <title>Playlist</title>\n  <trackList>\n  </trackList>\n</playlist>"
 
 
 class JSONParser(PlaylistParser):
+    @classmethod
+    def _entry_from_dict(cls, track: Dict[str, Any]) -> PlaylistEntry:
+        return PlaylistEntry(
+            location=cls.normalize_path(track["location"]),
+            title=track.get("title"),
+            artist=track.get("artist"),
+            album=track.get("album"),
+            duration=track.get("duration"),
+            metadata={k: v for k, v in track.items() if k not in _CORE_KEYS}
+        )
+    
     @classmethod
     def parse(cls, content: str) -> List[PlaylistEntry]:
         try:
-            data = json.loads(content)
-            entries = []
+            data = _json_loads(content)
             
             if isinstance(data, dict) and "tracks" in data and isinstance(data["tracks"], list):
-                for track in data["tracks"]:
-                    if isinstance(track, dict) and "location" in track:
-                        entry = PlaylistEntry(
-                            location=cls.normalize_path(track["location"]),
-                            title=track.get("title"),
-                            artist=track.get("artist"),
-                            album=track.get("album"),
-                            duration=track.get("duration"),
-                            metadata={k: v for k, v in track.items() if k not in ["location", "title", "artist", "album", "duration"]}
-                        )
-                        entries.append(entry)
+                tracks = data["tracks"]
             elif isinstance(data, list):
-                for track in data:
-                    if isinstance(track, dict) and "location" in track:
-                        entry = PlaylistEntry(
-                            location=cls.normalize_path(track["location"]),
-                            title=track.get("title"),
-                            artist=track.get("artist"),
-                            album=track.get("album"),
-                            duration=track.get("duration"),
-                            metadata={k: v for k, v in track.items() if k not in ["location", "title", "artist", "album", "duration"]}
-                        )
-                        entries.append(entry)
+                tracks = data
+            else:
+                return []
             
-            return entries
+            return [cls._entry_from_dict(track) for track in tracks if isinstance(track, dict) and "location" in track]
         except:
             return []
     
@@ -344,7 +375,7 @@ class JSONParser(PlaylistParser):
         
         if original_content:
             try:
-                data = json.loads(original_content)
+                data = _json_loads(original_content)
                 if isinstance(data, list):
                     structure_type = "array"
             except:
@@ -374,7 +405,7 @@ class JSONParser(PlaylistParser):
                 
                 tracks.append(track)
             
-            return json.dumps(tracks, indent=2)
+            return _json_dumps(tracks)
         else:
             playlist = {"tracks": []}
             
@@ -400,48 +431,52 @@ class JSONParser(PlaylistParser):
                 
                 playlist["tracks"].append(track)
             
-            return json.dumps(playlist, indent=2)
+            return _json_dumps(playlist)
 
 
 class Playlist:
+    # Shared read-only tables; register_parser copies them on the first write.
+    _PARSERS: Mapping[PlaylistFormat, Type[PlaylistParser]] = MappingProxyType({
+        PlaylistFormat.M3U: M3UParser,
+        PlaylistFormat.M3U8: M3U8Parser,
+        PlaylistFormat.XSPF: XSPFParser,
+        PlaylistFormat.PLS: PLSParser,
+        PlaylistFormat.JSON: JSONParser
+    })
+    _CUSTOM_PARSERS: Mapping[str, Type[PlaylistParser]] = MappingProxyType({})
+    _EXT_FORMAT: Mapping[str, PlaylistFormat] = MappingProxyType({
+        'm3u8': PlaylistFormat.M3U8,
+        'm3u': PlaylistFormat.M3U,
+        'xspf': PlaylistFormat.XSPF,
+        'pls': PlaylistFormat.PLS,
+        'json': PlaylistFormat.JSON
+    })
+    
     def __init__(self, title: Optional[str] = None):
         self.title = title or "New Playlist"
         self.entries: List[PlaylistEntry] = []
         self._original_content: Optional[str] = None
         self._format: Optional[PlaylistFormat] = None
-        self._parsers: Dict[PlaylistFormat, Type[PlaylistParser]] = {
-            PlaylistFormat.M3U: M3UParser,
-            PlaylistFormat.M3U8: M3U8Parser,
-            PlaylistFormat.XSPF: XSPFParser,
-            PlaylistFormat.PLS: PLSParser,
-            PlaylistFormat.JSON: JSONParser
-        }
-        self._custom_parsers: Dict[str, Type[PlaylistParser]] = {}
+        self._parsers: Mapping[PlaylistFormat, Type[PlaylistParser]] = self._PARSERS
+        self._custom_parsers: Mapping[str, Type[PlaylistParser]] = self._CUSTOM_PARSERS
     
     def register_parser(self, format_type: Union[PlaylistFormat, str], parser_class: Type[PlaylistParser]) -> None:
         if isinstance(format_type, PlaylistFormat):
+            if type(self._parsers) is not dict:
+                self._parsers = dict(self._parsers)
             self._parsers[format_type] = parser_class
         else:
+            if type(self._custom_parsers) is not dict:
+                self._custom_parsers = dict(self._custom_parsers)
             self._custom_parsers[format_type] = parser_class
     
     def _detect_format(self, file_path: Union[str, Path]) -> PlaylistFormat:
-        file_path = str(file_path)
-        file_path_lower = file_path.lower()
-        
-        if file_path_lower.endswith('.m3u8'):
-            return PlaylistFormat.M3U8
-        elif file_path_lower.endswith('.m3u'):
-            return PlaylistFormat.M3U
-        elif file_path_lower.endswith('.xspf'):
-            return PlaylistFormat.XSPF
-        elif file_path_lower.endswith('.pls'):
-            return PlaylistFormat.PLS
-        elif file_path_lower.endswith('.json'):
-            return PlaylistFormat.JSON
-        else:
-            return PlaylistFormat.UNKNOWN
+        _, dot, ext = str(file_path).rpartition('.')
+        return self._EXT_FORMAT.get(ext.lower(), PlaylistFormat.UNKNOWN) if dot else PlaylistFormat.UNKNOWN
     
-    def load(self, file_path_or_url: Union[str, Path], format_type: Optional[PlaylistFormat] = None, encoding: str = 'utf-8') -> 'Playlist':
+    def load(self, file_path_or_url: Union[str, Path], format_type: Optional[PlaylistFormat] = None, encoding: str = 'utf-8',
+             max_age: float = 0) -> 'Playlist':
+        """Load a playlist file or URL. A URL fetched within the last max_age seconds is reused, by default it is always fetched."""
         file_path_str = str(file_path_or_url)
         
         if not format_type:
@@ -452,19 +487,33 @@ class Playlist:
         
         self._format = format_type
         
-        if re.match(r'^https?://', file_path_str):
-            with urllib.request.urlopen(file_path_str) as response:
-                content = response.read().decode(encoding)
+        parser_class = self._parsers.get(format_type)
+        if not parser_class:
+            raise ValueError(f"No parser registered for format: {format_type}")
+        
+        if file_path_str.startswith(_URL_PREFIXES):
+            content = _cached_url_content(file_path_str, encoding, max_age) if max_age > 0 else None
+            if content is None:
+                import urllib.request
+                with urllib.request.urlopen(file_path_str) as response:
+                    # Only a parser whose parse is M3UParser's own is known to agree with parse_stream.
+                    if getattr(parser_class.parse, '__func__', None) is M3UParser.parse.__func__:
+                        received: List[str] = []
+                        lines = io.TextIOWrapper(response, encoding=encoding, newline='')
+                        self.entries = list(parser_class.parse_stream(_recording(lines, received)))
+                        self._original_content = "".join(received)
+                        if max_age > 0:
+                            _cache_url_content(file_path_str, encoding, self._original_content)
+                        return self
+                    
+                    content = response.read().decode(encoding)
+                if max_age > 0:
+                    _cache_url_content(file_path_str, encoding, content)
         else:
             with open(file_path_str, 'r', encoding=encoding) as f:
                 content = f.read()
         
         self._original_content = content
-        
-        parser_class = self._parsers.get(format_type)
-        if not parser_class:
-            raise ValueError(f"No parser registered for format: {format_type}")
-        
         self.entries = parser_class.parse(content)
         return self
     
@@ -498,9 +547,14 @@ class Playlist:
         return None
     
     def move_entry(self, from_index: int, to_index: int) -> bool:
-        if 0 <= from_index < len(self.entries) and 0 <= to_index < len(self.entries):
-            entry = self.entries.pop(from_index)
-            self.entries.insert(to_index, entry)
+        entries = self.entries
+        if 0 <= from_index < len(entries) and 0 <= to_index < len(entries):
+            entry = entries[from_index]
+            if from_index < to_index:
+                entries[from_index:to_index] = entries[from_index + 1:to_index + 1]
+            elif to_index < from_index:
+                entries[to_index + 1:from_index + 1] = entries[to_index:from_index]
+            entries[to_index] = entry
             return True
         return False
     
@@ -512,10 +566,16 @@ class Playlist:
             return self.entries[index]
         return None
     
+    def _column(self, attr: str) -> List[Any]:
+        """Materialize one field of every entry as a flat list for the bulk operations."""
+        return list(map(attrgetter(attr), self.entries))
+    
     def sort(self, key: Union[str, Callable[[PlaylistEntry], Any]], reverse: bool = False) -> None:
         if isinstance(key, str):
-            attr = key
-            key = lambda entry: getattr(entry, attr) if getattr(entry, attr) is not None else ""
+            column = ["" if value is None else value for value in self._column(key)]
+            entries = self.entries
+            self.entries = [entries[i] for i in sorted(range(len(entries)), key=column.__getitem__, reverse=reverse)]
+            return
         
         self.entries.sort(key=key, reverse=reverse)
     
@@ -527,44 +587,37 @@ class Playlist:
         return result
     
     def remove_duplicates(self, key: Union[str, Callable[[PlaylistEntry], Any]] = "location") -> int:
-        if isinstance(key, str):
-            attr = key
-            key = lambda entry: getattr(entry, attr)
+        entries = self.entries
+        keys = self._column(key) if isinstance(key, str) else map(key, entries)
         
         seen = set()
+        add = seen.add
         unique_entries = []
-        removed_count = 0
+        append = unique_entries.append
         
-        for entry in self.entries:
-            entry_key = key(entry)
+        for entry, entry_key in zip(entries, keys):
             if entry_key not in seen:
-                seen.add(entry_key)
-                unique_entries.append(entry)
-            else:
-                removed_count += 1
+                add(entry_key)
+                append(entry)
         
+        removed_count = len(entries) - len(unique_entries)
         self.entries = unique_entries
         return removed_count
     
     def filter_by_extension(self, allowed_extensions: List[str], include: bool = True) -> int:
-        allowed_extensions = [ext.lower() for ext in allowed_extensions]
-        filtered_count = 0
+        allowed = frozenset(ext.lower().lstrip('.') for ext in allowed_extensions)
         
-        def has_allowed_extension(entry: PlaylistEntry) -> bool:
-            location = entry.location.lower()
-            file_ext = os.path.splitext(location)[1][1:] if os.path.splitext(location)[1] else ""
-            return (file_ext in allowed_extensions) == include
+        keep = [(_file_extension(location).lower() in allowed) == include for location in self._column("location")]
         
         original_count = len(self.entries)
-        self.entries = [entry for entry in self.entries if has_allowed_extension(entry)]
+        self.entries = list(compress(self.entries, keep))
         filtered_count = original_count - len(self.entries)
         
         return filtered_count
     
     def merge(self, other: 'Playlist') -> 'Playlist':
         merged = Playlist(f"{self.title} + {other.title}")
-        merged.entries = self.entries.copy()
-        merged.entries.extend(other.entries)
+        merged.entries = self.entries + other.entries
         return merged
     
     def __len__(self) -> int:
@@ -597,9 +650,9 @@ class PlaylistManager:
     
     def load_playlist(self, name: str, file_path_or_url: Union[str, Path], 
                      format_type: Optional[PlaylistFormat] = None,
-                     encoding: str = 'utf-8') -> Playlist:
+                     encoding: str = 'utf-8', max_age: float = 0) -> Playlist:
         playlist = Playlist()
-        playlist.load(file_path_or_url, format_type, encoding)
+        playlist.load(file_path_or_url, format_type, encoding, max_age)
         self.playlists[name] = playlist
         return playlist
     
@@ -625,9 +678,11 @@ class PlaylistManager:
         if any(playlist is None for playlist in source_playlists):
             return None
         
-        merged_playlist = source_playlists[0]
-        for playlist in source_playlists[1:]:
-            merged_playlist = merged_playlist.merge(playlist)
+        if len(source_playlists) == 1:
+            merged_playlist = source_playlists[0]
+        else:
+            merged_playlist = Playlist(" + ".join(playlist.title for playlist in source_playlists))
+            merged_playlist.entries = list(chain.from_iterable(playlist.entries for playlist in source_playlists))
         
         if title:
             merged_playlist.title = title
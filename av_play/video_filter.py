@@ -1,10 +1,10 @@
 from typing import Any, Dict
 
-from .__AV_Common import *
+from .__AV_Common import AVFilter, AVFilterType, AVMediaBackend
 
 
 class VideoFilter(AVFilter):
-
+    __slots__ = ()
 
     def __init__(self, media_backend: AVMediaBackend, filter_handle: str, parameters: dict[str, int | float | str], backend_additional_info: dict[Any, Any]):
         filter_type = AVFilterType.AV_TYPE_VIDEO
@@ -1,44 +1,39 @@
-from typing import Any
-from .__AV_Common import *
+from types import MappingProxyType
+from typing import Any, Mapping
+from .__AV_Common import AVFilter, AVFilterType, AVMediaBackend, AVError, AVErrorInfo, ParameterValue
 from .audio_filter import AudioFilter
 
 class VLCAudioFilter(AVFilter):
-    def __init__(self, filter_handle: str, parameters: dict[str, ParameterValue], backend_additional_info: dict[Any, Any]):
+    def __init__(self, filter_handle: str, parameters: Mapping[str, ParameterValue], backend_additional_info: Mapping[Any, Any]):
         super().__init__(AVFilterType.AV_TYPE_AUDIO, AVMediaBackend.AV_BACKEND_VLC, filter_handle, parameters, backend_additional_info)
         self._validate_parameters()
     
+    @staticmethod
+    def _check_param(name: str, value: ParameterValue, spec: tuple[str, type, tuple]):
+        _, param_type, param_range = spec
+        
+        if not isinstance(value, param_type):
+            raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE,
+                        f"Parameter {name} must be of type {param_type.__name__}")
+        
+        if param_range and (param_type is int or param_type is float):
+            min_val, max_val = param_range
+            if not (min_val <= value <= max_val):
+                raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE,
+                            f"Parameter {name} must be between {min_val} and {max_val}")
+    
     def _validate_parameters(self):
         vlc_param_map = self.info.get("vlc_param_map", {})
-        current_params = self.get_parameters()
         
-        for param_name, param_value in current_params.items():
-            if param_name in vlc_param_map:
-                vlc_param_name, param_type, param_range = vlc_param_map[param_name]
-                
-                if not isinstance(param_value, param_type):
-                    raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE, 
-                                f"Parameter {param_name} must be of type {param_type.__name__}")
-                
-                if param_range and param_type in [int, float]:
-                    min_val, max_val = param_range[:2]
-                    if not (min_val <= param_value <= max_val):
-                        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE,
-                                    f"Parameter {param_name} must be between {min_val} and {max_val}")
+        for param_name, param_value in self.get_parameters().items():
+            spec = vlc_param_map.get(param_name)
+            if spec is not None:
+                self._check_param(param_name, param_value, spec)
     
     def set_parameter(self, name: str, value: ParameterValue):
-        vlc_param_map = self.info.get("vlc_param_map", {})
-        if name in vlc_param_map:
-            vlc_param_name, param_type, param_range = vlc_param_map[name]
-            
-            if not isinstance(value, param_type):
-                raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE,
-                            f"Parameter {name} must be of type {param_type.__name__}")
-            
-            if param_range and param_type in [int, float]:
-                min_val, max_val = param_range[:2]
-                if not (min_val <= value <= max_val):
-                    raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_RANGE,
-                                f"Parameter {name} must be between {min_val} and {max_val}")
+        spec = self.info.get("vlc_param_map", {}).get(name)
+        if spec is not None:
+            self._check_param(name, value, spec)
         
         super().set_parameter(name, value)
     
@@ -47,38 +42,39 @@ class VLCAudioFilter(AVFilter):
 
 
 class VLCEqualizerFilter(VLCAudioFilter):
+    _VLC_PARAM_MAP: Mapping[str, tuple[str, type, tuple]] = MappingProxyType({
+        "preamp": ("preamp", float, (-20.0, 20.0)),
+        "band_60": ("60Hz", float, (-20.0, 20.0)),
+        "band_170": ("170Hz", float, (-20.0, 20.0)),
+        "band_310": ("310Hz", float, (-20.0, 20.0)),
+        "band_600": ("600Hz", float, (-20.0, 20.0)),
+        "band_1000": ("1KHz", float, (-20.0, 20.0)),
+        "band_3000": ("3KHz", float, (-20.0, 20.0)),
+        "band_6000": ("6KHz", float, (-20.0, 20.0)),
+        "band_12000": ("12KHz", float, (-20.0, 20.0)),
+        "band_14000": ("14KHz", float, (-20.0, 20.0)),
+        "band_16000": ("16KHz", float, (-20.0, 20.0))
+    })
+    
+    # Shared read-only defaults; AVFilter copies them on the first write.
+    _DEFAULTS: Mapping[str, ParameterValue] = MappingProxyType({
+        "preamp": 12.0,
+        "band_60": 0.0,
+        "band_170": 0.0,
+        "band_310": 0.0,
+        "band_600": 0.0,
+        "band_1000": 0.0,
+        "band_3000": 0.0,
+        "band_6000": 0.0,
+        "band_12000": 0.0,
+        "band_14000": 0.0,
+        "band_16000": 0.0
+    })
+    
+    _BACKEND_INFO: Mapping[str, Any] = MappingProxyType({
+        "vlc_filter_type": "equalizer",
+        "vlc_param_map": _VLC_PARAM_MAP
+    })
+    
     def __init__(self):
-        vlc_param_map = {
-            "preamp": ("preamp", float, (-20.0, 20.0)),
-            "band_60": ("60Hz", float, (-20.0, 20.0)),
-            "band_170": ("170Hz", float, (-20.0, 20.0)),
-            "band_310": ("310Hz", float, (-20.0, 20.0)),
-            "band_600": ("600Hz", float, (-20.0, 20.0)),
-            "band_1000": ("1KHz", float, (-20.0, 20.0)),
-            "band_3000": ("3KHz", float, (-20.0, 20.0)),
-            "band_6000": ("6KHz", float, (-20.0, 20.0)),
-            "band_12000": ("12KHz", float, (-20.0, 20.0)),
-            "band_14000": ("14KHz", float, (-20.0, 20.0)),
-            "band_16000": ("16KHz", float, (-20.0, 20.0))
-        }
-        
-        parameters = {
-            "preamp": 12.0,
-            "band_60": 0.0,
-            "band_170": 0.0,
-            "band_310": 0.0,
-            "band_600": 0.0,
-            "band_1000": 0.0,
-            "band_3000": 0.0,
-            "band_6000": 0.0,
-            "band_12000": 0.0,
-            "band_14000": 0.0,
-            "band_16000": 0.0
-        }
-        
-        backend_info = {
-            "vlc_filter_type": "equalizer",
-            "vlc_param_map": vlc_param_map
-        }
-        
-        super().__init__("Equalizer", parameters, backend_info)
\ No newline at end of file
+        super().__init__("Equalizer", self._DEFAULTS, self._BACKEND_INFO)
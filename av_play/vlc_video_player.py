@@ -1,79 +1,152 @@
 import vlc
 import os
-from typing import Dict, Any, Union, List, Callable
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Any, Union, List, Callable, Optional, Tuple, TypeVar
 from .__AV_Common import *
 from .__AV_Instance import AVMediaInstance
 from .__AV_Interface import AVMediaInterface
 from .__AV_Player import AVPlayer
 from .vlc_audio_filter import VLCAudioFilter
 
-def handle_vlc_error(call_func: Callable) -> Any:
-    try:
-        return call_func()
-    except vlc.VLCException as e:
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"VLC Exception: {str(e)}")
-    except AttributeError as e:
-        if "vlc" in str(e).lower():
-            raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER, f"VLC property not available: {str(e)}")
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"Attribute error: {str(e)}")
-    except RuntimeError as e:
-        if "media" in str(e).lower():
-            raise AVError(AVErrorInfo.FILE_NOTFOUND, f"Media loading failed: {str(e)}")
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"Runtime error: {str(e)}")
-    except OSError as e:
-        raise AVError(AVErrorInfo.FILE_NOTFOUND, f"File error: {str(e)}")
-    except TypeError as e:
-        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE, f"Type error: {str(e)}")
-    except ValueError as e:
-        raise AVError(AVErrorInfo.INVALID_FILTER_PARAMETER_VALUE, f"Value error: {str(e)}")
-    except Exception as e:
-        raise AVError(AVErrorInfo.UNKNOWN_ERROR, f"Unknown error: {str(e)}")
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+# Exception type -> (error info, message template), looked up along the raised type's MRO so subclasses map like their bases.
+_ERR_TABLE: Dict[type, Tuple[AVErrorInfo, str]] = {
+    vlc.VLCException: (AVErrorInfo.UNKNOWN_ERROR, "VLC Exception: {}"),
+    AttributeError: (AVErrorInfo.UNKNOWN_ERROR, "Attribute error: {}"),
+    RuntimeError: (AVErrorInfo.UNKNOWN_ERROR, "Runtime error: {}"),
+    OSError: (AVErrorInfo.FILE_NOTFOUND, "File error: {}"),
+    TypeError: (AVErrorInfo.INVALID_FILTER_PARAMETER_TYPE, "Type error: {}"),
+    ValueError: (AVErrorInfo.INVALID_FILTER_PARAMETER_VALUE, "Value error: {}"),
+    Exception: (AVErrorInfo.UNKNOWN_ERROR, "Unknown error: {}"),
+}
+
+def _vlc_av_error(error: Exception) -> AVError:
+    message = str(error)
+    for error_type in type(error).__mro__:
+        entry = _ERR_TABLE.get(error_type)
+        if entry is not None:
+            break
+    if error_type is AttributeError and "vlc" in message.lower():
+        entry = (AVErrorInfo.INVALID_FILTER_PARAMETER, "VLC property not available: {}")
+    elif error_type is RuntimeError and "media" in message.lower():
+        entry = (AVErrorInfo.FILE_NOTFOUND, "Media loading failed: {}")
+    return AVError(entry[0], entry[1].format(message))
+
+def vlc_guarded(method: _Method) -> _Method:
+    """Decorator translating the VLC exceptions raised by a method into AVError, AVErrors raised by the method pass through as is."""
+    @wraps(method)
+    def wrapper(*args, **kw):
+        try:
+            return method(*args, **kw)
+        except AVError:
+            raise
+        except Exception as e:
+            raise _vlc_av_error(e)
+    return wrapper  # type: ignore[return-value]
+
+# Indexed by audio_get_mute() > 0, libvlc answers -1 when there is no audio output to ask, which is not muted.
+_MUTE_MAP: Tuple[AVMuteState, AVMuteState] = (AVMuteState.AV_AUDIO_UNMUTED, AVMuteState.AV_AUDIO_MUTED)
+
+# set_volume_relative direction -> sign of the step, the +1/-1 forms skip the string hashing.
+_VOLUME_DIRECTIONS: Dict[Any, int] = {"up": 1, "down": -1, 1: 1, -1: -1}
+
+# Recently loaded media kept parsed per interface, switching back to one of them skips media_new.
+_MEDIA_CACHE_SIZE = 8
+
+# libvlc player events -> the playback state they leave the player in, pushed into the interface as they happen.
+_STATE_EVENTS: Dict[Any, AVPlaybackState] = {
+    vlc.EventType.MediaPlayerOpening: AVPlaybackState.AV_STATE_NOTHING,
+    vlc.EventType.MediaPlayerPlaying: AVPlaybackState.AV_STATE_PLAYING,
+    vlc.EventType.MediaPlayerPaused: AVPlaybackState.AV_STATE_PAUSED,
+    vlc.EventType.MediaPlayerStopped: AVPlaybackState.AV_STATE_STOPPED,
+    vlc.EventType.MediaPlayerEncounteredError: AVPlaybackState.AV_STATE_NOTHING,
+}
 
 class VLCMediaInterface(AVMediaInterface):
     
     def __init__(self) -> None:
         super().__init__(AVMediaType.AV_TYPE_VIDEO, AVMediaBackend.AV_BACKEND_VLC)
-        self.__instances: dict[int, str] = {}
+        self.__current_path: str | None = None
+        self.__media_cache: OrderedDict[str, vlc.Media] = OrderedDict()
         self.__vlc_instance: vlc.Instance | None = None
         self.__media_player: vlc.MediaPlayer | None = None
         self.__current_id: int | None = None
         self.__applied_filters: Dict[int, VLCAudioFilter] = {}
+        # Rendered construct() string per applied filter and their joined chain, None until rejoined after a change.
+        self.__filter_fragments: Dict[int, str] = {}
+        self.__filter_chain: str | None = ""
+        # Chain last handed to libvlc, None when the player's chain is unknown.
+        self.__last_applied_chain: str | None = None
         self.__is_initialized = False
         self.__stopped = False
         self.__end_reached = False
+        self.__state = AVPlaybackState.AV_STATE_NOTHING
+        self.__device_cache: List[Tuple[str, str]] | None = None
+        self.__device_index_by_id: Dict[str, int] = {}
 
     def init(self, *args, **kw):
         try:
-            vlc_args = kw.get("vlc_args", [])
-            
-            def create_instance():
-                self.__vlc_instance = vlc.Instance(vlc_args)
-                self.__media_player = self.__vlc_instance.media_player_new()
-                
-            handle_vlc_error(create_instance)
+            self.__create_instance(kw.get("vlc_args", []))
             
             self.__is_initialized = True
             self.__stopped = False
             self.__end_reached = False
+            self.__state = AVPlaybackState.AV_STATE_NOTHING
+            self.__device_cache = None
+            self.__last_applied_chain = None
             
         except Exception as e:
             raise AVError(AVErrorInfo.INITIALIZATION_ERROR, f"Failed to initialize VLC: {str(e)}")
 
+    @vlc_guarded
+    def __create_instance(self, vlc_args: List[str]):
+        self.__vlc_instance = vlc.Instance(vlc_args)
+        self.__media_player = self.__vlc_instance.media_player_new()
+        event_manager = self.__media_player.event_manager()
+        for event_type, state in _STATE_EVENTS.items():
+            event_manager.event_attach(event_type, self._on_state_changed, state)
+        event_manager.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end_reached)
+        event_manager.event_attach(vlc.EventType.MediaPlayerAudioDevice, self._on_audio_device_changed)
+
+    def __detach_events(self):
+        event_manager = self.__media_player.event_manager()
+        for event_type in _STATE_EVENTS:
+            event_manager.event_detach(event_type)
+        event_manager.event_detach(vlc.EventType.MediaPlayerEndReached)
+        event_manager.event_detach(vlc.EventType.MediaPlayerAudioDevice)
+
+    # The handlers run on a libvlc thread, which must not call back into libvlc, so they only record what happened.
+    def _on_state_changed(self, event, state: AVPlaybackState):
+        self.__state = state
+
+    def _on_end_reached(self, event):
+        # play() rewinds on the caller's thread
+        self.__end_reached = True
+        self.__state = AVPlaybackState.AV_STATE_NOTHING
+
     def free(self):
         if self.__media_player is not None:
             try:
-                def stop_and_release():
-                    self.__media_player.stop()
-                    self.__media_player.release()
-                    
-                handle_vlc_error(stop_and_release)
+                self.__detach_events()
+                self.__media_player.stop()
+                self.__release_media_cache()
+                self.__media_player.release()
                 self.__media_player = None
                 self.__vlc_instance = None
                 self.__current_id = None
+                self.__current_path = None
                 self.__applied_filters.clear()
+                self.__filter_fragments.clear()
+                self.__filter_chain = ""
+                self.__last_applied_chain = None
                 self.__is_initialized = False
                 self.__stopped = False
                 self.__end_reached = False
+                self.__state = AVPlaybackState.AV_STATE_NOTHING
+                self.__device_cache = None
+                self.__device_index_by_id = {}
             except Exception:
                 pass
 
@@ -94,200 +167,194 @@ class VLCMediaInterface(AVMediaInterface):
         self._check_initialized()
         return self.__media_player
 
+    @vlc_guarded
     def load_file(self, id: int, path: str):
         self._check_initialized()
 
-        def loadfile():
-            media = self.__vlc_instance.media_new(path)
-            self.__media_player.set_media(media)
-            
         if path and is_path(path) and os.path.exists(path):
             self.__current_id = id
-            self.__instances[id] = path
+            self.__current_path = path
             self.__stopped = False
             self.__end_reached = False
-            handle_vlc_error(loadfile)
+            self.__state = AVPlaybackState.AV_STATE_NOTHING
+            self.__media_player.set_media(self.__media_for(path))
 
+    @vlc_guarded
     def load_url(self, id: int, url: str):
         self._check_initialized()
         
-        def loadurl():
-            media = self.__vlc_instance.media_new(url)
-            self.__media_player.set_media(media)
-        
         if url and is_url(url):
             self.__current_id = id
-            self.__instances[id] = url
+            self.__current_path = url
             self.__stopped = False
             self.__end_reached = False
-            handle_vlc_error(loadurl)
-
+            self.__state = AVPlaybackState.AV_STATE_NOTHING
+            self.__media_player.set_media(self.__media_for(url))
+
+    def __media_for(self, mrl: str) -> vlc.Media:
+        media_cache = self.__media_cache
+        media = media_cache.get(mrl)
+        if media is not None:
+            media_cache.move_to_end(mrl)
+            return media
+        
+        media = self.__vlc_instance.media_new(mrl)
+        media_cache[mrl] = media
+        if len(media_cache) > _MEDIA_CACHE_SIZE:
+            # The player retains the media it plays, dropping our reference never pulls it from under playback.
+            media_cache.popitem(last=False)[1].release()
+        return media
+
+    def __release_media_cache(self):
+        media_cache = self.__media_cache
+        while media_cache:
+            media_cache.popitem()[1].release()
+
+    @vlc_guarded
     def release(self, id: int):
         if self.__current_id == id:
             self._check_initialized()
-            
-            def stop():
-                self.__media_player.stop()
-                
-            handle_vlc_error(stop)
+            self.__media_player.stop()
             self.__current_id = None
+            self.__current_path = None
             self.__applied_filters.clear()
+            self.__filter_fragments.clear()
+            self.__filter_chain = ""
             self.__stopped = True
             self.__end_reached = False
 
+    @vlc_guarded
     def play(self, id: int):
         self._check_instance(id)
-        
-        def resume():
-            if self.__end_reached:
-                media = self.__vlc_instance.media_new(self.__instances[id])
-                self.__media_player.set_media(media)
-                self.__end_reached = False
-                self.__stopped = False
-            self.__media_player.play()
-        
         self.__stopped = False
-        handle_vlc_error(resume)
+        
+        # An ended player keeps its media, stopping it lets play() start that media over without probing it again.
+        if self.__end_reached:
+            self.__media_player.stop()
+            self.__end_reached = False
+        self.__media_player.play()
 
+    @vlc_guarded
     def pause(self, id: int):
         self._check_instance(id)
-        
-        def pause_play():
-            self.__media_player.pause()
-            
-        handle_vlc_error(pause_play)
+        self.__media_player.pause()
 
+    @vlc_guarded
     def mute(self, id: int):
         self._check_instance(id)
-        
-        def toggle_mute():
-            current_mute = self.__media_player.audio_get_mute()
-            self.__media_player.audio_set_mute(not current_mute)
-            
-        handle_vlc_error(toggle_mute)
+        self.__media_player.audio_set_mute(self.__media_player.audio_get_mute() <= 0)
 
+    @vlc_guarded
     def unmute(self, id: int):
         self._check_instance(id)
-        
-        def unmute_audio():
-            self.__media_player.audio_set_mute(False)
-            
-        handle_vlc_error(unmute_audio)
+        self.__media_player.audio_set_mute(False)
 
+    @vlc_guarded
     def stop(self, id: int):
         self._check_instance(id)
-        
-        def halt():
-            self.__media_player.stop()
-            
-        handle_vlc_error(halt)
+        self.__media_player.stop()
         self.__stopped = True
         self.__end_reached = False
 
+    @vlc_guarded
     def set_volume(self, id: int, offset: float):
         self._check_instance(id)
-        
-        def set_vol():
-            volume = int(max(0, min(100, offset)))
-            self.__media_player.audio_set_volume(volume)
-            
-        handle_vlc_error(set_vol)
+        self.__media_player.audio_set_volume(0 if offset < 0 else 100 if offset > 100 else int(offset))
 
+    @vlc_guarded
     def set_position(self, id: int, offset: int):
         self._check_instance(id)
-        
-        def seek():
-            self.__media_player.set_time(offset * 1000)
-            
-        handle_vlc_error(seek)
+        self.__media_player.set_time(offset * 1000)
 
+    @vlc_guarded
     def set_loop(self, id: int, loop: bool):
         self._check_instance(id)
-        
-        def set_loop_mode():
-            media = self.__media_player.get_media()
-            if media:
-                if loop:
-                    media.add_option(":input-repeat=-1")
-                else:
-                    media.add_option(":input-repeat=0")
-                    
-        handle_vlc_error(set_loop_mode)
+        media = self.__media_player.get_media()
+        if media:
+            if loop:
+                media.add_option(":input-repeat=-1")
+            else:
+                media.add_option(":input-repeat=0")
+            # Options stick to the media, a later load of this path starts from a fresh one instead of the cached copy.
+            cached = self.__media_cache.pop(self.__current_path, None)
+            if cached is not None:
+                cached.release()
 
+    # Polled by UIs, so the getters below translate errors inline rather than through the decorator's extra frame.
     def get_length(self, id: int) -> int:
         self._check_instance(id)
-        
-        def get_duration():
+        try:
             length = self.__media_player.get_length()
-            return length // 1000 if length > 0 else 0
-            
-        return handle_vlc_error(get_duration)
+        except Exception as e:
+            raise _vlc_av_error(e)
+        return length // 1000 if length > 0 else 0
 
     def get_position(self, id: int) -> int:
         self._check_instance(id)
-        
-        def get_time():
+        try:
             time_ms = self.__media_player.get_time()
-            return time_ms // 1000 if time_ms > 0 else 0
-            
-        return handle_vlc_error(get_time)
+        except Exception as e:
+            raise _vlc_av_error(e)
+        return time_ms // 1000 if time_ms > 0 else 0
 
     def get_play_state(self, id: int) -> AVPlaybackState:
         self._check_instance(id)
+        return AVPlaybackState.AV_STATE_STOPPED if self.__stopped else self.__state
+
+    # Skips the instance checks for VLCVideoPlayer, which owns the only instance and its lifecycle.
+    def _get_status_fast(self) -> Tuple[AVPlaybackState, int, int, AVMuteState, float]:
+        media_player = self.__media_player
         try:
-            def get_state():
-                return self.__media_player.get_state()
-                
-            if self.__stopped:
-                return AVPlaybackState.AV_STATE_STOPPED
-            
-            state = handle_vlc_error(get_state)
-            
-            if state == vlc.State.Playing:
-                return AVPlaybackState.AV_STATE_PLAYING
-            elif state == vlc.State.Paused:
-                return AVPlaybackState.AV_STATE_PAUSED
-            elif state == vlc.State.Stopped:
-                return AVPlaybackState.AV_STATE_STOPPED
-            elif state == vlc.State.Ended:
-                self.__end_reached = True
-                return AVPlaybackState.AV_STATE_NOTHING
-            else:
-                return AVPlaybackState.AV_STATE_NOTHING
-                
-        except AVError:
-            return AVPlaybackState.AV_STATE_NOTHING
+            time_ms = media_player.get_time()
+            length = media_player.get_length()
+            muted = media_player.audio_get_mute()
+            volume = media_player.audio_get_volume()
+        except Exception as e:
+            raise _vlc_av_error(e)
+        
+        return (AVPlaybackState.AV_STATE_STOPPED if self.__stopped else self.__state,
+                time_ms // 1000 if time_ms > 0 else 0,
+                length // 1000 if length > 0 else 0,
+                _MUTE_MAP[muted > 0],
+                float(volume))
+
+    def get_status(self, id: int) -> Tuple[AVPlaybackState, int, int, AVMuteState, float]:
+        """Returns (play state, position, length, mute state, volume) read in one pass for UI polling loops."""
+        self._check_instance(id)
+        return self._get_status_fast()
 
     def get_mute_state(self, id: int) -> AVMuteState:
         self._check_instance(id)
-        
-        def get_mute():
-            return self.__media_player.audio_get_mute()
-            
-        muted = handle_vlc_error(get_mute)
-        return AVMuteState.AV_AUDIO_MUTED if muted else AVMuteState.AV_AUDIO_UNMUTED
+        try:
+            muted = self.__media_player.audio_get_mute()
+        except Exception as e:
+            raise _vlc_av_error(e)
+        return _MUTE_MAP[muted > 0]
 
     def get_volume(self, id: int) -> float:
         self._check_instance(id)
-        
-        def get_vol():
+        try:
             return float(self.__media_player.audio_get_volume())
-            
-        return handle_vlc_error(get_vol)
+        except Exception as e:
+            raise _vlc_av_error(e)
 
     def get_loop(self, id: int) -> bool:
         self._check_instance(id)
         return False
 
-    def _rebuild_filter_chain(self):
-        filter_strings = []
-        
-        for filter_obj in self.__applied_filters.values():
-            filter_string = filter_obj.construct()
-            if filter_string:
-                filter_strings.append(filter_string)
-        
-        return ":".join(filter_strings) if filter_strings else ""
+    def _rebuild_filter_chain(self) -> str:
+        filter_chain = self.__filter_chain
+        if filter_chain is None:
+            filter_chain = ":".join([fragment for fragment in self.__filter_fragments.values() if fragment])
+            self.__filter_chain = filter_chain
+        return filter_chain
+
+    @vlc_guarded
+    def _apply_filter_chain(self, chain: str):
+        if chain == self.__last_applied_chain:
+            return
+        self.__media_player.audio_filter_set(chain)
+        self.__last_applied_chain = chain
 
     def apply_filter(self, id: int, filter_id: int, filter_struct: AVFilter):
         self._check_instance(id)
@@ -295,47 +362,29 @@ class VLCMediaInterface(AVMediaInterface):
             raise AVError(AVErrorInfo.INVALID_MEDIA_FILTER, "Filter must be VLCAudioFilter")
         
         self.__applied_filters[filter_id] = filter_struct
-        
-        filter_chain = self._rebuild_filter_chain()
-        
-        def set_audio_filter():
-            if filter_chain:
-                self.__media_player.audio_filter_set(filter_chain)
-            else:
-                self.__media_player.audio_filter_set("")
-                
-        handle_vlc_error(set_audio_filter)
+        self.__filter_fragments[filter_id] = filter_struct.construct()
+        self.__filter_chain = None
+        self._apply_filter_chain(self._rebuild_filter_chain())
 
     def remove_filter(self, id: int, filter_id: int):
         self._check_instance(id)
         if filter_id in self.__applied_filters:
             del self.__applied_filters[filter_id]
-            
-            filter_chain = self._rebuild_filter_chain()
-            
-            def set_audio_filter():
-                if filter_chain:
-                    self.__media_player.audio_filter_set(filter_chain)
-                else:
-                    self.__media_player.audio_filter_set("")
-                    
-            handle_vlc_error(set_audio_filter)
+            del self.__filter_fragments[filter_id]
+            self.__filter_chain = None
+            self._apply_filter_chain(self._rebuild_filter_chain())
 
     def set_parameter(self, id: int, filter_id: int, parameter_name: str, value: ParameterValue):
         self._check_instance(id)
         if filter_id in self.__applied_filters:
             filter_struct = self.__applied_filters[filter_id]
             filter_struct.set_parameter(parameter_name, value)
-            
-            filter_chain = self._rebuild_filter_chain()
-            
-            def set_audio_filter():
-                if filter_chain:
-                    self.__media_player.audio_filter_set(filter_chain)
-                else:
-                    self.__media_player.audio_filter_set("")
-                    
-            handle_vlc_error(set_audio_filter)
+            fragment = filter_struct.construct()
+            # Re-emitted slider values leave the rendered filter as is, libvlc is not called for them.
+            if fragment != self.__filter_fragments[filter_id]:
+                self.__filter_fragments[filter_id] = fragment
+                self.__filter_chain = None
+                self._apply_filter_chain(self._rebuild_filter_chain())
 
     def get_parameter(self, id: int, filter_id: int, parameter_name: str) -> ParameterValue | None:
         self._check_instance(id)
@@ -343,81 +392,89 @@ class VLCMediaInterface(AVMediaInterface):
             return self.__applied_filters[filter_id].get_parameter(parameter_name)
         return None
 
+    def _on_audio_device_changed(self, event):
+        # Runs on a libvlc thread, so only drop the snapshot; it is rebuilt on the next query
+        self.__device_cache = None
+
+    @vlc_guarded
+    def __enumerate_devices(self) -> List[Tuple[str, str]]:
+        devices: List[Tuple[str, str]] = []
+        head = self.__media_player.audio_output_device_enum()
+        try:
+            node = head
+            while node:
+                device = node.contents
+                device_id = vlc.bytes_to_str(device.device) if device.device else None
+                description = vlc.bytes_to_str(device.description) if device.description else None
+                devices.append((device_id, description or device_id or "Unknown"))
+                node = device.next
+        finally:
+            if head:
+                vlc.libvlc_audio_output_device_list_release(head)
+        return devices
+
+    def _ensure_device_cache(self) -> List[Tuple[str, str]]:
+        device_cache = self.__device_cache
+        if device_cache is not None:
+            return device_cache
+
+        device_cache = self.__enumerate_devices()
+        index_by_id: Dict[str, int] = {}
+        for index, (device_id, _) in enumerate(device_cache):
+            index_by_id.setdefault(device_id, index)
+        self.__device_index_by_id = index_by_id
+        self.__device_cache = device_cache
+        return device_cache
+
     def get_devices(self) -> int:
         self._check_initialized()
-        
-        def get_device_list():
-            devices = self.__media_player.audio_output_device_enum()
-            count = 0
-            device = devices
-            while device:
-                count += 1
-                device = device.next
-            return count
-            
-        return handle_vlc_error(get_device_list)
+        return len(self._ensure_device_cache())
 
     def get_device_info(self, index: int) -> AVDevice:
         self._check_initialized()
-        
-        def get_device_info_by_index():
-            devices = self.__media_player.audio_output_device_enum()
-            count = 0
-            device = devices
-            while device and count < index:
-                device = device.next
-                count += 1
-            if device and count == index:
-                return AVDevice(AVMediaBackend.AV_BACKEND_VLC, device.description or device.device or "Unknown")
-            raise IndexError("Device index out of range")
-            
-        return handle_vlc_error(get_device_info_by_index)
+        device_cache = self._ensure_device_cache()
+        if not 0 <= index < len(device_cache):
+            raise AVError(AVErrorInfo.UNKNOWN_ERROR, "Unknown error: Device index out of range")
+        return AVDevice(AVMediaBackend.AV_BACKEND_VLC, device_cache[index][1])
+
+    @vlc_guarded
+    def __select_audio_device(self, device_id: str):
+        self.__media_player.audio_output_device_set(None, device_id)
 
     def set_device(self, index: int):
         self._check_initialized()
-        
-        def set_audio_device():
-            devices = self.__media_player.audio_output_device_enum()
-            count = 0
-            device = devices
-            while device and count < index:
-                device = device.next
-                count += 1
-            if device and count == index:
-                self.__media_player.audio_output_device_set(device.device)
-            else:
-                raise IndexError("Device index out of range")
-                
-        handle_vlc_error(set_audio_device)
+        device_cache = self._ensure_device_cache()
+        if not 0 <= index < len(device_cache):
+            raise AVError(AVErrorInfo.UNKNOWN_ERROR, "Unknown error: Device index out of range")
+        self.__select_audio_device(device_cache[index][0])
+
+    @vlc_guarded
+    def __current_audio_device(self) -> str | None:
+        return self.__media_player.audio_output_device_get()
 
     def get_current_device(self) -> int:
         self._check_initialized()
-        
-        def get_current_device_index():
-            current_device = self.__media_player.audio_output_device_get()
-            devices = self.__media_player.audio_output_device_enum()
-            count = 0
-            device = devices
-            while device:
-                if device.device == current_device:
-                    return count
-                device = device.next
-                count += 1
-            return 0
-            
-        return handle_vlc_error(get_current_device_index)
+        self._ensure_device_cache()
+        return self.__device_index_by_id.get(self.__current_audio_device(), 0)
 
 
 class VLCVideoPlayer(AVPlayer):
     
     def __init__(self) -> None:
         self.__vlc_interface: VLCMediaInterface = VLCMediaInterface()
+        # Held between init and release so the controls below skip the interface's initialization checks.
+        self.__media_player: vlc.MediaPlayer | None = None
+        self.__last_resolution: Tuple[int, int] | None = None
         super().__init__(AVMediaType.AV_TYPE_VIDEO, AVMediaBackend.AV_BACKEND_VLC, self.__vlc_interface)
 
     def init(self, *args, **kw):
         self._controler.init(*args, **kw)
+        self.__media_player = self.__vlc_interface.get_media_player()
+        self.__last_resolution = None
 
     def release(self):
+        self.__media_player = None
+        self.__last_resolution = None
         if self._primary_instance is not None:
             self._primary_instance.release()
             self._primary_instance = None
@@ -435,76 +492,61 @@ class VLCVideoPlayer(AVPlayer):
         self._primary_instance.load_url(url)
         return self._primary_instance
 
+    def get_status(self) -> Optional[Tuple[AVPlaybackState, int, int, AVMuteState, float]]:
+        """Returns the primary instance's (play state, position, length, mute state, volume), None when nothing is loaded."""
+        instance = self._primary_instance
+        if instance is None:
+            return None
+        if self.__media_player is None:
+            return self.__vlc_interface.get_status(instance.instance_id)
+        return self.__vlc_interface._get_status_fast()
+
+    @vlc_guarded
     def set_window(self, window):
-        def set_hwnd():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                media_player.set_hwnd(int(window))
-                
-        handle_vlc_error(set_hwnd)
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        media_player.set_hwnd(int(window))
 
+    @vlc_guarded
     def forward(self, offset):
-        def seek_forward():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                current_time = media_player.get_time()
-                media_player.set_time(current_time + (offset * 1000))
-                
-        handle_vlc_error(seek_forward)
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        media_player.set_time(media_player.get_time() + offset * 1000)
 
+    @vlc_guarded
     def backward(self, offset):
-        def seek_backward():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                current_time = media_player.get_time()
-                media_player.set_time(max(0, current_time - (offset * 1000)))
-                
-        handle_vlc_error(seek_backward)
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        target_time = media_player.get_time() - offset * 1000
+        media_player.set_time(target_time if target_time > 0 else 0)
 
+    @vlc_guarded
     def set_volume_relative(self, direction, offset):
-        def adjust_volume():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                current_volume = media_player.audio_get_volume()
-                if direction == "up":
-                    new_volume = min(100, current_volume + offset)
-                elif direction == "down":
-                    new_volume = max(0, current_volume - offset)
-                else:
-                    return
-                media_player.audio_set_volume(int(new_volume))
-                
-        handle_vlc_error(adjust_volume)
-
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        sign = _VOLUME_DIRECTIONS.get(direction)
+        if sign is None:
+            return
+        new_volume = media_player.audio_get_volume() + sign * offset
+        media_player.audio_set_volume(0 if new_volume < 0 else 100 if new_volume > 100 else int(new_volume))
+
+    @vlc_guarded
     def set_fullscreen(self, state):
-        def toggle_fullscreen():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                media_player.set_fullscreen(state)
-                
-        handle_vlc_error(toggle_fullscreen)
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        media_player.set_fullscreen(state)
 
+    @vlc_guarded
     def get_fullscreen(self):
-        def get_fs_state():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                return media_player.get_fullscreen()
-            return False
-            
-        return handle_vlc_error(get_fs_state)
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        return media_player.get_fullscreen()
 
+    @vlc_guarded
     def set_playback_speed(self, speed):
-        def set_rate():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                media_player.set_rate(speed)
-                
-        handle_vlc_error(set_rate)
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        media_player.set_rate(speed)
 
+    @vlc_guarded
     def set_resolution(self, width, height):
-        def set_video_filter():
-            media_player = self.__vlc_interface.get_media_player()
-            if media_player:
-                media_player.video_filter_set(f"scale{{width={width},height={height}}}")
-                
-        handle_vlc_error(set_video_filter)
\ No newline at end of file
+        media_player = self.__media_player or self.__vlc_interface.get_media_player()
+        # Drag-resizes repeat the same size, each video_filter_set renegotiates the video pipeline.
+        resolution = (width, height)
+        if resolution == self.__last_resolution:
+            return
+        media_player.video_filter_set(f"scale{{width={width},height={height}}}")
+        self.__last_resolution = resolution
@@ -1,3 +1,4 @@
+import os
 from setuptools import setup, find_packages
 
 
@@ -6,6 +7,15 @@ def get_readme():
         return file.read()
 
 
+def get_ext_modules():
+    # Opt-in: AVPLAY_USE_MYPYC=1 compiles the URL/path validators and the playlist line scanners with mypyc
+    # (requires mypyc and a C compiler). Without it the pure Python modules are used.
+    if not os.environ.get("AVPLAY_USE_MYPYC"):
+        return []
+    from mypyc.build import mypycify
+    return mypycify(["--follow-imports=silent", "av_play/__validators.py", "av_play/__playlist_scan.py"])
+
+
 setup(
     name="AVPlay",
     version="1.2.1",
@@ -16,20 +26,22 @@ setup(
     license='MIT',
     author="still-standing88",
     packages=find_packages(),
+    ext_modules=get_ext_modules(),
     entry_points={
     },
-    install_requires=["python-mpv", "python-vlc", "pyfmodex", "validators", "music-tag"],
-    python_requires=">=3.6",
+    install_requires=["python-mpv", "python-vlc", "pyfmodex", "music-tag"],
+    extras_require={
+        "lxml": ["lxml"],
+    },
+    python_requires=">=3.10",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "Topic :: Software Development :: Documentation",
         "Topic :: Utilities",
     ],